@@ -0,0 +1,137 @@
+"""
+Benchmark the commit backends of GitCommitFetcher on a large local repository.
+
+Without --repo, a repository with --commits commits is generated with git fast-import in a
+temporary directory; the messages have a subject, a body, ticket numbers and non-ASCII text,
+and a side branch is merged every 50 commits. Each backend fetches the whole history and a
+few windows of it through the processor, the best time of a few runs is reported, and the
+processed commits of every backend are compared with those of the GitPython backend. With
+--fields, the commit metadata is collected too. The ranges are run once more with the --paths
+filter, whose selection must not depend on the fields, and compared with git rev-list --count.
+
+Usage:
+    PYTHONPATH=src python scripts/benchmarks/bench_git_backends.py --commits 100000
+    PYTHONPATH=src python scripts/benchmarks/bench_git_backends.py --repo ~/src/linux
+    PYTHONPATH=src python scripts/benchmarks/bench_git_backends.py --commits 5000 --fields hash,author,date,files,stats
+    PYTHONPATH=src python scripts/benchmarks/bench_git_backends.py --commits 5000 --fields files --paths src/module3
+"""
+import argparse
+import random
+import subprocess
+import tempfile
+import time
+
+from spindle.fetchers import GitCommitFetcher
+from spindle.processors import GitCommitProcessor
+
+
+def generate_repository(path: str, commits: int) -> None:
+    """
+    Create a repository of generated commits, merging a one-commit side branch every 50 commits.
+
+    :param path: str - Directory of the new repository.
+    :param commits: int - Number of commits.
+    """
+    subprocess.run(["git", "init", "-q", "-b", "main", path], check=True)
+    rng = random.Random(3)
+    authors = ["Alice Martin <alice@example.com>", "Bob Nguyễn <bob@example.com>", "Carol Smith <carol@example.com>"]
+    words = "fix add update remove refactor parser cache handler fetcher config docs tests résumé".split()
+    lines = []
+    for index in range(1, commits + 1):
+        subject = f"{rng.choice(words)} {' '.join(rng.choices(words, k=rng.randint(2, 6)))} PROJ-{rng.randint(1, 999)}"
+        body = "\n".join(" ".join(rng.choices(words, k=rng.randint(5, 12))) for _ in range(rng.randint(0, 4)))
+        message = f"{subject}\n\n{body}\n" if body else f"{subject}\n"
+        data = f"line {index}\n"
+        author = rng.choice(authors)
+        timestamp = 1500000000 + index * 600
+        lines.append(f"commit refs/heads/main\nmark :{index}\n"
+                     f"author {author} {timestamp} +0000\ncommitter {author} {timestamp} +0000\n"
+                     f"data {len(message.encode('utf-8'))}\n{message}")
+        if index > 1:
+            lines.append(f"from :{index - 1}\n")
+        if index % 50 == 25:
+            # The side branch forks here and is merged 25 commits later
+            side = commits + index
+            lines.append(f"M 644 inline src/module{index % 40}/file{index % 9}.py\ndata {len(data)}\n{data}\n")
+            lines.append(f"commit refs/heads/side\nmark :{side}\n"
+                         f"author {author} {timestamp} +0000\ncommitter {author} {timestamp} +0000\n"
+                         f"data {len(message.encode('utf-8'))}\n{message}from :{index}\n"
+                         f"M 644 inline src/side/file{index % 9}.py\ndata {len(data)}\n{data}\n")
+            continue
+        if index % 50 == 0:
+            # fast-import takes the tree of the first parent, so the file of the side branch is added again
+            side_data = f"line {index - 25}\n"
+            lines.append(f"merge :{commits + index - 25}\n"
+                         f"M 644 inline src/side/file{(index - 25) % 9}.py\ndata {len(side_data)}\n{side_data}\n")
+        lines.append(f"M 644 inline src/module{index % 40}/file{index % 9}.py\ndata {len(data)}\n{data}\n")
+    subprocess.run(["git", "fast-import", "--quiet"], cwd=path, input="".join(lines).encode("utf-8"), check=True)
+    subprocess.run(["git", "reset", "-q", "--hard", "main"], cwd=path, check=True)
+
+
+def measure(fetcher: GitCommitFetcher, repo: str, start, end, repeat: int, **filters) -> tuple:
+    best, commits = float("inf"), None
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        commits = fetcher.fetch(repo, start, end, **filters)["commits"]
+        best = min(best, time.perf_counter() - begin)
+    return best, commits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repo", help="Existing repository to read instead of a generated one")
+    parser.add_argument("--commits", type=int, default=50000, help="Number of commits of the generated repository")
+    parser.add_argument("--fields", default="", help="Comma-separated commit fields to collect")
+    parser.add_argument("--paths", default="src/side",
+                        help="Comma-separated paths of the filtered run, empty to skip it")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per backend and range, the best one is reported")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        repo = args.repo
+        if not repo:
+            begin = time.perf_counter()
+            generate_repository(directory, args.commits)
+            repo = directory
+            print(f"generated {args.commits} commits in {time.perf_counter() - begin:.1f} s")
+
+        fields = [field.strip() for field in args.fields.split(",") if field.strip()]
+        processor = GitCommitProcessor(extract_ticket_number=True, fields=fields)
+        total = GitCommitFetcher(processor).get_commit_count(repo)
+        print(f"repository: {repo}, {total} commits, fields: {', '.join(fields) or 'none'}")
+        compare_backends(processor, repo, total, args.repeat)
+
+        paths = [path.strip() for path in args.paths.split(",") if path.strip()]
+        if paths:
+            total = GitCommitFetcher(processor).get_commit_count(repo, paths=paths)
+            print(f"paths: {', '.join(paths)}, {total} commits")
+            compare_backends(processor, repo, total, args.repeat, paths=paths)
+
+
+def compare_backends(processor: GitCommitProcessor, repo: str, total: int, repeat: int, **filters) -> None:
+    """
+    Print the time of every backend over a few ranges, and whether its commits match those of GitPython.
+
+    :param processor: GitCommitProcessor - The processor of the fetched commits.
+    :param repo: str - Path to the repository.
+    :param total: int - Number of commits passing the filters, as counted by git rev-list.
+    :param repeat: int - Runs per backend and range, the best one is reported.
+    """
+    ranges = [(None, None), (0, 100), (total // 2, total // 2 + 100), (-100, None)]
+    for start, end in ranges:
+        reference_time, reference = measure(GitCommitFetcher(processor, backend="gitpython"), repo, start, end,
+                                             repeat, **filters)
+        line = f"range {str(start):>7}:{str(end):<7} {len(reference):>7} commits  gitpython {reference_time:8.3f} s"
+        if (start, end) == (None, None) and len(reference) != total:
+            line += f"  (count {total}: DIFFERENT)"
+        for backend in GitCommitFetcher.BACKENDS:
+            if backend == "gitpython":
+                continue
+            elapsed, commits = measure(GitCommitFetcher(processor, backend=backend), repo, start, end, repeat,
+                                       **filters)
+            status = "identical" if commits == reference else "DIFFERENT"
+            line += f"  {backend} {elapsed:8.3f} s  x{reference_time / elapsed:5.1f}  {status}"
+        print(line)
+
+if __name__ == "__main__":
+    main()
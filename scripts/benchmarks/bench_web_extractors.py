@@ -0,0 +1,103 @@
+"""
+Benchmark the web extraction backends over a corpus of saved HTML pages.
+
+Every page of the corpus is extracted with each backend and the best time of a few runs is
+reported, together with the throughput. The output of every backend is compared page by page
+with the first (reference) backend; the number of identical pages and a similarity ratio are
+printed, and the pages that differ most can be diffed with --show-diffs.
+
+Usage:
+    PYTHONPATH=src python scripts/benchmarks/bench_web_extractors.py --corpus saved_pages/ --methods custom_bs4,custom
+"""
+import argparse
+import difflib
+import os
+import time
+
+from spindle.processors.web_extractors import extractor_registry
+
+
+def load_corpus(source: str) -> dict:
+    """
+    Read the saved pages of a directory tree.
+
+    :param source: str - Directory with .html/.htm files.
+    :return: dict - The page contents by path.
+    """
+    pages = {}
+    for root, _, files in os.walk(source):
+        for name in sorted(files):
+            if name.endswith(('.html', '.htm')):
+                path = os.path.join(root, name)
+                with open(path, encoding="utf-8", errors="replace") as f:
+                    pages[path] = f.read()
+    return pages
+
+
+def run(method: str, pages: dict, repeat: int) -> tuple:
+    """
+    Extract every page with a backend.
+
+    :param method: str - The extraction method.
+    :param pages: dict - The page contents by path.
+    :param repeat: int - Number of runs, the best one is reported.
+    :return: tuple - The best wall time and the outputs by path. A page that fails maps to its error.
+    """
+    extractor = extractor_registry.get(method)
+    best, outputs = float("inf"), {}
+    for _ in range(repeat):
+        outputs = {}
+        start = time.perf_counter()
+        for path, content in pages.items():
+            try:
+                outputs[path] = extractor(content)
+            except Exception as e:
+                outputs[path] = f"<error: {type(e).__name__}: {e}>"
+        best = min(best, time.perf_counter() - start)
+    return best, outputs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", required=True, help="Directory of saved HTML pages")
+    parser.add_argument("--methods", default="custom_bs4,custom",
+                        help="Comma-separated extraction methods, the first one is the parity reference")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per method, the best one is reported")
+    parser.add_argument("--show-diffs", type=int, default=0, help="Print a diff for this many of the most different pages")
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus)
+    if not pages:
+        raise SystemExit(f"No .html files in {args.corpus}")
+    size_mb = sum(len(content.encode("utf-8")) for content in pages.values()) / (1024 * 1024)
+    print(f"corpus: {len(pages)} pages, {size_mb:.1f} MB")
+
+    methods = [method.strip() for method in args.methods.split(",") if method.strip()]
+    reference = None
+    for method in methods:
+        if not extractor_registry.is_available(method):
+            print(f"{method:>16}: not available")
+            continue
+        elapsed, outputs = run(method, pages, args.repeat)
+        line = f"{method:>16}: {elapsed:7.3f} s  {size_mb / elapsed:6.1f} MB/s  {len(pages) / elapsed:7.1f} pages/s"
+        if reference is None:
+            reference = (method, elapsed, outputs)
+            print(line + "  (reference)")
+            continue
+
+        ratios = {path: difflib.SequenceMatcher(None, reference[2][path], output, autojunk=False).quick_ratio()
+                  if reference[2][path] != output else 1.0 for path, output in outputs.items()}
+        identical = sum(1 for ratio in ratios.values() if ratio == 1.0)
+        mean = sum(ratios.values()) / len(ratios)
+        print(line + f"  x{reference[1] / elapsed:.1f}  identical {identical}/{len(pages)}  similarity {mean:.4f}")
+
+        for path in sorted(ratios, key=ratios.get)[:args.show_diffs]:
+            if ratios[path] == 1.0:
+                break
+            print(f"\n--- {reference[0]} / +++ {method}: {path} (similarity {ratios[path]:.4f})")
+            diff = difflib.unified_diff(reference[2][path].splitlines(), outputs[path].splitlines(), lineterm="", n=1)
+            print("\n".join(list(diff)[2:40]))
+
+
+if __name__ == "__main__":
+    main()
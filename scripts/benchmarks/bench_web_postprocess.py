@@ -0,0 +1,150 @@
+"""
+Microbenchmark the line post-processing of WebProcessor.
+
+Compares the former per-line loop (strip, re.sub and a URL pattern compiled on every call)
+with the batched normalization of WebProcessor._main_process, for each combination of
+options, on a generated document or on the text extracted from a corpus of saved pages.
+Every run checks that both produce the same lines, and a fuzz pass over random text with
+unusual whitespace checks the equivalence more broadly.
+
+Usage:
+    PYTHONPATH=src python scripts/benchmarks/bench_web_postprocess.py --size-mb 5
+    PYTHONPATH=src python scripts/benchmarks/bench_web_postprocess.py --corpus saved_pages/
+"""
+import argparse
+import os
+import random
+import re
+import time
+
+from spindle.processors import WebProcessor
+from spindle.processors.web_extractors import extractor_registry
+
+OPTIONS = [
+    {},
+    {'remove_urls': True},
+    {'remove_excess_whitespace': False},
+    {'min_line_length': 20, 'max_line_length': 80},
+    {'remove_urls': True, 'min_line_length': 5, 'max_line_length': 120},
+]
+
+
+def legacy_main_process(processor: WebProcessor, content: str) -> list:
+    """
+    The former WebProcessor._main_process.
+    """
+    def remove_urls(text: str) -> str:
+        url_pattern = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+        return url_pattern.sub('', text)
+
+    lines = content.split('\n')
+    processed_lines = []
+
+    for line in lines:
+        line = line.strip()
+
+        if processor.remove_excess_whitespace:
+            line = re.sub(r'\s+', ' ', line)
+
+        if processor.remove_urls:
+            line = remove_urls(line)
+
+        if len(line) >= processor.min_line_length:
+            if processor.max_line_length and len(line) > processor.max_line_length:
+                line = line[:processor.max_line_length] + '...'
+            processed_lines.append(line)
+
+    return processed_lines
+
+
+def generate_document(size_mb: float) -> str:
+    """
+    Generate text that looks like extracted page content: prose, short navigation lines, links and blank lines.
+
+    :param size_mb: float - Approximate size of the document.
+    :return: str - The document.
+    """
+    rng = random.Random(7)
+    words = "the of and to in is for on that with as by this are from documentation page example".split()
+    lines, size = [], 0
+    while size < size_mb * 1024 * 1024:
+        kind = rng.random()
+        if kind < 0.2:
+            line = ""
+        elif kind < 0.45:
+            line = " ".join(rng.choices(words, k=rng.randint(1, 3)))
+        else:
+            line = "  ".join(" ".join(rng.choices(words, k=rng.randint(4, 14))) for _ in range(rng.randint(1, 3)))
+            if rng.random() < 0.3:
+                line += f" see https://example.com/docs/{rng.randint(1, 999)}?q=a%20b&x=(1) for more"
+        line = " " * rng.randint(0, 4) + line + "\t" * rng.randint(0, 2)
+        lines.append(line)
+        size += len(line) + 1
+    return "\n".join(lines)
+
+
+def fuzz(rounds: int) -> int:
+    """
+    Compare both implementations on random text built from whitespace, URL and word fragments.
+
+    :param rounds: int - Number of random documents.
+    :return: int - Number of mismatches.
+    """
+    rng = random.Random(11)
+    pieces = [" ", "  ", "\t", "\n", "\r\n", "\r", "\x0b", "\x0c", "\xa0", " ", "　", "\x1c", "\x85",
+              " ", "word", "x", "https://a.b/c?d=(e)", "http://x.y/%20z", "http:/no", "https://", "é"]
+    mismatches = 0
+    for _ in range(rounds):
+        content = "".join(rng.choices(pieces, k=rng.randint(0, 40)))
+        for options in OPTIONS:
+            processor = WebProcessor(**options)
+            if legacy_main_process(processor, content) != processor._main_process(content):
+                mismatches += 1
+                print(f"MISMATCH {options}: {content!r}")
+    return mismatches
+
+
+def measure(function, content: str, repeat: int) -> tuple:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(content)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="Directory of saved HTML pages, their extracted text is used as input")
+    parser.add_argument("--method", default="custom", help="Extraction method used for the corpus")
+    parser.add_argument("--size-mb", type=float, default=5, help="Size of the generated document")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per implementation, the best one is reported")
+    parser.add_argument("--fuzz", type=int, default=2000, help="Number of random documents for the equivalence check")
+    args = parser.parse_args()
+
+    if args.corpus:
+        extractor = extractor_registry.get(args.method)
+        texts = []
+        for root, _, files in os.walk(args.corpus):
+            for name in sorted(files):
+                if name.endswith(('.html', '.htm')):
+                    with open(os.path.join(root, name), encoding="utf-8", errors="replace") as f:
+                        texts.append(extractor(f.read()))
+        content = "\n".join(texts)
+    else:
+        content = generate_document(args.size_mb)
+    print(f"input: {len(content) / (1024 * 1024):.1f} MB, {content.count(chr(10)) + 1} lines")
+
+    for options in OPTIONS:
+        processor = WebProcessor(**options)
+        legacy_time, legacy = measure(lambda text: legacy_main_process(processor, text), content, args.repeat)
+        batched_time, batched = measure(processor._main_process, content, args.repeat)
+        status = "identical" if legacy == batched else "DIFFERENT"
+        print(f"{str(options):<72} legacy {legacy_time * 1000:8.1f} ms  batched {batched_time * 1000:8.1f} ms  "
+              f"x{legacy_time / batched_time:4.1f}  {status}")
+
+    print(f"fuzz: {fuzz(args.fuzz)} mismatches in {args.fuzz} documents x {len(OPTIONS)} option sets")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Startup-time regression check for the web processor.
+
+Fails (exit code 1) when importing and creating a WebProcessor in a fresh interpreter imports an
+extraction library other than the one selected, or takes longer than the given budget.
+
+Usage:
+    PYTHONPATH=src python scripts/benchmarks/check_web_startup.py --method custom --max-seconds 0.5
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from spindle.processors.web_processor import WebProcessor
+processor = WebProcessor(extraction_method=sys.argv[1])
+processor.available_methods
+elapsed = time.perf_counter() - start
+from spindle.processors.web_extractors import extractor_registry
+packages = {extractor_registry.package(name) for name in extractor_registry.names()} - {None}
+print(json.dumps([sorted(packages & set(sys.modules)), elapsed]))
+"""
+
+
+def probe(method: str) -> tuple:
+    """
+    Import and create a WebProcessor in a fresh interpreter.
+
+    :param method: str - The extraction method to select.
+    :return: tuple - The extraction packages that were imported, and the time taken in seconds.
+    """
+    result = subprocess.run([sys.executable, "-c", PROBE, method], capture_output=True, text=True, check=True,
+                            env={**os.environ, "PYTHONWARNINGS": "ignore"})
+    imported, elapsed = json.loads(result.stdout.strip().splitlines()[-1])
+    return imported, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--method", default="custom", help="Extraction method to select")
+    parser.add_argument("--max-seconds", type=float, default=0.5, help="Budget for importing and creating the processor")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs, the fastest one is compared to the budget")
+    args = parser.parse_args()
+
+    failed = False
+    runs = [probe(args.method) for _ in range(args.repeat)]
+    imported = runs[0][0]
+    elapsed = min(run[1] for run in runs)
+
+    # The selected method's own library may be imported once content is extracted, but not before
+    print(f"extraction packages imported by WebProcessor({args.method!r}): {imported or 'none'}")
+    if imported:
+        print(f"FAIL: eager imports: {imported}")
+        failed = True
+
+    print(f"import and create WebProcessor: {elapsed:.3f} s (budget {args.max_seconds:.3f} s)")
+    if elapsed > args.max_seconds:
+        print("FAIL: startup time over budget")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,5 +6,6 @@ from .abstract_visitor import *
 from .abstract_fetcher_decorator import *
 from .abstract_fetcher import *
 from .abstract_processor import *
+from .abstract_serializer import *
 from .abstract_serializer_factory import *
 from .abstract_model_provider import *
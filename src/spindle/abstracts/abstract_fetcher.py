@@ -1,6 +1,6 @@
 from spindle.interfaces import IFetcher, IProcessor, IVisitor
 from abc import abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Tuple
 
 __All__ = ['AbstractFetcher']
 
@@ -41,6 +41,22 @@ class AbstractFetcher(IFetcher):
         processed_content = self._process_content(raw_content, **kwargs)
         return self._format_output(processed_content, **kwargs)
 
+    def stream(self, source: Any, **kwargs: Any) -> Iterator[Tuple[str, Any]]:
+        """
+        Fetch and process the content as a stream of key/value pairs.
+
+        The default implementation fetches the whole result and yields its entries.
+        Fetchers that can produce output incrementally override this method.
+
+        Args:
+            source: The source to fetch content from.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Iterator[Tuple[str, Any]]: The entries of the fetched and processed content
+        """
+        yield from self.fetch(source, **kwargs).items()
+
     @abstractmethod
     def _fetch_content(self, source: Any, **kwargs: Any) -> Any:
         """
@@ -1,6 +1,7 @@
 from spindle.interfaces import IHandler, ISerializer
 from abc import abstractmethod
-from typing import Dict, List, Any, Union
+import itertools
+from typing import Dict, Iterable, Iterator, List, Any, Tuple, Union
 from spindle.exceptions import SerializationException
 
 __All__ = ["AbstractHandler"]
@@ -23,6 +24,45 @@ class AbstractHandler(IHandler):
         except Exception as e:
             print(f"Error handling data: {e}")
 
+    def handle_stream(self, items: Iterable[Tuple[str, Any]]) -> None:
+        """Serialize and write a stream of key/value pairs chunk by chunk."""
+        items = self.start_stream(items)
+        self.open_stream()
+        try:
+            for chunk in self.serializer.encode_stream(self.preprocess_stream(items)):
+                self.write_chunk(chunk)
+        finally:
+            self.close_stream()
+
+    @staticmethod
+    def start_stream(items: Iterable[Tuple[str, Any]]) -> Iterator[Tuple[str, Any]]:
+        """
+        Pull the first pair of a stream before anything is written, so a fetch that fails to
+        start raises before the output is opened. Returns an iterator over all pairs.
+        """
+        items = iter(items)
+        for first in items:
+            return itertools.chain([first], items)
+        return iter(())
+
+    def preprocess_stream(self, items: Iterable[Tuple[str, Any]]) -> Iterator[Tuple[str, Any]]:
+        """Pass the items through and append the entries preprocess would add to a whole document."""
+        yield from items
+        yield from self.preprocess({}).items()
+
+    def open_stream(self) -> None:
+        """Prepare the output destination for a stream of chunks."""
+        self._stream_chunks = []
+
+    def write_chunk(self, chunk: str) -> None:
+        """Write a single chunk of a stream. Buffers the chunks unless a subclass writes them directly."""
+        self._stream_chunks.append(chunk)
+
+    def close_stream(self) -> None:
+        """Finish a stream of chunks."""
+        self.write(''.join(self._stream_chunks))
+        self._stream_chunks = []
+
     @abstractmethod
     def preprocess(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Preprocess the data before serialization."""
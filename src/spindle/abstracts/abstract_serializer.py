@@ -0,0 +1,62 @@
+from spindle.interfaces import ISerializer
+from abc import abstractmethod
+from typing import Any, Iterable, Iterator, Tuple
+
+__All__ = ['AbstractSerializer']
+
+
+class AbstractSerializer(ISerializer):
+    """
+    An abstract base class for serializers implementing the ISerializer interface.
+
+    Streaming output is built from three steps: an opening chunk, the chunks for each
+    key/value pair and a closing chunk. Keeping the steps separate lets a composite handler
+    drive several serializers from a single pass over the items.
+    """
+
+    def encode_stream(self, items: Iterable[Tuple[str, Any]]) -> Iterator[str]:
+        """
+        Serialize a stream of key/value pairs into a stream of string chunks.
+
+        Args:
+            items (Iterable[Tuple[str, Any]]): The key/value pairs to serialize.
+
+        Returns:
+            Iterator[str]: The serialized chunks. Joined together they equal the output of encode.
+        """
+        count = 0
+        yield self.stream_start()
+        for index, (key, value) in enumerate(items):
+            yield from self.encode_item(key, value, index)
+            count = index + 1
+        yield self.stream_end(count)
+
+    def stream_start(self) -> str:
+        """
+        Return the chunk that opens a stream.
+        """
+        return ''
+
+    @abstractmethod
+    def encode_item(self, key: str, value: Any, index: int) -> Iterator[str]:
+        """
+        Serialize a single key/value pair of a stream.
+
+        Args:
+            key (str): The key of the pair.
+            value (Any): The value of the pair. Iterators are consumed lazily where the format allows it.
+            index (int): The position of the pair in the stream.
+
+        Returns:
+            Iterator[str]: The serialized chunks for the pair.
+        """
+        pass
+
+    def stream_end(self, count: int) -> str:
+        """
+        Return the chunk that closes a stream.
+
+        Args:
+            count (int): The number of pairs that were serialized.
+        """
+        return ''
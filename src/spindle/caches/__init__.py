@@ -0,0 +1,4 @@
+from .cache_utils import *
+from .code_cache import *
+from .http_cache import *
+from .content_cache import *
@@ -0,0 +1,51 @@
+import hashlib
+import json
+import sqlite3
+from typing import Any, Dict, Sequence
+
+__all__ = ['make_options_key', 'evict_least_recently_used']
+
+
+def make_options_key(options: Dict[str, Any]) -> str:
+    """
+    Build a stable key from a dictionary of processor options.
+
+    Args:
+        options (Dict[str, Any]): The processor options.
+
+    Returns:
+        str: A short hash identifying the options.
+    """
+    encoded = json.dumps(options, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()
+
+
+def evict_least_recently_used(connection: sqlite3.Connection, table: str, key_columns: Sequence[str],
+                              max_size: int) -> int:
+    """
+    Delete the least recently used rows of a table until the total of their sizes fits in max_size.
+
+    The table must have 'size' and 'accessed_at' columns. The caller owns the transaction.
+
+    Args:
+        connection (sqlite3.Connection): The database connection.
+        table (str): The name of the table.
+        key_columns (Sequence[str]): The columns of the primary key, identifying the rows to delete.
+        max_size (int): The maximum total size of the rows, in bytes.
+
+    Returns:
+        int: The number of evicted rows.
+    """
+    total = connection.execute(f"SELECT COALESCE(SUM(size), 0) FROM {table}").fetchone()[0]
+    if total <= max_size:
+        return 0
+
+    evicted = []
+    for row in connection.execute(f"SELECT {', '.join(key_columns)}, size FROM {table} ORDER BY accessed_at"):
+        if total <= max_size:
+            break
+        evicted.append(row[:-1])
+        total -= row[-1]
+    condition = ' AND '.join(f"{column} = ?" for column in key_columns)
+    connection.executemany(f"DELETE FROM {table} WHERE {condition}", evicted)
+    return len(evicted)
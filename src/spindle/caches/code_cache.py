@@ -0,0 +1,114 @@
+import json
+import logging
+import os
+import sqlite3
+from typing import Any, Iterable, List, Optional, Tuple
+
+from spindle.caches.cache_utils import make_options_key
+
+__all__ = ['CodeCache']
+
+
+class CodeCache:
+    """
+    A persistent on-disk cache for processed source files.
+
+    Entries are stored in a SQLite database and keyed by the absolute file path and a hash
+    of the processor options. An entry is only served when the file's modification time
+    and size still match the values recorded when it was stored.
+
+    Attributes:
+        cache_file (str): The path of the SQLite database file.
+    """
+
+    def __init__(self, cache_file: str):
+        """
+        Initialize the cache, creating the database file if needed.
+
+        Args:
+            cache_file (str): The path of the SQLite database file.
+        """
+        self.cache_file = cache_file
+        self.logger = logging.getLogger(self.__class__.__name__)
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        self.connection = sqlite3.connect(cache_file)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "path TEXT NOT NULL, options TEXT NOT NULL, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, "
+            "value TEXT NOT NULL, PRIMARY KEY (path, options))"
+        )
+        self.connection.commit()
+
+    make_options_key = staticmethod(make_options_key)
+
+    def get(self, file_path: str, stat: os.stat_result, options_key: str) -> Optional[Any]:
+        """
+        Look up the cached value for a file.
+
+        Args:
+            file_path (str): The path of the file.
+            stat (os.stat_result): The current stat result of the file.
+            options_key (str): The key of the processor options.
+
+        Returns:
+            Optional[Any]: The cached value, or None if there is no valid entry.
+        """
+        row = self.connection.execute(
+            "SELECT mtime_ns, size, value FROM entries WHERE path = ? AND options = ?",
+            (os.path.abspath(file_path), options_key)
+        ).fetchone()
+        if row is None or row[0] != stat.st_mtime_ns or row[1] != stat.st_size:
+            return None
+        return json.loads(row[2])
+
+    def set_many(self, entries: Iterable[Tuple[str, os.stat_result, Any]], options_key: str) -> None:
+        """
+        Store several values in a single transaction.
+
+        Args:
+            entries (Iterable[Tuple[str, os.stat_result, Any]]): Tuples of file path, stat result and value.
+            options_key (str): The key of the processor options.
+        """
+        rows = [
+            (os.path.abspath(file_path), options_key, stat.st_mtime_ns, stat.st_size, json.dumps(value))
+            for file_path, stat, value in entries
+        ]
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)", rows)
+
+    def prune(self) -> int:
+        """
+        Remove entries for files that no longer exist or have changed since they were cached.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        stale: List[Tuple[str, str]] = []
+        for path, options, mtime_ns, size in self.connection.execute(
+                "SELECT path, options, mtime_ns, size FROM entries"):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stale.append((path, options))
+                continue
+            if stat.st_mtime_ns != mtime_ns or stat.st_size != size:
+                stale.append((path, options))
+
+        with self.connection:
+            self.connection.executemany("DELETE FROM entries WHERE path = ? AND options = ?", stale)
+        self.connection.execute("VACUUM")
+        self.logger.info(f"Pruned {len(stale)} entries from {self.cache_file}")
+        return len(stale)
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+        """
+        with self.connection:
+            self.connection.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """
+        Close the underlying database connection.
+        """
+        self.connection.close()
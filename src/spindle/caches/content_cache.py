@@ -0,0 +1,129 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from spindle.caches.cache_utils import evict_least_recently_used, make_options_key
+
+__all__ = ['ContentCache']
+
+
+class ContentCache:
+    """
+    A persistent on-disk memo of processed content, keyed by the raw content it was produced from.
+
+    Entries are stored in a SQLite database and keyed by a hash of the raw content and a hash
+    of the processor options, so the same page processed with the same settings is served
+    without running the extractor again. When the total size of the stored values exceeds
+    the bound, the least recently used entries are evicted.
+
+    Attributes:
+        cache_file (str): The path of the SQLite database file.
+        max_size (int): The maximum total size of the stored values, in bytes.
+    """
+
+    def __init__(self, cache_file: str, max_size: int = 64 * 1024 * 1024):
+        """
+        Initialize the cache, creating the database file if needed.
+
+        Args:
+            cache_file (str): The path of the SQLite database file.
+            max_size (int): The maximum total size of the stored values, in bytes.
+        """
+        self.cache_file = cache_file
+        self.max_size = max_size
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        self.connection = sqlite3.connect(cache_file, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "content_hash TEXT NOT NULL, options TEXT NOT NULL, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "accessed_at REAL NOT NULL, PRIMARY KEY (content_hash, options))"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)")
+        self.connection.commit()
+
+    make_options_key = staticmethod(make_options_key)
+
+    @staticmethod
+    def make_content_key(content: str) -> str:
+        """
+        Hash raw content into a cache key.
+
+        Args:
+            content (str): The raw content.
+
+        Returns:
+            str: A short hash identifying the content.
+        """
+        return hashlib.blake2b(content.encode('utf-8', errors='surrogatepass'), digest_size=16).hexdigest()
+
+    def get(self, content_key: str, options_key: str) -> Optional[Any]:
+        """
+        Look up the processed value for a content and options key, and mark it as recently used.
+
+        Args:
+            content_key (str): The key of the raw content.
+            options_key (str): The key of the processor options.
+
+        Returns:
+            Optional[Any]: The cached value, or None if there is no entry.
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT value FROM entries WHERE content_hash = ? AND options = ?", (content_key, options_key)
+            ).fetchone()
+            if row is None:
+                return None
+            with self.connection:
+                self.connection.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE content_hash = ? AND options = ?",
+                    (time.time(), content_key, options_key)
+                )
+        return json.loads(row[0])
+
+    def set(self, content_key: str, options_key: str, value: Any) -> None:
+        """
+        Store a processed value, then evict entries if the size bound is exceeded.
+
+        Args:
+            content_key (str): The key of the raw content.
+            options_key (str): The key of the processor options.
+            value (Any): The JSON serializable processed value.
+        """
+        encoded = json.dumps(value, default=str)
+        size = len(encoded)
+        if size > self.max_size:
+            return
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (content_key, options_key, encoded, size, time.time())
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Delete the least recently used entries until the stored values fit in max_size.
+        """
+        evicted = evict_least_recently_used(self.connection, 'entries', ('content_hash', 'options'), self.max_size)
+        if evicted:
+            self.logger.debug(f"Evicted {evicted} entries from {self.cache_file}")
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+        """
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """
+        Close the underlying database connection.
+        """
+        self.connection.close()
@@ -0,0 +1,155 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import NamedTuple, Optional
+
+from spindle.caches.cache_utils import evict_least_recently_used
+
+__all__ = ['HttpCache', 'HttpCacheEntry']
+
+
+class HttpCacheEntry(NamedTuple):
+    """
+    A cached response body with the validators needed to revalidate it, and the URL the
+    request ended at after redirects (None for entries stored without one).
+    """
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+    final_url: Optional[str] = None
+
+
+class HttpCache:
+    """
+    A persistent on-disk cache for HTTP response bodies.
+
+    Entries are stored in a SQLite database keyed by URL, together with the ETag and
+    Last-Modified validators of the response. An entry younger than the TTL is served as is;
+    an older entry is revalidated with a conditional request by the caller. When the total
+    size of the stored bodies exceeds the bound, the least recently used entries are evicted.
+
+    The cache is shared by the fetch threads of a WebFetcher, so access is serialized with a lock.
+
+    Attributes:
+        cache_file (str): The path of the SQLite database file.
+        ttl (float): The number of seconds an entry is served without revalidation.
+        max_size (int): The maximum total size of the stored bodies, in bytes.
+    """
+
+    def __init__(self, cache_file: str, ttl: float = 3600, max_size: int = 256 * 1024 * 1024):
+        """
+        Initialize the cache, creating the database file if needed.
+
+        Args:
+            cache_file (str): The path of the SQLite database file.
+            ttl (float): The number of seconds an entry is served without revalidation.
+            max_size (int): The maximum total size of the stored bodies, in bytes.
+        """
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.max_size = max_size
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        self.connection = sqlite3.connect(cache_file, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body TEXT NOT NULL, size INTEGER NOT NULL, "
+            "stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(responses)")}
+        if 'final_url' not in columns:
+            # Databases written before redirects were recorded
+            self.connection.execute("ALTER TABLE responses ADD COLUMN final_url TEXT")
+        self.connection.commit()
+
+    def get(self, url: str) -> Optional[HttpCacheEntry]:
+        """
+        Look up the cached response for a URL and mark it as recently used.
+
+        Args:
+            url (str): The requested URL.
+
+        Returns:
+            Optional[HttpCacheEntry]: The cached entry, fresh or stale, or None if the URL is not cached.
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT body, etag, last_modified, stored_at, final_url FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            with self.connection:
+                self.connection.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), url))
+        return HttpCacheEntry(*row)
+
+    def is_fresh(self, entry: HttpCacheEntry) -> bool:
+        """
+        Check whether an entry can be served without revalidation.
+
+        Args:
+            entry (HttpCacheEntry): The cached entry.
+
+        Returns:
+            bool: True if the entry is younger than the TTL.
+        """
+        return time.time() - entry.stored_at < self.ttl
+
+    def set(self, url: str, body: str, etag: Optional[str] = None, last_modified: Optional[str] = None,
+            final_url: Optional[str] = None) -> None:
+        """
+        Store a response body and its validators, then evict entries if the size bound is exceeded.
+
+        Args:
+            url (str): The requested URL.
+            body (str): The response body.
+            etag (Optional[str]): The ETag header of the response.
+            last_modified (Optional[str]): The Last-Modified header of the response.
+            final_url (Optional[str]): The URL the request ended at after redirects.
+        """
+        size = len(body.encode('utf-8'))
+        if size > self.max_size:
+            return
+        now = time.time()
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses (url, etag, last_modified, body, size, stored_at, accessed_at, final_url) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, body, size, now, now, final_url)
+            )
+            self._evict()
+
+    def touch(self, url: str) -> None:
+        """
+        Restart the TTL of an entry after the server confirmed it is unchanged.
+
+        Args:
+            url (str): The requested URL.
+        """
+        with self.lock, self.connection:
+            self.connection.execute("UPDATE responses SET stored_at = ? WHERE url = ?", (time.time(), url))
+
+    def _evict(self) -> None:
+        """
+        Delete the least recently used entries until the stored bodies fit in max_size.
+        """
+        evicted = evict_least_recently_used(self.connection, 'responses', ('url',), self.max_size)
+        if evicted:
+            self.logger.debug(f"Evicted {evicted} entries from {self.cache_file}")
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+        """
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """
+        Close the underlying database connection.
+        """
+        self.connection.close()
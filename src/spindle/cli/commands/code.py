@@ -1,5 +1,6 @@
 import click
-from typing import List
+import json
+from typing import List, Optional
 from spindle.factories import CodeFetcherFactory
 from spindle.config import ConfigManager
 from spindle.decorators import TimingFetcherDecorator
@@ -16,14 +17,31 @@ __All__ = ['code']
 @click.option('--excluded-files', default='', help='Comma-separated list of files to exclude')
 @click.option('--extensions', default='.py,.js,.html,.css', help='Comma-separated list of file extensions to include')
 @click.option('--config', help='Path to the configuration file')
+@click.option('--mode', type=click.Choice(['source', 'symbols']), default='source',
+              help='Output the processed source, or an outline of classes, functions and signatures')
 @click.option('--remove-comments', is_flag=True, help='Remove comments from the code')
 @click.option('--keep-empty-lines', is_flag=True, help='Keep empty lines in the code')
 @click.option('--no-trim', is_flag=True, help='Do not trim whitespace from lines')
+@click.option('--gitignore/--no-gitignore', default=True, help='Skip paths matched by .gitignore and .spindleignore files')
+@click.option('--jobs', '-j', type=int, default=1, help='Number of worker threads used to read files')
+@click.option('--cache/--no-cache', default=True, help='Serve unchanged files from the on-disk cache')
+@click.option('--prune-cache', is_flag=True, help='Remove cache entries for deleted or changed files before fetching')
+@click.option('--max-file-size', type=int, default=1024 * 1024,
+              help='Skip files larger than this many bytes without reading them, 0 disables the limit')
+@click.option('--sniff/--no-sniff', default=True, help='Skip files whose first block looks binary or minified')
+@click.option('--dedupe', is_flag=True, help='Replace files with the same content as an earlier file by a reference to it')
+@click.option('--max-tokens', type=int, help='Token budget, only the files that fit are output')
+@click.option('--priority', type=click.Choice(['recent', 'smallest', 'walk']), default='recent',
+              help='Order in which files are packed into the token budget')
+@click.option('--include-first', default='', help='Comma-separated list of paths or glob patterns packed before all other files')
+@click.option('--manifest', help='Write the list of files dropped by the token budget to this JSON file')
 @click.option('--stats', '-s', is_flag=True, help='Print statistics about the code fetcher')
 @click.option('--format', type=click.Choice(['json', 'plaintext']), default='plaintext', help='Output format')
 @click.option('--color', type=click.Choice(['red', 'green', 'blue', 'cyan', 'magenta', 'yellow', 'white']), help='Console output color')
-def code(src: str, output: str, excluded_dirs: str, excluded_files: str, extensions: str, config: str,
-         remove_comments: bool, keep_empty_lines: bool, no_trim: bool, stats: bool, format: str, color: str):
+def code(src: str, output: str, excluded_dirs: str, excluded_files: str, extensions: str, config: str, mode: str,
+         remove_comments: bool, keep_empty_lines: bool, no_trim: bool, gitignore: bool, jobs: int, cache: bool,
+         prune_cache: bool, max_file_size: int, sniff: bool, dedupe: bool, max_tokens: Optional[int], priority: str, include_first: str, manifest: str, stats: bool,
+         format: str, color: str):
     """
     Parse source code files and output their content to a text file or console.
     """
@@ -36,26 +54,41 @@ def code(src: str, output: str, excluded_dirs: str, excluded_files: str, extensi
             excluded_dirs = config_manager.get('Exclusions', 'excluded_dirs', fallback=excluded_dirs)
             excluded_files = config_manager.get('Exclusions', 'excluded_files', fallback=excluded_files)
             extensions = config_manager.get('Extensions', 'file_extensions', fallback=extensions)
+            jobs = config_manager.getint('Settings', 'jobs', fallback=jobs)
+            max_tokens = config_manager.getint('Settings', 'max_tokens', fallback=max_tokens)
+            max_file_size = config_manager.getint('Settings', 'max_file_size', fallback=max_file_size)
 
         # Process input parameters
         excluded_dirs_list = [d.strip() for d in excluded_dirs.split(',') if d.strip()]
         excluded_files_list = [f.strip() for f in excluded_files.split(',') if f.strip()]
         file_extensions_list = [e.strip() for e in extensions.split(',') if e.strip()]
+        include_first_list = [p.strip() for p in include_first.split(',') if p.strip()]
 
         # Create and configure the factory
         factory = CodeFetcherFactory()
         factory.set_default_excluded_dirs(excluded_dirs_list)
         factory.set_default_excluded_files(excluded_files_list)
         factory.set_default_file_extensions(file_extensions_list)
+        factory.set_default_use_ignore_files(gitignore)
+        factory.set_default_jobs(jobs)
+        factory.set_default_use_cache(cache)
+        factory.set_default_max_file_size(max_file_size)
+        factory.set_default_sniff(sniff)
+        factory.set_default_dedupe(dedupe)
 
         # Create the fetcher
-        fetcher = factory.create_fetcher(
+        code_fetcher = factory.create_fetcher(
+            mode=mode,
             remove_comments=remove_comments,
             remove_empty_lines=not keep_empty_lines,
-            trim_lines=not no_trim
+            trim_lines=not no_trim,
+            max_tokens=max_tokens,
+            priority=priority,
+            include_first=include_first_list
         )
-        if stats:
-            fetcher = TimingFetcherDecorator(fetcher)
+        if prune_cache and code_fetcher.cache:
+            code_fetcher.cache.prune()
+        fetcher = TimingFetcherDecorator(code_fetcher) if stats else code_fetcher
 
         # Create handlers
         composite_handler = CompositeHandler()
@@ -66,8 +99,25 @@ def code(src: str, output: str, excluded_dirs: str, excluded_files: str, extensi
         composite_handler.add_handler(console_handler)
 
         # Fetch and handle the code
-        parsed_data = fetcher.fetch(src)
-        composite_handler.handle(parsed_data)
+        composite_handler.handle_stream(fetcher.stream(src))
+
+        # Report the files left out by the token budget
+        if max_tokens is not None:
+            if manifest:
+                with open(manifest, 'w', encoding='utf-8') as f:
+                    json.dump({'max_tokens': max_tokens, 'dropped': code_fetcher.dropped}, f, indent=2)
+            elif code_fetcher.dropped:
+                click.echo(err=True)
+                click.echo(f"Dropped {len(code_fetcher.dropped)} file(s) to fit {max_tokens} tokens:", err=True)
+                for entry in code_fetcher.dropped:
+                    click.echo(f"  {entry['path']} ({entry['tokens']} tokens)", err=True)
+
+        if stats:
+            click.echo(err=True)
+            for key, value in code_fetcher.stats.items():
+                click.echo(f"{key}: {value}", err=True)
+            for entry in code_fetcher.skipped:
+                click.echo(f"  skipped {entry['path']} ({entry['reason']}, {entry['size']} bytes)", err=True)
 
         #click.echo("Code parsing completed successfully.")
 
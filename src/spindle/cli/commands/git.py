@@ -1,6 +1,8 @@
 import click
 from spindle.factories import GitFetcherFactory
 from spindle.config import ConfigManager
+from spindle.fetchers import GitCommitFetcher
+from spindle.processors import GitCommitProcessor
 
 
 @click.command()
@@ -8,33 +10,63 @@ from spindle.config import ConfigManager
 @click.option('--output', help='Output file path')
 @click.option('--start', type=int, help='Start index for commit range')
 @click.option('--end', type=int, help='End index for commit range')
+@click.option('--since', help="Only include commits more recent than a date, e.g. '2024-01-01' or '2 weeks ago'")
+@click.option('--until', help='Only include commits older than a date')
+@click.option('--author', multiple=True, help='Only include commits whose author matches a pattern (repeatable)')
+@click.option('--revision', help="Revision or range to walk instead of HEAD, e.g. 'main' or 'v1.0..HEAD'")
 @click.option('--count', is_flag=True, help='Return the number of commits in the repository')
 @click.option('--hash', help='Return commit by full hash or hash prefix')
 @click.option('--extract-ticket', is_flag=True, help='Extract ticket numbers from commit messages')
 @click.option('--max-length', type=int, help='Maximum length of commit messages (use 0 for no limit)')
 @click.option('--no-capitalize', is_flag=True, help='Do not capitalize the first word of commit messages')
+@click.option('--fields', default='',
+              help=f"Comma-separated commit fields to add to each message: {', '.join(GitCommitProcessor.FIELDS)}")
+@click.option('--backend', type=click.Choice(GitCommitFetcher.BACKENDS), default='log',
+              help='Read commits from one git log process, or object by object with GitPython')
 @click.option('--stats', '-s', is_flag=True, help='Print statistics about the Git fetcher')
 @click.option('--format', type=click.Choice(['json', 'plaintext']), default='json', help='Output format')
 @click.option('--color', type=click.Choice(['red', 'green', 'blue', 'cyan', 'magenta', 'yellow', 'white']), help='Console output color')
 @click.option('--full-message', is_flag=True, help='Output full commit messages without truncation')
 @click.option('--config', help='Path to the configuration file')
-def git(repo, output, start, end, count, hash, extract_ticket, max_length, no_capitalize, stats, format, color, full_message, config):
+@click.argument('paths', nargs=-1, type=click.Path())
+def git(repo, output, start, end, since, until, author, revision, count, hash, extract_ticket, max_length, no_capitalize, fields, backend, stats, format, color, full_message, config, paths):
     """
     Parse git commit messages and output their content to a text file or console.
+
+    Only commits that change one of the given PATHS are included, e.g. 'spindle git -- src/'.
+    --since, --until, --author, --revision and PATHS are applied by git while it walks the
+    history, and --start/--end and --count apply to the commits they select.
     """
     # Load configuration if a config file is specified
     if config:
-        config_manager = ConfigManager(config)
-        repo = config_manager.get('Git', 'repo_path', fallback=repo)
-        output = config_manager.get('Git', 'output_file', fallback=output)
-        extract_ticket = config_manager.getboolean('Git', 'extract_ticket', fallback=extract_ticket)
-        max_length = config_manager.getint('Git', 'max_length', fallback=max_length)
-        no_capitalize = config_manager.getboolean('Git', 'no_capitalize', fallback=no_capitalize)
+        try:
+            config_manager = ConfigManager(config)
+            repo = config_manager.get('Git', 'repo_path', fallback=repo)
+            output = config_manager.get('Git', 'output_file', fallback=output)
+            extract_ticket = config_manager.getboolean('Git', 'extract_ticket', fallback=extract_ticket)
+            max_length = config_manager.getint('Git', 'max_length', fallback=max_length)
+            no_capitalize = config_manager.getboolean('Git', 'no_capitalize', fallback=no_capitalize)
+            backend = config_manager.get('Git', 'backend', fallback=backend)
+            fields = config_manager.get('Git', 'fields', fallback=fields)
+            since = config_manager.get('Git', 'since', fallback=since)
+            until = config_manager.get('Git', 'until', fallback=until)
+            revision = config_manager.get('Git', 'revision', fallback=revision)
+        except (OSError, ValueError) as e:
+            raise click.BadParameter(str(e), param_hint="'--config'")
+
+    field_list = [field.strip() for field in fields.split(',') if field.strip()]
+    unknown = [field for field in field_list if field not in GitCommitProcessor.FIELDS]
+    if unknown:
+        raise click.BadParameter(f"Unknown commit fields: {', '.join(unknown)}", param_hint="'--fields'")
+    if backend not in GitCommitFetcher.BACKENDS:
+        raise click.BadParameter(f"Unknown git backend: {backend}", param_hint="'--backend'")
 
     # Create and configure the factory
     factory = GitFetcherFactory()
     factory.set_default_extract_ticket_number(extract_ticket)
     factory.set_default_capitalize_first_word(not no_capitalize)
+    factory.set_default_backend(backend)
+    factory.set_default_fields(field_list)
 
     # Set max_length to None if full_message is True, otherwise use the provided max_length
     if full_message:
@@ -43,14 +75,18 @@ def git(repo, output, start, end, count, hash, extract_ticket, max_length, no_ca
         max_length = None
     factory.set_default_max_length(max_length)
 
-    # Create the fetcher and handler instances
-    fetcher = factory.create_fetcher(stats=stats)
+    # Create the fetcher and handler instances. The timing decorator only wraps fetch and stream,
+    # so count and hash lookups use the bare fetcher
+    fetcher = factory.create_fetcher(stats=stats and not (count or hash))
     handler = factory.create_handler(output, format, color)
 
+    # Filters applied by git's revision walk
+    filters = {'revision': revision, 'paths': paths, 'since': since, 'until': until, 'author': author}
+
     try:
         if count:
-            # Get and display the total number of commits
-            commit_count = fetcher.get_commit_count(repo)
+            # Get and display the number of commits that pass the filters
+            commit_count = fetcher.get_commit_count(repo, **filters)
             handler.handle({"total_commits": commit_count})
             return
 
@@ -60,12 +96,10 @@ def git(repo, output, start, end, count, hash, extract_ticket, max_length, no_ca
             if not commit_data:
                 handler.handle({"error": f"No commit found with hash: {hash}"})
                 return
+            handler.handle(commit_data)
         else:
-            # Parse commits within the specified range
-            commit_data = fetcher.fetch(repo, start, end)
-
-        # Handle the parsed data
-        handler.handle(commit_data)
+            # Stream commits within the specified range
+            handler.handle_stream(fetcher.stream(repo, start, end, **filters))
 
         #click.echo("Git commit parsing completed successfully.")
     except Exception as e:
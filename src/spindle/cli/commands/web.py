@@ -1,37 +1,92 @@
 import click
+import os
+import sys
+from typing import List, Tuple
 from spindle.factories import WebFetcherFactory
 from spindle.config import ConfigManager
 from spindle.decorators import TimingFetcherDecorator
 from spindle.handlers import CompositeHandler
+from spindle.processors import AUTO_METHOD, ExtractorBenchmark, extractor_registry
 from spindle.exceptions import HandlerException
 
-@click.command()
-@click.argument('url', required=False)
+
+class _DefaultCommandGroup(click.Group):
+    """
+    A command group that runs its 'fetch' command when the first argument is not one of its
+    subcommands, so `spindle web URL` keeps working next to `spindle web bench`.
+    """
+
+    def parse_args(self, ctx, args):
+        if not args or args[0] not in self.commands:
+            args = ['fetch'] + list(args)
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=_DefaultCommandGroup)
+def web():
+    """Parse web content from one or more URLs, or benchmark the extraction methods."""
+    pass
+
+
+@click.command(name='fetch')
+@click.argument('urls', nargs=-1)
 #@click.option('--url', required=True, help='URL to scrape text from')
+@click.option('--urls-file', '-i', type=click.File('r'), help="File with one URL per line, '-' reads stdin")
 @click.option('--output', help='Output file path')
 @click.option('--method', default='traf',
-              type=click.Choice(['custom', 'raw', 'traf', 'readability', 'article_parser', 'boilerpy3', 'html2text', 'newspaper', 'goose']),
-              help='Content extraction method')
+              help='Content extraction method: auto, custom, raw, custom_bs4, raw_bs4, traf, readability, '
+                   'article_parser, boilerpy3, html2text, newspaper, goose, or one registered by a plugin. '
+                   "auto picks the method per domain from the table written by 'spindle web bench'")
 @click.option('--remove-html/--keep-html', default=True, help='Remove HTML tags from the content')
 @click.option('--remove-whitespace/--keep-whitespace', default=True, help='Remove excess whitespace')
 @click.option('--remove-urls/--keep-urls', default=False, help='Remove URLs from the content')
 @click.option('--min-length', type=int, default=0, help='Minimum line length to keep')
 @click.option('--max-length', type=int, default=None, help='Maximum line length (truncates longer lines)')
 @click.option('--metadata/--no-metadata', default=False, help='Extract and include metadata')
+@click.option('--timeout', type=float, default=30, help='Read timeout in seconds for each request')
+@click.option('--pool-size', type=int, default=10, help='Number of keep-alive connections pooled per host')
+@click.option('--concurrency', '-j', type=int, default=8, help='Maximum number of pages fetched at once')
+@click.option('--per-host', type=int, default=2, help='Maximum number of pages fetched at once from the same host')
+@click.option('--processes', type=int, default=0,
+              help='Number of worker processes used to extract content from many pages, 0 extracts in-process')
+@click.option('--cache/--no-cache', default=True,
+              help='Cache responses and extracted content on disk, responses are revalidated with conditional requests')
+@click.option('--cache-ttl', type=float, default=3600, help='Seconds a cached response is served without revalidation')
+@click.option('--crawl', is_flag=True, help='Crawl the sites of the given URLs, following links that stay on their hosts')
+@click.option('--max-depth', type=int, default=3, help='With --crawl, number of links followed from a start URL')
+@click.option('--max-pages', type=int, default=500, help='With --crawl, maximum number of pages fetched')
+@click.option('--include', multiple=True, help='With --crawl, only follow links matching this regular expression (repeatable)')
+@click.option('--exclude', multiple=True, help='With --crawl, do not follow links matching this regular expression (repeatable)')
+@click.option('--sitemap/--no-sitemap', default=True, help="With --crawl, also fetch the pages listed in each site's sitemap.xml")
+@click.option('--delay', type=float, default=0.25, help='With --crawl, minimum seconds between two requests to the same host')
+@click.option('--checkpoint', type=click.Path(dir_okay=False),
+              help='With --crawl, file the crawl state is saved to, an interrupted crawl resumes from it and '
+                   'appends the remaining pages to a plaintext --output')
 @click.option('--stats', '-s', is_flag=True, help='Print statistics about the web fetcher')
 @click.option('--format', type=click.Choice(['json', 'plaintext']), default='plaintext', help='Output format')
 @click.option('--color', type=click.Choice(['red', 'green', 'blue', 'cyan', 'magenta', 'yellow', 'white']), help='Console output color')
 @click.option('--config', help='Path to the configuration file')
-def web(url: str, output: str, method: str, remove_html: bool, remove_whitespace: bool, remove_urls: bool,
-        min_length: int, max_length: int, metadata: bool, stats: bool, format: str, color: str, config: str):
+def web_fetch(urls: Tuple[str, ...], urls_file, output: str, method: str, remove_html: bool, remove_whitespace: bool,
+        remove_urls: bool, min_length: int, max_length: int, metadata: bool, timeout: float, pool_size: int,
+        concurrency: int, per_host: int, processes: int, cache: bool, cache_ttl: float, crawl: bool, max_depth: int,
+        max_pages: int, include: Tuple[str, ...], exclude: Tuple[str, ...], sitemap: bool, delay: float, checkpoint: str,
+        stats: bool, format: str, color: str, config: str):
     """
-    Parse web content from a given URL and output the processed content.
+    Parse web content from one or more URLs and output the processed content.
+
+    URLs are taken from the arguments, from --urls-file, or from stdin when neither is given.
+    Many URLs are fetched concurrently and each page is written out as soon as it completes.
+    With --crawl, the given URLs are start pages and whole sites are ingested.
+    Run 'spindle web bench' to benchmark the extraction methods for --method auto.
     """
     try:
+        url_list = list(urls)
         # Load configuration if a config file is specified
         if config:
             config_manager = ConfigManager(config)
-            url = config_manager.get('Web', 'url', fallback=url)
+            url = config_manager.get('Web', 'url', fallback=None)
+            if url and not url_list:
+                url_list.append(url)
             output = config_manager.get('Web', 'output_file', fallback=output)
             method = config_manager.get('Web', 'extraction_method', fallback=method)
             remove_html = config_manager.getboolean('Web', 'remove_html', fallback=remove_html)
@@ -40,6 +95,20 @@ def web(url: str, output: str, method: str, remove_html: bool, remove_whitespace
             min_length = config_manager.getint('Web', 'min_length', fallback=min_length)
             max_length = config_manager.getint('Web', 'max_length', fallback=max_length)
             metadata = config_manager.getboolean('Web', 'extract_metadata', fallback=metadata)
+            timeout = config_manager.getfloat('Web', 'timeout', fallback=timeout)
+            pool_size = config_manager.getint('Web', 'pool_size', fallback=pool_size)
+            concurrency = config_manager.getint('Web', 'concurrency', fallback=concurrency)
+            per_host = config_manager.getint('Web', 'per_host', fallback=per_host)
+            cache_ttl = config_manager.getfloat('Web', 'cache_ttl', fallback=cache_ttl)
+            max_depth = config_manager.getint('Web', 'max_depth', fallback=max_depth)
+            max_pages = config_manager.getint('Web', 'max_pages', fallback=max_pages)
+            delay = config_manager.getfloat('Web', 'delay', fallback=delay)
+
+        if method != AUTO_METHOD and method not in extractor_registry.names():
+            raise click.BadParameter(f"Unknown extraction method: {method}", param_hint="'--method'")
+        if crawl and checkpoint and output and format != 'plaintext':
+            # A resumed crawl appends to the output file, which would leave two documents in it
+            raise click.UsageError("--checkpoint with --output needs --format plaintext, a resumed crawl appends to the file.")
 
         # Create and configure the factory
         factory = WebFetcherFactory()
@@ -50,9 +119,33 @@ def web(url: str, output: str, method: str, remove_html: bool, remove_whitespace
         factory.set_default_min_line_length(min_length)
         factory.set_default_max_line_length(max_length)
         factory.set_default_extract_metadata(metadata)
+        factory.set_default_timeout((min(10.0, timeout), timeout))
+        factory.set_default_pool_size(max(pool_size, concurrency))
+        factory.set_default_concurrency(concurrency)
+        factory.set_default_per_host(per_host)
+        factory.set_default_processes(processes)
+        factory.set_default_use_cache(cache)
+        factory.set_default_cache_ttl(cache_ttl)
+        factory.set_default_crawl(crawl)
+        factory.set_default_max_depth(max_depth)
+        factory.set_default_max_pages(max_pages)
+        factory.set_default_include(include)
+        factory.set_default_exclude(exclude)
+        factory.set_default_use_sitemap(sitemap)
+        factory.set_default_delay(delay)
+        factory.set_default_checkpoint_file(checkpoint)
+
+        # Collect the URLs
+        if urls_file:
+            url_list.extend(_read_urls(urls_file))
+        elif not url_list and not sys.stdin.isatty():
+            url_list.extend(_read_urls(sys.stdin))
+        if not url_list:
+            raise click.UsageError("No URL given.")
 
         # Create the fetcher
-        fetcher = factory.create_fetcher()
+        web_fetcher = factory.create_fetcher()
+        fetcher = web_fetcher
         if stats:
             fetcher = TimingFetcherDecorator(fetcher)
 
@@ -60,13 +153,22 @@ def web(url: str, output: str, method: str, remove_html: bool, remove_whitespace
         composite_handler = CompositeHandler()
         if output:
             file_handler = factory.create_handler('file', format, output_file=output)
+            if crawl and checkpoint and os.path.exists(checkpoint):
+                # A resumed crawl only outputs the remaining pages, plaintext ones can be appended
+                file_handler.set_append_mode(True)
             composite_handler.add_handler(file_handler)
         console_handler = factory.create_handler('console', format, color=color)
         composite_handler.add_handler(console_handler)
 
         # Fetch and handle the web content
-        parsed_data = fetcher.fetch(url)
-        composite_handler.handle(parsed_data)
+        composite_handler.handle_stream(fetcher.stream(url_list[0] if len(url_list) == 1 and not crawl else url_list))
+
+        for failed_url, error in web_fetcher.failed.items():
+            click.echo(f"Failed: {failed_url}: {error}", err=True)
+        if stats and web_fetcher.stats:
+            click.echo(err=True)
+            for key, value in web_fetcher.stats.items():
+                click.echo(f"{key}: {value}", err=True)
 
         #click.echo("Web content parsing completed successfully.")
 
@@ -74,5 +176,56 @@ def web(url: str, output: str, method: str, remove_html: bool, remove_whitespace
         click.echo(f"Error: {str(e)}", err=True)
         raise click.Abort()
 
+@click.command(name='bench')
+@click.argument('corpus', type=click.Path(exists=True, file_okay=False))
+@click.option('--methods', help='Comma-separated extraction methods to compare, by default all available methods but raw and raw_bs4')
+@click.option('--repeat', type=int, default=1, help='Runs per page and method, the fastest one is kept')
+@click.option('--output', help='Table file to write, by default the one used by --method auto')
+def web_bench(corpus: str, methods: str, repeat: int, output: str):
+    """
+    Benchmark the extraction methods over a corpus of saved HTML pages.
+
+    Every page of CORPUS is extracted with every method, and the extraction time, output length
+    and quality heuristics are stored in a table. With --method auto, each page is then extracted
+    with the fastest method whose quality is close to the best one for its domain. Pages in a
+    subdirectory count for the domain it is named after, e.g. CORPUS/docs.python.org/index.html;
+    all pages count for the default row.
+    """
+    try:
+        method_list = [name.strip() for name in methods.split(',') if name.strip()] if methods \
+            else [name for name in extractor_registry.available() if name not in ExtractorBenchmark.NOT_BENCHMARKED_BY_DEFAULT]
+        for name in method_list:
+            if not extractor_registry.is_available(name):
+                raise click.BadParameter(f"Extraction method not available: {name}", param_hint="'--methods'")
+
+        pages = ExtractorBenchmark.load_corpus(corpus)
+        if not pages:
+            raise click.UsageError(f"No .html files in {corpus}")
+
+        factory = WebFetcherFactory()
+        benchmark = ExtractorBenchmark.run(pages, method_list, repeat)
+        table_file = output or factory.get_benchmark_file()
+        benchmark.save(table_file)
+
+        for line in benchmark.format_rows():
+            click.echo(line)
+        click.echo(err=True)
+        click.echo(f"Wrote {table_file}", err=True)
+
+    except Exception as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+web.add_command(web_fetch)
+web.add_command(web_bench)
+
+
+def _read_urls(lines) -> List[str]:
+    """
+    Read URLs one per line, skipping blank lines and '#' comments.
+    """
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith('#')]
+
 if __name__ == '__main__':
     web()
@@ -1,13 +1,30 @@
+import configparser
+from typing import Any, Optional
 from spindle.config.environment_config_manager import EnvironmentConfigManager
 from spindle.managers import ModelProviderManager
 
 __All__ = ["ConfigManager"]
 
+# Marks a get() call without fallback, which reads the environment configuration
+_UNSET = object()
+
 
 class ConfigManager:
-    def __init__(self):
+    def __init__(self, config_file: Optional[str] = None):
+        """
+        Initialize the configuration.
+
+        Args:
+            config_file (Optional[str]): An INI file with the options of the CLI commands, as passed to --config.
+
+        Raises:
+            FileNotFoundError: If the configuration file does not exist.
+        """
         self.config_manager = EnvironmentConfigManager()
         self.model_provider_manager = ModelProviderManager()
+        self.file_config = configparser.ConfigParser()
+        if config_file and not self.file_config.read(config_file, encoding='utf-8'):
+            raise FileNotFoundError(f"Configuration file not found: {config_file}")
 
     def get_config(self):
         return self.config_manager
@@ -16,5 +33,48 @@ class ConfigManager:
         return self.model_provider_manager
 
     # TODO: Update the code base for the is quality of life improvement
-    def get(self, key, default=None):
-        return self.config_manager.get(key, default)
+    def get(self, key, default=None, fallback=_UNSET):
+        """
+        Retrieve a configuration value.
+
+        Called as get(key, default), the value is read from the environment configuration.
+        Called as get(section, option, fallback=value), as the CLI commands do, the option is
+        read from the configuration file, and the fallback is returned if it is not set there.
+        """
+        if fallback is _UNSET:
+            return self.config_manager.get(key, default)
+        return self.file_config.get(key, default, fallback=fallback)
+
+    def getint(self, section: str, option: str, fallback: Optional[int] = None) -> Optional[int]:
+        """
+        Read an integer option of the configuration file, or the fallback if it is not set.
+
+        Raises:
+            ValueError: If the value is not an integer.
+        """
+        return self._get_typed(self.file_config.getint, section, option, fallback)
+
+    def getfloat(self, section: str, option: str, fallback: Optional[float] = None) -> Optional[float]:
+        """
+        Read a number option of the configuration file, or the fallback if it is not set.
+
+        Raises:
+            ValueError: If the value is not a number.
+        """
+        return self._get_typed(self.file_config.getfloat, section, option, fallback)
+
+    def getboolean(self, section: str, option: str, fallback: Optional[bool] = None) -> Optional[bool]:
+        """
+        Read a boolean option of the configuration file (true/false, yes/no, on/off, 1/0), or the fallback if it is not set.
+
+        Raises:
+            ValueError: If the value is not a boolean.
+        """
+        return self._get_typed(self.file_config.getboolean, section, option, fallback)
+
+    @staticmethod
+    def _get_typed(getter, section: str, option: str, fallback: Any) -> Any:
+        try:
+            return getter(section, option, fallback=fallback)
+        except ValueError as e:
+            raise ValueError(f"Invalid value for [{section}] {option} in the configuration file: {e}") from e
@@ -47,6 +47,10 @@ class EnvironmentConfigManager(IConfigurationManager):
         """Get the patterns directory path."""
         return os.path.join(self.config_dir, "patterns")
 
+    def get_cache_dir(self) -> str:
+        """Get the cache directory path."""
+        return os.path.join(self.config_dir, "cache")
+
     def get_all(self) -> Dict[str, Any]:
         """Get all configuration key-value pairs."""
         return self.config.copy()
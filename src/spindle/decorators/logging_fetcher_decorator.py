@@ -1,4 +1,5 @@
-from typing import Any, Dict, Type, Callable
+import sys
+from typing import Any, Dict, Iterator, Tuple, Type, Callable
 from spindle.interfaces import IFetcher, IProcessor, IVisitor
 
 __ALL__ = ["LoggingFetcherDecorator", "logging_fetcher_decorator"]
@@ -35,6 +36,21 @@ class LoggingFetcherDecorator(IFetcher):
         print(f"Finished fetching with {self.fetcher.__class__.__name__}")
         return result
 
+    def stream(self, *args: Any, **kwargs: Any) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream the output of the wrapped fetcher with added logging.
+
+        Returns:
+            Iterator[Tuple[str, Any]]: The entries streamed by the wrapped fetcher.
+
+        Side Effects:
+            Prints the start and end of the wrapped fetcher's class name to stderr, so it does not
+            interleave with the streamed output.
+        """
+        print(f"Starting fetching with {self.fetcher.__class__.__name__}", file=sys.stderr)
+        yield from self.fetcher.stream(*args, **kwargs)
+        print(f"Finished fetching with {self.fetcher.__class__.__name__}", file=sys.stderr)
+
     def _fetch_content(self, source: Any) -> Any:
         return self.fetcher._fetch_content(*args, **kwargs)
 
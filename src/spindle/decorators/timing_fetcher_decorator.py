@@ -1,5 +1,6 @@
-from typing import Dict, List, Any, Type, Callable
+from typing import Dict, Iterator, List, Any, Tuple, Type, Callable
 from spindle.interfaces import IFetcher, IProcessor, IVisitor
+import sys
 import time
 
 __All__ = ["TimingFetcherDecorator", "timing_fetcher_decorator"]
@@ -36,6 +37,22 @@ class TimingFetcherDecorator(IFetcher):
         print(f"Parsing with {self.fetcher.__class__.__name__} took {end_time - start_time:.2f} seconds")
         return result
 
+    def stream(self, *args: Any, **kwargs: Any) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream the output of the wrapped fetcher and measure the time until the stream is exhausted.
+
+        Returns:
+            Iterator[Tuple[str, Any]]: The entries streamed by the wrapped fetcher.
+
+        Side Effects:
+            Prints the execution time of the wrapped fetchers's stream method to stderr, so it does not
+            interleave with the streamed output.
+        """
+        start_time = time.time()
+        yield from self.fetcher.stream(*args, **kwargs)
+        end_time = time.time()
+        print(f"Parsing with {self.fetcher.__class__.__name__} took {end_time - start_time:.2f} seconds", file=sys.stderr)
+
     def _fetch_content(self, source: Any) -> Any:
         return self.fetcher._fetch_content(*args, **kwargs)
 
@@ -1,8 +1,10 @@
+import os
 from spindle.abstracts import AbstractFetcherFactory
+from spindle.caches import CodeCache
 from spindle.fetchers import CodeFetcher
-from spindle.processors import CodeProcessor
+from spindle.processors import CodeProcessor, SymbolIndexProcessor
 from spindle.handlers import FileHandler, ConsoleHandler
-from spindle.serializers import ISerializer
+from spindle.interfaces import ISerializer
 from spindle.factories import SerializerFactory
 from spindle.interfaces import IHandler, IFetcher
 from typing import List, Optional
@@ -15,15 +17,35 @@ class CodeFetcherFactory(AbstractFetcherFactory):
         self.default_excluded_dirs = ['venv', '.git', '__pycache__']
         self.default_excluded_files = ['setup.py', 'requirements.txt']
         self.default_file_extensions = ['.py', '.js', '.html', '.css']
+        self.default_jobs = 1
+        self.default_use_cache = True
+        self.default_use_ignore_files = True
+        self.default_max_file_size = 1024 * 1024
+        self.default_sniff = True
+        self.default_mmap_threshold = 256 * 1024
+        self.default_dedupe = False
         self.serializer_factory = SerializerFactory()
 
     def _create_fetcher(self, remove_comments: bool = True, remove_empty_lines: bool = True,
                        trim_lines: bool = True, **kwargs) -> IFetcher:
-        processor = self._create_processor(remove_comments, remove_empty_lines, trim_lines)
+        if kwargs.get('mode', 'source') == 'symbols':
+            processor = self._create_symbol_index_processor()
+        else:
+            processor = self._create_processor(remove_comments, remove_empty_lines, trim_lines)
         return CodeFetcher(processor,
                            self.default_excluded_dirs,
                            self.default_excluded_files,
-                           self.default_file_extensions)
+                           self.default_file_extensions,
+                           kwargs.get('jobs', self.default_jobs),
+                           self.create_cache() if kwargs.get('use_cache', self.default_use_cache) else None,
+                           kwargs.get('use_ignore_files', self.default_use_ignore_files),
+                           kwargs.get('max_tokens'),
+                           kwargs.get('priority', 'recent'),
+                           kwargs.get('include_first'),
+                           kwargs.get('max_file_size', self.default_max_file_size),
+                           kwargs.get('sniff', self.default_sniff),
+                           kwargs.get('mmap_threshold', self.default_mmap_threshold),
+                           kwargs.get('dedupe', self.default_dedupe))
 
     def _create_handler(self, handler_type: str, format: str = 'plaintext', **kwargs) -> IHandler:
         serializer = self.serializer_factory.create_serializer(format)
@@ -41,6 +63,15 @@ class CodeFetcherFactory(AbstractFetcherFactory):
     def _create_processor(self, remove_comments: bool, remove_empty_lines: bool, trim_lines: bool) -> CodeProcessor:
         return CodeProcessor(remove_comments, remove_empty_lines, trim_lines)
 
+    def _create_symbol_index_processor(self) -> SymbolIndexProcessor:
+        return SymbolIndexProcessor()
+
+    def create_cache(self) -> CodeCache:
+        # Imported lazily, the config package imports the factories package
+        from spindle.config import EnvironmentConfigManager
+        cache_dir = EnvironmentConfigManager().get_cache_dir()
+        return CodeCache(os.path.join(cache_dir, 'code.sqlite3'))
+
     def set_default_excluded_dirs(self, dirs: List[str]) -> None:
         self.default_excluded_dirs = dirs
 
@@ -50,6 +81,27 @@ class CodeFetcherFactory(AbstractFetcherFactory):
     def set_default_file_extensions(self, extensions: List[str]) -> None:
         self.default_file_extensions = extensions
 
+    def set_default_jobs(self, jobs: int) -> None:
+        self.default_jobs = jobs
+
+    def set_default_use_cache(self, use_cache: bool) -> None:
+        self.default_use_cache = use_cache
+
+    def set_default_use_ignore_files(self, use_ignore_files: bool) -> None:
+        self.default_use_ignore_files = use_ignore_files
+
+    def set_default_max_file_size(self, max_file_size: Optional[int]) -> None:
+        self.default_max_file_size = max_file_size
+
+    def set_default_sniff(self, sniff: bool) -> None:
+        self.default_sniff = sniff
+
+    def set_default_mmap_threshold(self, mmap_threshold: Optional[int]) -> None:
+        self.default_mmap_threshold = mmap_threshold
+
+    def set_default_dedupe(self, dedupe: bool) -> None:
+        self.default_dedupe = dedupe
+
     def add_excluded_dir(self, dir: str) -> None:
         if dir not in self.default_excluded_dirs:
             self.default_excluded_dirs.append(dir)
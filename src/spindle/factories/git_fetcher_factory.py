@@ -1,12 +1,12 @@
 from spindle.fetchers import GitCommitFetcher
 from spindle.processors import GitCommitProcessor
 from spindle.handlers import FileHandler, ConsoleHandler, CompositeHandler, Color
-from spindle.serializers import ISerializer
+from spindle.interfaces import ISerializer
 from .serializer_factory import SerializerFactory
 from spindle.decorators import TimingFetcherDecorator
 from spindle.abstracts import AbstractFetcherFactory
 from spindle.interfaces import IHandler, IFetcher
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 __All__ = ['GitFetcherFactory']
 
@@ -16,11 +16,13 @@ class GitFetcherFactory(AbstractFetcherFactory):
         self.default_extract_ticket_number = False
         self.default_max_length = -1
         self.default_capitalize_first_word = True
+        self.default_backend = 'log'
+        self.default_fields = ()
         self.serializer_factory = SerializerFactory()
 
     def _create_fetcher(self, stats: bool = False, **kwargs) -> IFetcher:
         processor = self._create_processor(**kwargs)
-        fetcher = GitCommitFetcher(processor)
+        fetcher = GitCommitFetcher(processor, backend=kwargs.get('backend', self.default_backend))
         if stats:
             fetcher = TimingFetcherDecorator(fetcher)
         return fetcher
@@ -50,7 +52,8 @@ class GitFetcherFactory(AbstractFetcherFactory):
         return GitCommitProcessor(
             extract_ticket_number=kwargs.get('extract_ticket_number', self.default_extract_ticket_number),
             max_length=kwargs.get('max_length', self.default_max_length),
-            capitalize_first_word=kwargs.get('capitalize_first_word', self.default_capitalize_first_word)
+            capitalize_first_word=kwargs.get('capitalize_first_word', self.default_capitalize_first_word),
+            fields=kwargs.get('fields', self.default_fields)
         )
 
     def set_default_extract_ticket_number(self, extract: bool) -> None:
@@ -60,4 +63,10 @@ class GitFetcherFactory(AbstractFetcherFactory):
         self.default_max_length = length
 
     def set_default_capitalize_first_word(self, capitalize: bool) -> None:
-        self.default_capitalize_first_word = capitalize
\ No newline at end of file
+        self.default_capitalize_first_word = capitalize
+
+    def set_default_backend(self, backend: str) -> None:
+        self.default_backend = backend
+
+    def set_default_fields(self, fields: Sequence[str]) -> None:
+        self.default_fields = tuple(fields)
@@ -1,11 +1,14 @@
+import os
 from spindle.abstracts import AbstractFetcherFactory
-from spindle.fetchers import WebFetcher
-from spindle.processors import WebProcessor
+from spindle.caches import ContentCache, HttpCache
+from spindle.fetchers import WebCrawler, WebFetcher
+from spindle.processors import AUTO_METHOD, ExtractorBenchmark, WebProcessor
 from spindle.handlers import FileHandler, ConsoleHandler
-from spindle.serializers import ISerializer
+from spindle.interfaces import ISerializer
 from spindle.factories import SerializerFactory
 from spindle.interfaces import IHandler, IFetcher
-from typing import Optional
+from spindle.utils.http_session import HttpSession
+from typing import Iterable, Optional, Tuple, Union
 
 __All__ = ['WebFetcherFactory']
 
@@ -19,11 +22,53 @@ class WebFetcherFactory(AbstractFetcherFactory):
         self.default_min_line_length = 0
         self.default_max_line_length = None
         self.default_extract_metadata = False
+        self.default_pool_size = 10
+        self.default_timeout = (10, 30)
+        self.default_max_retries = 2
+        self.default_concurrency = 8
+        self.default_per_host = 2
+        self.default_processes = 0
+        self.default_use_cache = True
+        self.default_cache_ttl = 3600
+        self.default_cache_max_size = 256 * 1024 * 1024
+        self.default_crawl = False
+        self.default_max_depth = 3
+        self.default_max_pages = 500
+        self.default_include = ()
+        self.default_exclude = ()
+        self.default_use_sitemap = True
+        self.default_delay = 0.25
+        self.default_checkpoint_file = None
         self.serializer_factory = SerializerFactory()
 
     def _create_fetcher(self, **kwargs) -> IFetcher:
+        if kwargs.get('crawl', self.default_crawl):
+            return self.create_crawler(**kwargs)
         processor = self._create_processor(**kwargs)
-        return WebFetcher(processor)
+        return WebFetcher(processor,
+                          self.create_session(**kwargs),
+                          kwargs.get('concurrency', self.default_concurrency),
+                          kwargs.get('per_host', self.default_per_host),
+                          kwargs.get('processes', self.default_processes),
+                          self.create_cache(**kwargs) if kwargs.get('use_cache', self.default_use_cache) else None,
+                          self.create_content_cache() if kwargs.get('use_cache', self.default_use_cache) else None)
+
+    def create_crawler(self, **kwargs) -> WebCrawler:
+        use_cache = kwargs.get('use_cache', self.default_use_cache)
+        return WebCrawler(self._create_processor(**kwargs),
+                          self.create_session(**kwargs),
+                          kwargs.get('concurrency', self.default_concurrency),
+                          kwargs.get('per_host', self.default_per_host),
+                          kwargs.get('processes', self.default_processes),
+                          self.create_cache(**kwargs) if use_cache else None,
+                          self.create_content_cache() if use_cache else None,
+                          max_depth=kwargs.get('max_depth', self.default_max_depth),
+                          max_pages=kwargs.get('max_pages', self.default_max_pages),
+                          include=kwargs.get('include', self.default_include),
+                          exclude=kwargs.get('exclude', self.default_exclude),
+                          use_sitemap=kwargs.get('use_sitemap', self.default_use_sitemap),
+                          delay=kwargs.get('delay', self.default_delay),
+                          checkpoint_file=kwargs.get('checkpoint_file', self.default_checkpoint_file))
 
     def _create_handler(self, handler_type: str, format: str = 'plaintext', **kwargs) -> IHandler:
         serializer = self.serializer_factory.create_serializer(format)
@@ -39,16 +84,47 @@ class WebFetcherFactory(AbstractFetcherFactory):
             raise ValueError(f"Unsupported handler type: {handler_type}")
 
     def _create_processor(self, **kwargs) -> WebProcessor:
+        extraction_method = kwargs.get('extraction_method', self.default_extraction_method)
         return WebProcessor(
-            extraction_method=kwargs.get('extraction_method', self.default_extraction_method),
+            extraction_method=extraction_method,
             remove_html=kwargs.get('remove_html', self.default_remove_html),
             remove_excess_whitespace=kwargs.get('remove_excess_whitespace', self.default_remove_excess_whitespace),
             remove_urls=kwargs.get('remove_urls', self.default_remove_urls),
             min_line_length=kwargs.get('min_line_length', self.default_min_line_length),
             max_line_length=kwargs.get('max_line_length', self.default_max_line_length),
-            extract_metadata=kwargs.get('extract_metadata', self.default_extract_metadata)
+            extract_metadata=kwargs.get('extract_metadata', self.default_extract_metadata),
+            benchmark=self.create_extractor_benchmark() if extraction_method == AUTO_METHOD else None
+        )
+
+    def create_session(self, **kwargs) -> HttpSession:
+        return HttpSession.get_shared(
+            pool_size=kwargs.get('pool_size', self.default_pool_size),
+            timeout=kwargs.get('timeout', self.default_timeout),
+            max_retries=kwargs.get('max_retries', self.default_max_retries)
         )
 
+    def create_cache(self, **kwargs) -> HttpCache:
+        # Imported lazily, the config package imports the factories package
+        from spindle.config import EnvironmentConfigManager
+        cache_dir = EnvironmentConfigManager().get_cache_dir()
+        return HttpCache(os.path.join(cache_dir, 'http.sqlite3'),
+                         ttl=kwargs.get('cache_ttl', self.default_cache_ttl),
+                         max_size=kwargs.get('cache_max_size', self.default_cache_max_size))
+
+    def create_content_cache(self) -> ContentCache:
+        # Imported lazily, the config package imports the factories package
+        from spindle.config import EnvironmentConfigManager
+        cache_dir = EnvironmentConfigManager().get_cache_dir()
+        return ContentCache(os.path.join(cache_dir, 'content.sqlite3'))
+
+    def create_extractor_benchmark(self) -> ExtractorBenchmark:
+        return ExtractorBenchmark.load(self.get_benchmark_file())
+
+    def get_benchmark_file(self) -> str:
+        # Imported lazily, the config package imports the factories package
+        from spindle.config import EnvironmentConfigManager
+        return os.path.join(EnvironmentConfigManager().get_cache_dir(), 'extractor_benchmark.json')
+
     def set_default_extraction_method(self, method: str) -> None:
         self.default_extraction_method = method
 
@@ -68,4 +144,55 @@ class WebFetcherFactory(AbstractFetcherFactory):
         self.default_max_line_length = length
 
     def set_default_extract_metadata(self, extract: bool) -> None:
-        self.default_extract_metadata = extract
\ No newline at end of file
+        self.default_extract_metadata = extract
+
+    def set_default_pool_size(self, pool_size: int) -> None:
+        self.default_pool_size = pool_size
+
+    def set_default_timeout(self, timeout: Union[float, Tuple[float, float]]) -> None:
+        self.default_timeout = timeout
+
+    def set_default_max_retries(self, max_retries: int) -> None:
+        self.default_max_retries = max_retries
+
+    def set_default_concurrency(self, concurrency: int) -> None:
+        self.default_concurrency = concurrency
+
+    def set_default_per_host(self, per_host: int) -> None:
+        self.default_per_host = per_host
+
+    def set_default_processes(self, processes: int) -> None:
+        self.default_processes = processes
+
+    def set_default_use_cache(self, use_cache: bool) -> None:
+        self.default_use_cache = use_cache
+
+    def set_default_cache_ttl(self, ttl: float) -> None:
+        self.default_cache_ttl = ttl
+
+    def set_default_cache_max_size(self, max_size: int) -> None:
+        self.default_cache_max_size = max_size
+
+    def set_default_crawl(self, crawl: bool) -> None:
+        self.default_crawl = crawl
+
+    def set_default_max_depth(self, max_depth: int) -> None:
+        self.default_max_depth = max_depth
+
+    def set_default_max_pages(self, max_pages: int) -> None:
+        self.default_max_pages = max_pages
+
+    def set_default_include(self, patterns: Iterable[str]) -> None:
+        self.default_include = tuple(patterns)
+
+    def set_default_exclude(self, patterns: Iterable[str]) -> None:
+        self.default_exclude = tuple(patterns)
+
+    def set_default_use_sitemap(self, use_sitemap: bool) -> None:
+        self.default_use_sitemap = use_sitemap
+
+    def set_default_delay(self, delay: float) -> None:
+        self.default_delay = delay
+
+    def set_default_checkpoint_file(self, checkpoint_file: Optional[str]) -> None:
+        self.default_checkpoint_file = checkpoint_file
@@ -1,5 +1,6 @@
 from .code_fetcher import *
 from .git_commit_fetcher import *
 from .web_fetcher import *
+from .web_crawler import *
 from .youtube_fetcher import *
 from .stdin_fetcher import *
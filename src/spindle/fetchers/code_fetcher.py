@@ -1,14 +1,258 @@
+import hashlib
 import os
-from typing import Any, Dict, List
+from fnmatch import fnmatch
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from spindle.abstracts import AbstractFetcher
+from spindle.caches import CodeCache
 from spindle.interfaces import IProcessor, IVisitor
+from spindle.utils.concurrency import ordered_map
+from spindle.utils.ignore import IgnoreRules
+from spindle.utils.mapped_file import MappedFile
+from spindle.utils.sniff import sniff_file
+from spindle.utils.tokens import estimate_tokens
 
 class CodeFetcher(AbstractFetcher):
-    def __init__(self, processor: IProcessor, excluded_dirs: List[str], excluded_files: List[str], file_extensions: List[str]):
+    CACHE_WRITE_BATCH = 500
+    IGNORE_FILES = ('.gitignore', '.spindleignore')
+    PRIORITIES = ('recent', 'smallest', 'walk')
+    DUPLICATE_REFERENCE = '[duplicate of {path}]'
+
+    def __init__(self, processor: IProcessor, excluded_dirs: List[str], excluded_files: List[str], file_extensions: List[str],
+                 jobs: int = 1, cache: Optional[CodeCache] = None, use_ignore_files: bool = True,
+                 max_tokens: Optional[int] = None, priority: str = 'recent', include_first: Optional[List[str]] = None,
+                 max_file_size: Optional[int] = None, sniff: bool = False, mmap_threshold: Optional[int] = None,
+                 dedupe: bool = False):
+        if priority not in self.PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority}")
         super().__init__(processor)
         self.excluded_dirs = excluded_dirs
         self.excluded_files = excluded_files
         self.file_extensions = file_extensions
+        self.jobs = max(1, jobs)
+        self.cache = cache
+        self.use_ignore_files = use_ignore_files
+        self.max_tokens = max_tokens
+        self.priority = priority
+        self.include_first = include_first or []
+        self.max_file_size = max_file_size or None
+        self.sniff = sniff
+        self.mmap_threshold = mmap_threshold
+        self.dedupe = dedupe
+        self.stats: Dict[str, Any] = {}
+        self.dropped: List[Dict[str, Any]] = []
+        self.skipped: List[Dict[str, Any]] = []
+        self.duplicates: Dict[str, str] = {}
+
+    def fetch(self, source: str, **kwargs: Any) -> Dict[str, List[str]]:
+        """
+        Fetch and process all valid files from the source directory.
+
+        Args:
+            source (str): The source directory path.
+
+        Returns:
+            Dict[str, List[str]]: A dictionary mapping file paths to their processed lines.
+        """
+        return self._format_output(dict(self.stream(source, **kwargs)))
+
+    def stream(self, source: str, **kwargs: Any) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Fetch and process the valid files one at a time, in walk order.
+
+        Files are read ahead by the worker pool but processed and yielded one by one, so
+        output can be written as soon as the first file is ready. When a cache is configured,
+        files whose modification time and size are unchanged are served from the cache.
+
+        Files larger than max_file_size are skipped before they are opened, and with sniffing enabled
+        files whose first block looks binary or minified are skipped before they are read in full.
+        Skipped files are recorded in `skipped`.
+
+        With deduplication enabled, a file whose processed content equals an earlier file's is
+        replaced by a one-line reference to that file. Duplicates are recorded in `duplicates`.
+
+        When a token budget is set, files are packed by priority instead and only the ones that
+        fit are yielded, still in walk order. The files left out are recorded in `dropped`.
+
+        Args:
+            source (str): The source directory path.
+
+        Returns:
+            Iterator[Tuple[str, List[str]]]: Pairs of file path and processed lines.
+        """
+        self.stats = {}
+        self.dropped = []
+        self.skipped = []
+        self.duplicates = {}
+        if self.max_tokens is None:
+            files = self._stream_files(self._iter_files(source), **kwargs)
+            yield from self._dedupe_files(files) if self.dedupe else files
+        else:
+            yield from self._stream_budgeted(source, **kwargs)
+
+    def _stream_files(self, file_paths: Iterable[str], **kwargs: Any) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Read, process and yield the given files in order, serving unchanged files from the cache.
+
+        The size check runs on the calling thread from the file's stat, the content sniff runs on
+        the workers ahead of the full read. Files of at least mmap_threshold bytes are memory-mapped
+        instead of read, and unmapped once processed.
+
+        Args:
+            file_paths (Iterable[str]): The paths of the files to fetch.
+
+        Returns:
+            Iterator[Tuple[str, List[str]]]: Pairs of file path and processed lines.
+        """
+        options_key = self.cache.make_options_key(self.processor.get_options()) if self.cache else None
+        pending_writes = []
+        hits = misses = 0
+
+        def lookup(paths: Iterable[str]) -> Iterator[Tuple[str, Optional[os.stat_result], Any]]:
+            # Runs on the calling thread, the cache connection is not shared with the workers
+            for file_path in paths:
+                if self.cache is None and self.max_file_size is None:
+                    yield file_path, None, None
+                    continue
+
+                file_stat = os.stat(file_path)
+                if self.max_file_size is not None and file_stat.st_size > self.max_file_size:
+                    self.skipped.append({'path': file_path, 'reason': 'size', 'size': file_stat.st_size})
+                    continue
+                yield file_path, file_stat, self.cache.get(file_path, file_stat, options_key) if self.cache else None
+
+        def load(entry: Tuple[str, Optional[os.stat_result], Any]) -> Tuple[Tuple[str, Any, Any], Optional[str], Optional[str]]:
+            if entry[2] is not None:
+                return entry, None, None
+            reason = sniff_file(entry[0]) if self.sniff else None
+            return entry, None if reason else self._load_file(entry[0], entry[1]), reason
+
+        try:
+            for (file_path, file_stat, cached), content, reason in ordered_map(load, lookup(file_paths), self.jobs):
+                if reason is not None:
+                    self.skipped.append({'path': file_path, 'reason': reason,
+                                         'size': file_stat.st_size if file_stat else os.path.getsize(file_path)})
+                    continue
+                if cached is not None:
+                    hits += 1
+                    yield file_path, cached
+                    continue
+
+                misses += 1
+                try:
+                    lines = self._process_content({file_path: content}, **kwargs)[file_path]
+                finally:
+                    if isinstance(content, MappedFile):
+                        content.close()
+                if self.cache is not None:
+                    pending_writes.append((file_path, file_stat, lines))
+                    if len(pending_writes) >= self.CACHE_WRITE_BATCH:
+                        self.cache.set_many(pending_writes, options_key)
+                        pending_writes = []
+                yield file_path, lines
+        finally:
+            if self.cache is not None:
+                self.cache.set_many(pending_writes, options_key)
+                self.stats['cache_hits'] = hits
+                self.stats['cache_misses'] = misses
+            if self.max_file_size is not None or self.sniff:
+                self.stats['files_skipped'] = len(self.skipped)
+
+    def _stream_budgeted(self, source: str, **kwargs: Any) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Pack the processed files into the token budget by priority and yield the ones that fit.
+
+        Files are processed in priority order and kept greedily: a file that does not fit in
+        the remaining budget is dropped, and smaller files after it may still be kept. Each file
+        costs the tokens of its path and processed lines as written in plaintext output.
+        A duplicate whose original was dropped is dropped as well, so no reference dangles.
+
+        Args:
+            source (str): The source directory path.
+
+        Returns:
+            Iterator[Tuple[str, List[str]]]: Pairs of file path and processed lines, in walk order.
+        """
+        file_paths = list(self._iter_files(source))
+        remaining = self.max_tokens
+        kept: Dict[str, List[str]] = {}
+
+        files = self._stream_files(self._prioritize(source, file_paths), **kwargs)
+        for file_path, lines in self._dedupe_files(files) if self.dedupe else files:
+            tokens = estimate_tokens('\n'.join([file_path] + lines)) + 1
+            original = self.duplicates.get(file_path)
+            if tokens <= remaining and (original is None or original in kept):
+                kept[file_path] = lines
+                remaining -= tokens
+            else:
+                self.dropped.append({'path': file_path, 'tokens': tokens})
+
+        self.stats['tokens'] = self.max_tokens - remaining
+        self.stats['files_kept'] = len(kept)
+        self.stats['files_dropped'] = len(self.dropped)
+
+        for file_path in file_paths:
+            if file_path in kept:
+                yield file_path, kept.pop(file_path)
+
+    def _dedupe_files(self, files: Iterable[Tuple[str, List[str]]]) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Replace files whose processed content was already seen by a reference to the first such file.
+
+        Files are keyed on a BLAKE2 digest of their processed lines. Files shorter than the reference
+        itself, like empty files, are never replaced.
+
+        Args:
+            files (Iterable[Tuple[str, List[str]]]): Pairs of file path and processed lines.
+
+        Returns:
+            Iterator[Tuple[str, List[str]]]: The same pairs, with duplicates replaced by a reference.
+        """
+        seen: Dict[bytes, str] = {}
+        bytes_saved = 0
+        try:
+            for file_path, lines in files:
+                content = '\n'.join(lines).encode('utf-8')
+                original = seen.setdefault(hashlib.blake2b(content, digest_size=16).digest(), file_path)
+                reference = self.DUPLICATE_REFERENCE.format(path=original)
+                if original == file_path or len(content) <= len(reference.encode('utf-8')):
+                    yield file_path, lines
+                    continue
+
+                self.duplicates[file_path] = original
+                bytes_saved += len(content) - len(reference.encode('utf-8'))
+                yield file_path, [reference]
+        finally:
+            self.stats['duplicates'] = len(self.duplicates)
+            self.stats['bytes_saved'] = bytes_saved
+
+    def _prioritize(self, source: str, file_paths: List[str]) -> List[str]:
+        """
+        Order files for budget packing.
+
+        Files matching an include_first pattern, or below a directory it names, come first, in pattern order. The rest follow
+        the configured priority: most recently modified, smallest on disk, or walk order.
+
+        Args:
+            source (str): The source directory path, include_first patterns match paths relative to it.
+            file_paths (List[str]): The paths of the files to order.
+
+        Returns:
+            List[str]: The ordered file paths.
+        """
+        def rank(file_path: str) -> int:
+            rel_path = os.path.relpath(file_path, source).replace(os.sep, '/')
+            for index, pattern in enumerate(self.include_first):
+                if fnmatch(rel_path, pattern) or rel_path.startswith(pattern.rstrip('/') + '/'):
+                    return index
+            return len(self.include_first)
+
+        if self.priority == 'walk':
+            return sorted(file_paths, key=rank)
+
+        stats = {file_path: os.stat(file_path) for file_path in file_paths}
+        if self.priority == 'recent':
+            return sorted(file_paths, key=lambda path: (rank(path), -stats[path].st_mtime_ns))
+        return sorted(file_paths, key=lambda path: (rank(path), stats[path].st_size))
 
     def _fetch_content(self, source: str) -> Dict[str, str]:
         """
@@ -20,15 +264,118 @@ class CodeFetcher(AbstractFetcher):
         Returns:
             Dict[str, str]: A dictionary mapping file paths to their content.
         """
-        content = {}
-        for root, dirs, files in os.walk(source):
-            dirs[:] = [d for d in dirs if self._is_valid_dir(d)]
-            for file in files:
-                if self._is_valid_file(file) and self._is_valid_extension(file):
-                    file_path = os.path.join(root, file)
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content[file_path] = f.read()
-        return content
+        file_paths = list(self._iter_files(source))
+        return dict(zip(file_paths, ordered_map(self._read_file, file_paths, self.jobs)))
+
+    def _iter_files(self, source: str) -> Iterator[str]:
+        """
+        Walk the source directory and yield the paths of all valid files.
+
+        The walk order matches os.walk and is deterministic for a given tree, so the output
+        order does not depend on how many workers are used to read the files.
+
+        Args:
+            source (str): The source directory path.
+
+        Returns:
+            Iterator[str]: The paths of all files that should be fetched.
+        """
+        yield from self._walk(source, '', [])
+
+    def _walk(self, directory: str, rel_dir: str, ignore_stack: List[Tuple[str, IgnoreRules]]) -> Iterator[str]:
+        """
+        Recursively walk a directory with os.scandir, pruning excluded and ignored subtrees before descending.
+
+        Args:
+            directory (str): The directory to walk.
+            rel_dir (str): The directory path relative to the source, with a trailing '/' unless empty.
+            ignore_stack (List[Tuple[str, IgnoreRules]]): The ignore rules in effect, with the relative
+                                                         directory each set of rules applies to.
+
+        Returns:
+            Iterator[str]: The paths of all valid files below the directory.
+        """
+        if self.use_ignore_files:
+            ignore_stack = ignore_stack + [
+                (rel_dir, rules) for rules in (IgnoreRules.from_file(os.path.join(directory, name))
+                                               for name in self.IGNORE_FILES) if rules
+            ]
+
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return
+
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if is_dir:
+                if self._is_valid_dir(name) and not self._is_ignored(ignore_stack, rel_dir + name, True):
+                    subdirs.append(entry)
+            elif self._is_valid_file(name) and self._is_valid_extension(name) and \
+                    not self._is_ignored(ignore_stack, rel_dir + name, False):
+                yield entry.path
+
+        for entry in subdirs:
+            if not entry.is_symlink():
+                yield from self._walk(entry.path, rel_dir + entry.name + '/', ignore_stack)
+
+    def _is_ignored(self, ignore_stack: List[Tuple[str, IgnoreRules]], rel_path: str, is_dir: bool) -> bool:
+        """
+        Check a path against the ignore rules in effect, the deepest matching ignore file wins.
+
+        Args:
+            ignore_stack (List[Tuple[str, IgnoreRules]]): The ignore rules in effect.
+            rel_path (str): The path relative to the source directory.
+            is_dir (bool): Whether the path is a directory.
+
+        Returns:
+            bool: True if the path is ignored, False otherwise.
+        """
+        if self.use_ignore_files and is_dir and rel_path.rpartition('/')[2] == '.git':
+            return True
+        for base, rules in reversed(ignore_stack):
+            ignored = rules.match(rel_path[len(base):], is_dir)
+            if ignored is not None:
+                return ignored
+        return False
+
+    def _load_file(self, file_path: str, file_stat: Optional[os.stat_result] = None) -> Union[str, MappedFile]:
+        """
+        Load a file for processing, memory-mapping it if it is at least mmap_threshold bytes.
+
+        Args:
+            file_path (str): The path of the file to load.
+            file_stat (Optional[os.stat_result]): The file's stat, if it is already known.
+
+        Returns:
+            Union[str, MappedFile]: The file content, or the mapped file. The caller closes a mapped file.
+        """
+        if self.mmap_threshold is not None:
+            size = file_stat.st_size if file_stat is not None else os.path.getsize(file_path)
+            if size and size >= self.mmap_threshold:
+                return MappedFile(file_path)
+        return self._read_file(file_path)
+
+    @staticmethod
+    def _read_file(file_path: str) -> str:
+        """
+        Read the content of a single file.
+
+        Args:
+            file_path (str): The path of the file to read.
+
+        Returns:
+            str: The file content.
+        """
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read()
 
     def _format_output(self, processed_content: Dict[str, List[str]]) -> Dict[str, List[str]]:
         """
@@ -85,4 +432,4 @@ class CodeFetcher(AbstractFetcher):
         Returns:
             bool: True if the file has a valid extension, False otherwise.
         """
-        return any(file.endswith(ext) for ext in self.file_extensions)
\ No newline at end of file
+        return file.endswith(tuple(self.file_extensions))
\ No newline at end of file
@@ -1,16 +1,41 @@
-from typing import Any, Dict, List, Optional, Union
+import itertools
+import string
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 from git import Repo, Commit
+from git.exc import GitCommandError
 from spindle.abstracts import AbstractFetcher
 from spindle.interfaces import IProcessor, IVisitor
+from spindle.utils.git_log import LogCommit, iter_log
 
 __all__ = ['GitCommitFetcher']
 
 
 class GitCommitFetcher(AbstractFetcher):
-    def __init__(self, processor: IProcessor):
+    """
+    Fetch commit messages from a git repository.
+
+    Two backends read the commits: 'log' parses the output of a single git log process while
+    it runs, 'gitpython' reads each commit object through GitPython.
+    """
+    BACKENDS = ('log', 'gitpython')
+    # The shortest hash prefix git rev-parse resolves
+    MIN_ABBREV_LENGTH = 4
+
+    def __init__(self, processor: IProcessor, backend: str = 'log'):
+        """
+        Initialize the fetcher.
+
+        Args:
+            processor (IProcessor): The processor for the commits.
+            backend (str): The backend reading the commits, one of BACKENDS.
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown git backend: {backend}")
         super().__init__(processor)
+        self.backend = backend
 
-    def fetch(self, source: str, start: Optional[int] = None, end: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
+    def fetch(self, source: str, start: Optional[int] = None, end: Optional[int] = None,
+              **filters: Any) -> Dict[str, List[Dict[str, Any]]]:
         """
         Fetch git commit messages from the given repository.
 
@@ -18,49 +43,127 @@ class GitCommitFetcher(AbstractFetcher):
             source (str): Path to the git repository.
             start (Optional[int]): Start index for commit range (inclusive).
             end (Optional[int]): End index for commit range (exclusive).
+            **filters: The commit filters passed to git, see _get_filter_arguments.
 
         Returns:
             Dict[str, List[Dict[str, Any]]]: A dictionary with 'commits' key containing processed commit messages.
         """
-        raw_content = self._fetch_content(source, start, end)
+        raw_content = self._fetch_content(source, start, end, **filters)
         processed_content = self._process_content(raw_content)
         return self._format_output(processed_content)
 
-    def _fetch_content(self, source: str, start: Optional[int] = None, end: Optional[int] = None) -> List[Commit]:
+    def stream(self, source: str, start: Optional[int] = None, end: Optional[int] = None,
+               **filters: Any) -> Iterator[Tuple[str, Iterator[Dict[str, Any]]]]:
+        """
+        Fetch git commit messages as a stream, processing each commit only when it is consumed.
+
+        Args:
+            source (str): Path to the git repository.
+            start (Optional[int]): Start index for commit range (inclusive).
+            end (Optional[int]): End index for commit range (exclusive).
+            **filters: The commit filters passed to git, see _get_filter_arguments.
+
+        Returns:
+            Iterator[Tuple[str, Iterator[Dict[str, Any]]]]: A single 'commits' entry whose value lazily yields processed commits.
+        """
+        commits = iter(self._fetch_content(source, start, end, **filters))
+        # Start the walk before the entry is handed out, so an unknown repository or revision
+        # raises before the handlers write anything
+        first = next(commits, None)
+        if first is not None:
+            commits = itertools.chain([first], commits)
+        yield "commits", (self._process_content([commit])[0] for commit in commits)
+
+    def _fetch_content(self, source: str, start: Optional[int] = None, end: Optional[int] = None,
+                       **filters: Any) -> Iterator[Union[Commit, LogCommit]]:
         """
         Fetch commits from the git repository.
 
+        The range is passed to git as --skip/--max-count and the filters as revision walk
+        options, so git only walks the requested part of the history and selects the commits
+        itself. Commits are yielded as git produces them.
+
         Args:
             source (str): Path to the git repository.
             start (Optional[int]): Start index for commit range (inclusive).
             end (Optional[int]): End index for commit range (exclusive).
+            **filters: The commit filters passed to git, see _get_filter_arguments.
 
         Returns:
-            List[Commit]: A list of git.Commit objects.
+            Iterator[Union[Commit, LogCommit]]: The commits of the range, newest first.
         """
-        repo = Repo(source)
-        commits = list(repo.iter_commits())
-        return self._get_commits_by_range(commits, start, end)
+        revision, paths, options = self._get_filter_arguments(**filters)
+        range_args = self._get_range_arguments(source, start, end, **filters)
+        if range_args is None:
+            return iter(())
+        if self.backend == 'log':
+            # Only the optional fields the processor outputs are collected by git
+            return iter_log(source, [revision], paths=paths, fields=getattr(self.processor, 'fields', ()),
+                            **range_args, **options)
+        return Repo(source).iter_commits(revision, paths, **range_args, **options)
+
+    @staticmethod
+    def _get_filter_arguments(revision: Optional[str] = None, paths: Sequence[str] = (), since: Optional[str] = None,
+                              until: Optional[str] = None,
+                              author: Sequence[str] = ()) -> Tuple[str, List[str], Dict[str, Any]]:
+        """
+        Translate the commit filters into the arguments of git's revision walk.
+
+        Args:
+            revision (Optional[str]): The revision or range to walk, e.g. 'main' or 'v1.0..HEAD'. Defaults to HEAD.
+            paths (Sequence[str]): Only keep commits that change one of these paths.
+            since (Optional[str]): Only keep commits more recent than this date, in any format git accepts,
+                                   e.g. '2024-01-01' or '2 weeks ago'.
+            until (Optional[str]): Only keep commits older than this date.
+            author (Sequence[str]): Only keep commits whose author matches one of these patterns.
+
+        Returns:
+            Tuple[str, List[str], Dict[str, Any]]: The revision, the paths, and the walk options as keyword arguments
+                                                   in the form GitPython passes to git.
 
-    def _get_commits_by_range(self, commits: List[Commit], start: Optional[int] = None, end: Optional[int] = None) -> List[Commit]:
+        Raises:
+            ValueError: If the revision looks like a command line option.
         """
-        Get commits within the specified range.
+        revision = revision or 'HEAD'
+        if revision.startswith('-'):
+            raise ValueError(f"Invalid revision: {revision}")
+        options: Dict[str, Any] = {}
+        if since:
+            options['since'] = since
+        if until:
+            options['until'] = until
+        if author:
+            options['author'] = list(author)
+        return revision, list(paths), options
+
+    def _get_range_arguments(self, source: str, start: Optional[int] = None, end: Optional[int] = None,
+                             **filters: Any) -> Optional[Dict[str, int]]:
+        """
+        Translate a slice of the history into git's skip and max_count arguments.
+
+        The indices follow Python slicing over the filtered commits: negative indices count from
+        the oldest one, which needs the number of commits, and is the only case where it is looked up.
 
         Args:
-            commits (List[Commit]): List of all commits.
+            source (str): Path to the git repository.
             start (Optional[int]): Start index for commit range (inclusive).
             end (Optional[int]): End index for commit range (exclusive).
+            **filters: The commit filters passed to git, see _get_filter_arguments.
 
         Returns:
-            List[Commit]: A list of commits within the specified range.
+            Optional[Dict[str, int]]: The keyword arguments for the backend, or None if the range is empty.
         """
-        if start is not None and end is not None:
-            return commits[start:end]
-        elif start is not None:
-            return commits[start:]
-        elif end is not None:
-            return commits[:end]
-        return commits
+        if (start is not None and start < 0) or (end is not None and end < 0):
+            total = self.get_commit_count(source, **filters)
+            start, end, _ = slice(start, end).indices(total)
+
+        start = start or 0
+        range_args = {'skip': start} if start else {}
+        if end is not None:
+            if end <= start:
+                return None
+            range_args['max_count'] = end - start
+        return range_args
 
     def _format_output(self, processed_content: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -83,23 +186,37 @@ class GitCommitFetcher(AbstractFetcher):
         """
         visitor.visit(self)
 
-    def get_commit_count(self, source: str) -> int:
+    def get_commit_count(self, source: str, **filters: Any) -> int:
         """
         Get the total number of commits in the repository.
 
+        The count comes from git rev-list --count, which walks the history in git itself and
+        reads the commit-graph file when the repository has one (git commit-graph write),
+        without creating a Python object per commit.
+
         Args:
             source (str): Path to the git repository.
+            **filters: The commit filters passed to git, see _get_filter_arguments.
 
         Returns:
-            int: The total number of commits.
+            int: The number of commits reachable from the revision (HEAD by default) that pass the filters,
+                 0 for a repository without commits.
         """
+        revision, paths, options = self._get_filter_arguments(**filters)
         repo = Repo(source)
-        return sum(1 for _ in repo.iter_commits())
+        if not repo.head.is_valid():
+            return 0
+        return int(repo.git.rev_list('--count', revision, '--', *paths, **options))
 
     def get_commit_by_hash(self, source: str, hash_prefix: str) -> Optional[Dict[str, List[Dict[str, Any]]]]:
         """
         Retrieve a specific commit by its hash prefix.
 
+        The prefix is resolved by git rev-parse against the object database, so commits of every
+        branch and tag are found, not only those reachable from HEAD. Git needs at least
+        MIN_ABBREV_LENGTH hex digits to resolve a prefix; shorter prefixes are matched against
+        the hashes listed by git rev-list --all.
+
         Args:
             source (str): Path to the git repository.
             hash_prefix (str): The prefix of the commit hash to search for.
@@ -107,10 +224,49 @@ class GitCommitFetcher(AbstractFetcher):
         Returns:
             Optional[Dict[str, List[Dict[str, Any]]]]: A dictionary containing the commit hash and processed message,
                                                        or None if no matching commit is found.
+
+        Raises:
+            ValueError: If the prefix matches more than one commit.
         """
+        hash_prefix = hash_prefix.strip().lower()
+        if not hash_prefix or not all(char in string.hexdigits for char in hash_prefix):
+            return None
+
         repo = Repo(source)
-        for commit in repo.iter_commits():
-            if commit.hexsha.startswith(hash_prefix):
-                processed_commit = self._process_content([commit])
-                return {commit.hexsha: processed_commit}
-        return None
\ No newline at end of file
+        hexsha = self._resolve_hash_prefix(repo, hash_prefix)
+        if hexsha is None:
+            return None
+        commit = repo.commit(hexsha)
+        processed_commit = self._process_content([commit])
+        return {commit.hexsha: processed_commit}
+
+    def _resolve_hash_prefix(self, repo: Repo, hash_prefix: str) -> Optional[str]:
+        """
+        Resolve a hexadecimal prefix to the full hash of the commit it abbreviates.
+
+        Args:
+            repo (Repo): The repository.
+            hash_prefix (str): The lowercase hash prefix.
+
+        Returns:
+            Optional[str]: The full commit hash, or None if no commit matches.
+
+        Raises:
+            ValueError: If the prefix matches more than one commit.
+        """
+        if len(hash_prefix) < self.MIN_ABBREV_LENGTH:
+            matches = []
+            for hexsha in repo.git.rev_list('--all').splitlines():
+                if hexsha.startswith(hash_prefix) and hexsha not in matches:
+                    matches.append(hexsha)
+                    if len(matches) > 1:
+                        raise ValueError(f"Hash prefix {hash_prefix} is ambiguous: it matches several commits")
+            return matches[0] if matches else None
+
+        try:
+            # ^{commit} makes git only consider commits, and peel an annotated tag to its commit
+            return repo.git.rev_parse('--verify', f'{hash_prefix}^{{commit}}')
+        except GitCommandError as e:
+            if 'ambiguous' in (e.stderr or ''):
+                raise ValueError(f"Hash prefix {hash_prefix} is ambiguous: it matches several commits") from e
+            return None
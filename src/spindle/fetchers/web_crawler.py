@@ -0,0 +1,427 @@
+import json
+import os
+import re
+import time
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from urllib.parse import urlsplit, urlunsplit
+
+from lxml import etree
+
+from spindle.caches import ContentCache, HttpCache
+from spindle.fetchers.web_fetcher import WebFetcher
+from spindle.interfaces import IProcessor
+from spindle.utils.html_text import extract_links
+from spindle.utils.http_session import HttpSession
+
+__all__ = ['WebCrawler']
+
+# Links to these files are not pages and are never queued
+_SKIPPED_EXTENSIONS = frozenset({
+    '.7z', '.avi', '.bz2', '.css', '.dmg', '.doc', '.docx', '.eot', '.exe', '.gif', '.gz', '.ico', '.jpeg', '.jpg',
+    '.js', '.json', '.mov', '.mp3', '.mp4', '.ogg', '.otf', '.pdf', '.png', '.ppt', '.pptx', '.rar', '.rss', '.svg',
+    '.tar', '.tgz', '.ttf', '.wasm', '.wav', '.webm', '.webp', '.woff', '.woff2', '.xls', '.xlsx', '.xml', '.zip',
+})
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+# Nested sitemaps read from a sitemap index, per host
+_MAX_SITEMAPS = 50
+
+
+def _normalize_url(url: str) -> str:
+    """
+    Normalize a URL for deduplication: lower-case scheme and host, no default port, no fragment, '/' for an empty path.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    netloc = host if parts.port in (None, _DEFAULT_PORTS.get(scheme)) else f"{host}:{parts.port}"
+    return urlunsplit((scheme, netloc, parts.path or '/', parts.query, ''))
+
+
+def _host_key(host: str) -> str:
+    return host[4:] if host.startswith('www.') else host
+
+
+class WebCrawler(WebFetcher):
+    """
+    A fetcher that crawls whole sites, starting from one or more URLs.
+
+    Pages are fetched breadth first with the connection pooling, caching and concurrency limits
+    of WebFetcher. The links of every page are followed when they stay on the hosts of the start
+    URLs, match the include and exclude patterns, and are within the depth limit. The URLs of the
+    sites' sitemap.xml are queued as start pages.
+
+    The frontier is bounded: links found while it is full are dropped. Every URL is queued at most
+    once, requests to the same host are spaced by at least `delay` seconds, and the crawl state can
+    be saved to a checkpoint file, so an interrupted crawl resumes where it stopped without
+    fetching the finished pages again.
+    """
+    CHECKPOINT_VERSION = 1
+
+    def __init__(self, processor: IProcessor, session: Optional[HttpSession] = None, concurrency: int = 8,
+                 per_host: int = 2, processes: int = 0, cache: Optional[HttpCache] = None,
+                 content_cache: Optional[ContentCache] = None, max_depth: int = 3, max_pages: int = 500,
+                 include: Iterable[str] = (), exclude: Iterable[str] = (), use_sitemap: bool = True,
+                 delay: float = 0.25, max_frontier: int = 10000, checkpoint_file: Optional[str] = None,
+                 checkpoint_every: int = 20):
+        """
+        Initialize the crawler.
+
+        Args:
+            processor (IProcessor): An instance of a class implementing the IProcessor interface.
+            session (Optional[HttpSession]): The HTTP session to fetch with.
+            concurrency (int): The maximum number of pages fetched at once.
+            per_host (int): The maximum number of pages fetched at once from the same host.
+            processes (int): The number of worker processes used to extract content, 0 extracts in-process.
+            cache (Optional[HttpCache]): The response cache.
+            content_cache (Optional[ContentCache]): The processed content cache.
+            max_depth (int): The number of links followed from a start page. 0 only fetches the start pages.
+            max_pages (int): The maximum number of pages fetched, including failed ones.
+            include (Iterable[str]): Regular expressions, a found link is only followed if it matches one of them.
+            exclude (Iterable[str]): Regular expressions, a found link is not followed if it matches one of them.
+            use_sitemap (bool): Whether to queue the URLs of the sitemap.xml of each start host.
+            delay (float): The minimum number of seconds between two requests to the same host.
+            max_frontier (int): The maximum number of queued URLs.
+            checkpoint_file (Optional[str]): The file the crawl state is saved to and resumed from.
+            checkpoint_every (int): The number of finished pages between two checkpoints.
+        """
+        super().__init__(processor, session, concurrency, per_host, processes, cache, content_cache)
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.include = [re.compile(pattern) for pattern in include]
+        self.exclude = [re.compile(pattern) for pattern in exclude]
+        self.use_sitemap = use_sitemap
+        self.delay = delay
+        self.max_frontier = max_frontier
+        self.checkpoint_file = checkpoint_file
+        self.checkpoint_every = max(1, checkpoint_every)
+
+    def fetch(self, source: Union[str, Iterable[str]], **kwargs: Any) -> Dict[str, List[str]]:
+        """
+        Crawl from the given start URLs and return all pages.
+
+        Args:
+            source (Union[str, Iterable[str]]): The start URL, or URLs.
+
+        Returns:
+            Dict[str, List[str]]: The processed content by page URL.
+        """
+        return dict(self.stream(source, **kwargs))
+
+    def stream(self, source: Union[str, Iterable[str]], **kwargs: Any) -> Iterator[Tuple[str, Any]]:
+        """
+        Crawl from the given start URLs, yielding each page as soon as it is processed.
+
+        Args:
+            source (Union[str, Iterable[str]]): The start URL, or URLs.
+
+        Returns:
+            Iterator[Tuple[str, Any]]: Pairs of page URL and processed content.
+        """
+        self.stats = {}
+        self.cache_stats = Counter()
+        try:
+            yield from self._crawl([source] if isinstance(source, str) else list(source))
+        finally:
+            if self.cache is not None:
+                self.stats.update({f"cache_{key}": self.cache_stats[key] for key in ('fresh', 'revalidated', 'misses')})
+            if self.content_cache is not None:
+                self.stats.update({key: self.cache_stats[key] for key in ('extract_hits', 'extract_misses')})
+
+    def _crawl(self, seeds: List[str]) -> Iterator[Tuple[str, Any]]:
+        """
+        Run the crawl loop.
+
+        URLs wait in one FIFO queue per host. The dispatcher takes the next URL of the first host that
+        is below the per-host limit and whose delay has passed, so a rate-limited host never holds
+        up the others. A URL counts as done once its page is yielded or has failed.
+        """
+        seeds = [_normalize_url(url) for url in seeds]
+        self.hosts = {_host_key(urlsplit(url).hostname or '') for url in seeds}
+        self.failed = {}
+        self.frontier: Dict[str, Deque[Tuple[str, int]]] = {}
+        self.queued = 0
+        self.seen: Set[str] = set()
+        self.done: Set[str] = set()
+        counts = Counter()
+
+        resumed = self._load_checkpoint()
+        if resumed:
+            counts['resumed'] = len(self.done)
+        else:
+            for url in seeds:
+                self._enqueue(url, 0, counts)
+            if self.use_sitemap:
+                for url in self._sitemap_urls(seeds):
+                    if self._allowed(url):
+                        counts['sitemap'] += self._enqueue(url, 0, counts)
+
+        dispatched = len(self.done)
+        in_flight: Counter = Counter()
+        next_request: Dict[str, float] = {}
+        fetches: Dict[Future, Tuple[str, str, int]] = {}
+        extractions: Dict[Future, Tuple[str, Optional[str]]] = {}
+        since_checkpoint = 0
+        handing_out: List[Tuple[str, Optional[str]]] = []
+
+        thread_pool = ThreadPoolExecutor(self.concurrency)
+        process_pool = ProcessPoolExecutor(self.processes) if self.processes > 1 else None
+        try:
+            while True:
+                # Fill the pool with URLs of hosts that are below their limits
+                wake_at = None
+                while len(fetches) < self.concurrency and dispatched < self.max_pages:
+                    entry, wake_at = self._next_url(in_flight, next_request)
+                    if entry is None:
+                        break
+                    host, url, depth = entry
+                    in_flight[host] += 1
+                    next_request[host] = time.monotonic() + self.delay
+                    dispatched += 1
+                    fetches[thread_pool.submit(self._fetch_page, url)] = entry
+
+                if not fetches and not extractions:
+                    if wake_at is None or dispatched >= self.max_pages:
+                        break
+                    time.sleep(max(0.0, wake_at - time.monotonic()))
+                    continue
+
+                timeout = max(0.0, wake_at - time.monotonic()) if wake_at is not None else None
+                done, _ = wait(list(fetches) + list(extractions), timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in fetches:
+                        host, url, depth = fetches.pop(future)
+                        in_flight[host] -= 1
+                        try:
+                            final_url, raw_content = future.result()
+                            page_url = self._resolve_redirect(url, final_url, url in seeds, counts)
+                            if page_url is None:
+                                self.done.add(url)
+                                continue
+                            if page_url != url:
+                                self.done.add(url)
+                                url = page_url
+                            if depth < self.max_depth:
+                                self._follow_links(raw_content, url, depth, counts)
+                            if process_pool is None:
+                                processed_content = self._process_content(raw_content, url=url)
+                            else:
+                                content_key, processed_content = self._lookup_processed(raw_content, url)
+                                if processed_content is None:
+                                    submitted = process_pool.submit(self.processor.process, raw_content, url=url)
+                                    extractions[submitted] = (url, content_key)
+                                    continue
+                        except Exception as e:
+                            self._record_failure(url, e)
+                            self.done.add(url)
+                            continue
+                    else:
+                        url, content_key = extractions.pop(future)
+                        try:
+                            processed_content = future.result()
+                            self._store_processed(content_key, processed_content, url)
+                        except Exception as e:
+                            self._record_failure(url, e)
+                            self.done.add(url)
+                            continue
+
+                    # A page is only done once the consumer asks for the next one, so a page that
+                    # was being written out when the crawl was interrupted is fetched again
+                    handing_out = [(url, None)]
+                    yield url, self._format_output(processed_content)['web_content']
+                    handing_out = []
+                    self.done.add(url)
+                    counts['pages'] += 1
+
+                    since_checkpoint += 1
+                    if since_checkpoint >= self.checkpoint_every:
+                        self._save_checkpoint(fetches.values(), extractions.values())
+                        since_checkpoint = 0
+        finally:
+            thread_pool.shutdown(wait=False, cancel_futures=True)
+            if process_pool is not None:
+                process_pool.shutdown(wait=False, cancel_futures=True)
+            self._save_checkpoint(fetches.values(), list(extractions.values()) + handing_out)
+            self.stats.update({'pages': counts['pages'], 'failed': len(self.failed), 'queued': self.queued})
+            self.stats.update({key: counts[key] for key in ('sitemap', 'filtered', 'duplicates', 'frontier_full', 'resumed') if counts[key]})
+
+    def _next_url(self, in_flight: Counter, next_request: Dict[str, float]) -> Tuple[Optional[Tuple[str, str, int]], Optional[float]]:
+        """
+        Take the next URL that can be fetched now.
+
+        Returns:
+            The host, URL and depth of the next URL, or None, and the time at which a host that
+            is only held back by its delay can be fetched again.
+        """
+        now = time.monotonic()
+        wake_at = None
+        for host, queue in self.frontier.items():
+            if in_flight[host] >= self.per_host:
+                continue
+            ready_at = next_request.get(host, 0.0)
+            if ready_at > now:
+                wake_at = ready_at if wake_at is None else min(wake_at, ready_at)
+                continue
+            url, depth = queue.popleft()
+            self.queued -= 1
+            if not queue:
+                del self.frontier[host]
+            return (host, url, depth), None
+        return None, wake_at
+
+    def _enqueue(self, url: str, depth: int, counts: Counter) -> bool:
+        """
+        Queue a URL unless it was seen before or the frontier is full.
+
+        Returns:
+            bool: True if the URL was queued.
+        """
+        if url in self.seen:
+            return False
+        if self.queued >= self.max_frontier:
+            counts['frontier_full'] += 1
+            return False
+        self.seen.add(url)
+        self.frontier.setdefault(urlsplit(url).netloc, deque()).append((url, depth))
+        self.queued += 1
+        return True
+
+    def _allowed(self, url: str) -> bool:
+        """
+        Check whether a found URL is on a start host, is not a file download, and passes the include/exclude patterns.
+        """
+        parts = urlsplit(url)
+        if _host_key(parts.hostname or '') not in self.hosts:
+            return False
+        if os.path.splitext(parts.path)[1].lower() in _SKIPPED_EXTENSIONS:
+            return False
+        if self.include and not any(pattern.search(url) for pattern in self.include):
+            return False
+        return not any(pattern.search(url) for pattern in self.exclude)
+
+    def _resolve_redirect(self, url: str, final_url: str, is_seed: bool, counts: Counter) -> Optional[str]:
+        """
+        Decide which URL a fetched page is crawled as when its request was redirected.
+
+        The page is crawled as the URL it was served from, so its relative links resolve against
+        that URL. A start URL may redirect to another host, which then counts as a start host;
+        any other redirect target has to pass the same checks as a found link. A page whose final
+        URL was already crawled, or is queued, is a duplicate.
+
+        Returns:
+            Optional[str]: The URL of the page, or None if it is skipped.
+        """
+        final_url = _normalize_url(final_url)
+        if final_url == url:
+            return url
+        if is_seed:
+            self.hosts.add(_host_key(urlsplit(final_url).hostname or ''))
+        elif not self._allowed(final_url):
+            counts['filtered'] += 1
+            self.seen.add(final_url)
+            return None
+        if final_url in self.seen:
+            counts['duplicates'] += 1
+            return None
+        self.seen.add(final_url)
+        return final_url
+
+    def _follow_links(self, content: str, url: str, depth: int, counts: Counter) -> None:
+        for link in extract_links(content, url):
+            link = _normalize_url(link)
+            if link in self.seen:
+                continue
+            if not self._allowed(link):
+                counts['filtered'] += 1
+                self.seen.add(link)
+                continue
+            self._enqueue(link, depth + 1, counts)
+
+    def _sitemap_urls(self, seeds: List[str]) -> List[str]:
+        """
+        Read the page URLs of the sitemap.xml of each start host, following sitemap indexes.
+        """
+        pending = list(dict.fromkeys(f"{parts.scheme}://{parts.netloc}/sitemap.xml"
+                                     for parts in (urlsplit(url) for url in seeds)))
+        urls: List[str] = []
+        read = 0
+        while pending and read < _MAX_SITEMAPS * len(self.hosts):
+            sitemap_url = pending.pop(0)
+            read += 1
+            try:
+                response = self.session.get(sitemap_url)
+                response.raise_for_status()
+                root = etree.fromstring(response.content, etree.XMLParser(resolve_entities=False, no_network=True))
+            except Exception as e:
+                self.logger.info(f"No sitemap at {sitemap_url}: {e}")
+                continue
+
+            locations = [element.text.strip() for element in root.iter('{*}loc') if element.text]
+            if etree.QName(root).localname == 'sitemapindex':
+                pending.extend(location for location in locations
+                               if _host_key(urlsplit(location).hostname or '') in self.hosts)
+            else:
+                urls.extend(_normalize_url(location) for location in locations)
+        return urls
+
+    def _load_checkpoint(self) -> bool:
+        """
+        Restore the crawl state from the checkpoint file, if there is one.
+
+        Returns:
+            bool: True if a crawl was resumed.
+        """
+        if not self.checkpoint_file or not os.path.exists(self.checkpoint_file):
+            return False
+        try:
+            with open(self.checkpoint_file, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable checkpoint {self.checkpoint_file}: {e}")
+            return False
+        if state.get('version') != self.CHECKPOINT_VERSION:
+            return False
+
+        self.done = set(state['done'])
+        self.failed = dict(state.get('failed', {}))
+        self.hosts.update(state.get('hosts', []))
+        self.seen = set(self.done)
+        counts = Counter()
+        for url, depth in state['frontier']:
+            self._enqueue(url, depth, counts)
+        return True
+
+    def _save_checkpoint(self, fetching: Iterable[Tuple[str, str, int]], extracting: Iterable[Tuple[str, Optional[str]]]) -> None:
+        """
+        Write the crawl state to the checkpoint file.
+
+        Pages that are being fetched or extracted are saved as queued, so they are fetched again on resume.
+        Once nothing is left to fetch, the checkpoint file is removed.
+        """
+        if not self.checkpoint_file:
+            return
+        fetching, extracting = list(fetching), list(extracting)
+        if not fetching and not extracting and not self.frontier:
+            # The crawl is complete, a new run starts over
+            if os.path.exists(self.checkpoint_file):
+                os.remove(self.checkpoint_file)
+            return
+        depths = {url: depth for _, url, depth in fetching}
+        frontier = [[url, depth] for url, depth in depths.items()]
+        # The depth of a page being extracted is no longer known, its links were already followed
+        frontier += [[url, self.max_depth] for url, _ in extracting]
+        frontier += [[url, depth] for queue in self.frontier.values() for url, depth in queue]
+        state = {
+            'version': self.CHECKPOINT_VERSION,
+            'hosts': sorted(self.hosts),
+            'done': sorted(self.done),
+            'failed': self.failed,
+            'frontier': frontier,
+        }
+        directory = os.path.dirname(os.path.abspath(self.checkpoint_file))
+        os.makedirs(directory, exist_ok=True)
+        temporary = f"{self.checkpoint_file}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(temporary, self.checkpoint_file)
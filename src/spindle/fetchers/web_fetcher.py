@@ -1,7 +1,13 @@
-import cloudscraper
-from typing import Any, Dict, List
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
 from spindle.abstracts import AbstractFetcher
+from spindle.caches import ContentCache, HttpCache
 from spindle.interfaces import IProcessor
+from spindle.utils.http_session import HttpSession
 
 __All__ = ['WebFetcher']
 
@@ -13,16 +19,39 @@ class WebFetcher(AbstractFetcher):
     This class provides functionality to fetch, process, and format web content.
     """
 
-    def __init__(self, processor: IProcessor):
+    def __init__(self, processor: IProcessor, session: Optional[HttpSession] = None, concurrency: int = 8,
+                 per_host: int = 2, processes: int = 0, cache: Optional[HttpCache] = None,
+                 content_cache: Optional[ContentCache] = None):
         """
         Initialize the WebParser with a processor.
 
         Args:
             processor (IProcessor): An instance of a class implementing the IProcessor interface.
+            session (Optional[HttpSession]): The HTTP session to fetch with. Defaults to the process-wide
+                                             shared session, so connections are reused across fetchers.
+            concurrency (int): The maximum number of pages fetched at once when streaming many URLs.
+            per_host (int): The maximum number of pages fetched at once from the same host.
+            processes (int): The number of worker processes used to extract content when streaming
+                             many URLs. With 0 or 1, content is extracted in the calling process.
+            cache (Optional[HttpCache]): The response cache. Fresh entries are served without a request,
+                                         stale entries are revalidated with a conditional request.
+            content_cache (Optional[ContentCache]): The processed content cache, keyed by a hash of the page
+                                                    and the processor options, so extraction is skipped for
+                                                    pages that were already processed with the same settings.
         """
 
         super().__init__(processor)
-        self.scraper = cloudscraper.create_scraper()
+        self.session = session or HttpSession.get_shared()
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.processes = processes
+        self.cache = cache
+        self.content_cache = content_cache
+        self.cache_stats: Counter = Counter()
+        self.cache_stats_lock = threading.Lock()
+        self.failed: Dict[str, str] = {}
+        self.stats: Dict[str, Any] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
 
     def fetch(self, source: str, **kwargs: Any) -> Dict[str, List[str]]:
         """
@@ -36,9 +65,125 @@ class WebFetcher(AbstractFetcher):
         """
 
         raw_content = self._fetch_content(source)
-        processed_content = self._process_content(raw_content)
+        processed_content = self._process_content(raw_content, url=source)
         return self._format_output(processed_content)
 
+    def stream(self, source: Union[str, Iterable[str]], **kwargs: Any) -> Iterator[Tuple[str, Any]]:
+        """
+        Fetch web content from a single URL, or from many URLs concurrently.
+
+        A single URL yields the same 'web_content' entry as fetch. For many URLs, pages are
+        fetched by a thread pool within the global and per-host limits, content is extracted
+        in a process pool if one is configured, and each page is yielded as soon as it is done,
+        keyed by its URL. Pages that fail are logged and recorded in `failed`.
+
+        Args:
+            source (Union[str, Iterable[str]]): The URL, or the URLs, to fetch.
+
+        Returns:
+            Iterator[Tuple[str, Any]]: Pairs of key and processed content, in completion order for many URLs.
+        """
+        self.stats = {}
+        self.cache_stats = Counter()
+        try:
+            if isinstance(source, str):
+                yield from super().stream(source, **kwargs)
+            else:
+                yield from self._stream_many(source)
+        finally:
+            if self.cache is not None:
+                self.stats.update({f"cache_{key}": self.cache_stats[key] for key in ('fresh', 'revalidated', 'misses')})
+            if self.content_cache is not None:
+                self.stats.update({key: self.cache_stats[key] for key in ('extract_hits', 'extract_misses')})
+
+    def _stream_many(self, urls: Iterable[str]) -> Iterator[Tuple[str, Any]]:
+        """
+        Fetch and process many URLs concurrently, yielding each page as it completes.
+
+        URLs are dispatched from the calling thread: the next URL is the first one, in input order,
+        whose host is below the per-host limit. Workers therefore never block waiting for a host,
+        and one slow host cannot occupy the whole pool.
+
+        Args:
+            urls (Iterable[str]): The URLs to fetch. Duplicates are fetched once.
+
+        Returns:
+            Iterator[Tuple[str, Any]]: Pairs of URL and processed content.
+        """
+        self.failed = {}
+        pending: Dict[str, List[str]] = {}
+        for url in dict.fromkeys(urls):
+            pending.setdefault(urlsplit(url).netloc.lower(), []).append(url)
+        for queue in pending.values():
+            queue.reverse()
+
+        in_flight: Counter = Counter()
+        fetches: Dict[Future, Tuple[str, str]] = {}
+        extractions: Dict[Future, Tuple[str, Optional[str]]] = {}
+        completed = 0
+
+        def next_url() -> Optional[Tuple[str, str]]:
+            for host, queue in pending.items():
+                if in_flight[host] < self.per_host:
+                    url = queue.pop()
+                    if not queue:
+                        del pending[host]
+                    return host, url
+            return None
+
+        thread_pool = ThreadPoolExecutor(self.concurrency)
+        process_pool = ProcessPoolExecutor(self.processes) if self.processes > 1 else None
+        try:
+            while True:
+                while len(fetches) < self.concurrency:
+                    entry = next_url()
+                    if entry is None:
+                        break
+                    in_flight[entry[0]] += 1
+                    fetches[thread_pool.submit(self._fetch_content, entry[1])] = entry
+
+                if not fetches and not extractions:
+                    break
+
+                done, _ = wait(list(fetches) + list(extractions), return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in fetches:
+                        host, url = fetches.pop(future)
+                        in_flight[host] -= 1
+                        try:
+                            raw_content = future.result()
+                            if process_pool is None:
+                                processed_content = self._process_content(raw_content, url=url)
+                            else:
+                                content_key, processed_content = self._lookup_processed(raw_content, url)
+                                if processed_content is None:
+                                    submitted = process_pool.submit(self.processor.process, raw_content, url=url)
+                                    extractions[submitted] = (url, content_key)
+                                    continue
+                        except Exception as e:
+                            self._record_failure(url, e)
+                            continue
+                    else:
+                        url, content_key = extractions.pop(future)
+                        try:
+                            processed_content = future.result()
+                            self._store_processed(content_key, processed_content, url)
+                        except Exception as e:
+                            self._record_failure(url, e)
+                            continue
+
+                    completed += 1
+                    yield url, self._format_output(processed_content)['web_content']
+        finally:
+            thread_pool.shutdown(wait=False, cancel_futures=True)
+            if process_pool is not None:
+                process_pool.shutdown(wait=False, cancel_futures=True)
+            self.stats.update({'pages': completed, 'failed': len(self.failed)})
+
+    def _record_failure(self, url: str, error: Exception) -> None:
+        self.failed[url] = str(error)
+        self.logger.info(f"Failed to fetch {url}: {error}")
+
     def _fetch_content(self, url: str, **kwargs: Any) -> str:
         """
         Fetch raw content from a given URL.
@@ -52,10 +197,58 @@ class WebFetcher(AbstractFetcher):
         Raises:
             requests.HTTPError: If the HTTP request fails.
         """
+        return self._fetch_page(url)[1]
+
+    def _fetch_page(self, url: str) -> Tuple[str, str]:
+        """
+        Fetch a page, returning the URL it was served from after redirects together with its content.
+
+        With a cache, a fresh cached body is returned without a request. A stale one is revalidated
+        with If-None-Match/If-Modified-Since, and a 304 response only restarts its TTL.
+
+        Args:
+            url (str): The URL to fetch.
+
+        Returns:
+            Tuple[str, str]: The final URL and the raw content of the web page.
+
+        Raises:
+            requests.HTTPError: If the HTTP request fails.
+        """
+
+        if self.cache is None:
+            response = self.session.get(url)
+            response.raise_for_status()
+            return response.url or url, response.text
+
+        entry = self.cache.get(url)
+        if entry is not None and self.cache.is_fresh(entry):
+            self._count_cache('fresh')
+            return entry.final_url or url, entry.body
+
+        headers = {}
+        if entry is not None and entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+
+        response = self.session.get(url, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            self.cache.touch(url)
+            self._count_cache('revalidated')
+            return entry.final_url or response.url or url, entry.body
 
-        response = self.scraper.get(url)
         response.raise_for_status()
-        return response.text
+        self._count_cache('misses')
+        if 'no-store' not in response.headers.get('Cache-Control', ''):
+            self.cache.set(url, response.text, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                           response.url)
+        return response.url or url, response.text
+
+    def _count_cache(self, key: str) -> None:
+        # Called from the fetch threads
+        with self.cache_stats_lock:
+            self.cache_stats[key] += 1
 
     def _process_content(self, content: str, **kwargs: Any) -> Any:
         """
@@ -63,12 +256,44 @@ class WebFetcher(AbstractFetcher):
 
         Args:
             content (str): The raw content to process.
+            url (str, optional): The URL of the page, passed on to the processor.
 
         Returns:
             Any: The processed content, type depends on the processor implementation.
         """
 
-        return self.processor.process(content)
+        url = kwargs.get('url')
+        content_key, processed_content = self._lookup_processed(content, url)
+        if processed_content is None:
+            processed_content = self.processor.process(content, url=url)
+            self._store_processed(content_key, processed_content, url)
+        return processed_content
+
+    def _lookup_processed(self, content: str, url: Optional[str] = None) -> Tuple[Optional[str], Optional[Any]]:
+        """
+        Look up the processed content of a page in the content cache.
+
+        Args:
+            content (str): The raw content of the page.
+            url (Optional[str]): The URL of the page, which can decide the processor options.
+
+        Returns:
+            Tuple[Optional[str], Optional[Any]]: The content key, and the cached processed content or None.
+                                                 The key is None when there is no content cache.
+        """
+        if self.content_cache is None:
+            return None, None
+        content_key = self.content_cache.make_content_key(content)
+        processed_content = self.content_cache.get(content_key, self._options_key(url))
+        self._count_cache('extract_hits' if processed_content is not None else 'extract_misses')
+        return content_key, processed_content
+
+    def _store_processed(self, content_key: Optional[str], processed_content: Any, url: Optional[str] = None) -> None:
+        if self.content_cache is not None and content_key is not None:
+            self.content_cache.set(content_key, self._options_key(url), processed_content)
+
+    def _options_key(self, url: Optional[str] = None) -> str:
+        return self.content_cache.make_options_key(self.processor.get_options(url))
 
     def _format_output(self, processed_content: Any, **kwargs: Any) -> Dict[str, List[str]]:
         """
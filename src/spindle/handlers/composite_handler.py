@@ -1,5 +1,7 @@
 import logging
-from typing import List, Dict, Any, Union
+from collections import deque
+from collections.abc import Iterator
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
 from spindle.interfaces import ISerializer
 from spindle.exceptions import HandlerException
 from spindle.abstracts import AbstractHandler
@@ -62,6 +64,123 @@ class CompositeHandler(AbstractHandler):
                 # Optionally, re-raise the exception if you want to stop processing
                 # raise HandlerException(f"Error in handler {handler.__class__.__name__}: {str(e)}") from e
 
+    def handle_stream(self, items: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Stream the items to all contained handlers in a single pass.
+
+        Each item is serialized by every handler's own serializer as it arrives, so the
+        stream is never buffered as a whole. A value that is an iterator is shared element by
+        element: the handlers take turns writing a chunk, and an element is only kept until
+        every handler has consumed it. A handler that fails is logged and dropped while the
+        others keep writing. An error of the stream itself is raised once the outputs are closed.
+
+        Args:
+            items (Iterable[Tuple[str, Any]]): The key/value pairs to handle.
+        """
+        if not self.handlers:
+            raise HandlerException("No handlers available in the composite.")
+
+        items = self.start_stream(items)
+        active = list(self.handlers)
+        opened: List[AbstractHandler] = []
+
+        def start(handler: AbstractHandler) -> None:
+            handler.open_stream()
+            opened.append(handler)
+            handler.write_chunk(handler.serializer.stream_start())
+
+        try:
+            self._for_each(active, start)
+            count = 0
+            for index, (key, value) in enumerate(items):
+                if isinstance(value, Iterator) and len(active) > 1:
+                    self._write_shared_item(active, key, value, index)
+                else:
+                    self._for_each(active, lambda handler: self._write_item(handler, key, value, index))
+                count = index + 1
+
+            def finish(handler: AbstractHandler) -> None:
+                total = count
+                for key, value in handler.preprocess({}).items():
+                    self._write_item(handler, key, value, total)
+                    total += 1
+                handler.write_chunk(handler.serializer.stream_end(total))
+
+            self._for_each(active, finish)
+        finally:
+            for handler in opened:
+                try:
+                    handler.close_stream()
+                except Exception as e:
+                    self.logger.error(f"Error in handler {handler.__class__.__name__}: {str(e)}")
+
+    @staticmethod
+    def _write_item(handler: AbstractHandler, key: str, value: Any, index: int) -> None:
+        for chunk in handler.serializer.encode_item(key, value, index):
+            handler.write_chunk(chunk)
+
+    def _write_shared_item(self, active: List[AbstractHandler], key: str, value: Iterator, index: int) -> None:
+        """
+        Write a pair whose value is an iterator with every active handler, consuming the iterator once.
+
+        Each handler's serializer reads the elements from its own queue. When a queue is empty,
+        the next element is pulled from the iterator and appended to the queues of all handlers.
+        The handlers take turns writing one chunk each, so no queue runs ahead of the others by
+        more than the elements of a chunk.
+        """
+        queues = {id(handler): deque() for handler in active}
+        source_error: List[BaseException] = []
+        exhausted = False
+
+        def elements(queue: deque) -> Iterator[Any]:
+            nonlocal exhausted
+            while True:
+                if queue:
+                    yield queue.popleft()
+                    continue
+                if exhausted:
+                    return
+                try:
+                    element = next(value)
+                except StopIteration:
+                    exhausted = True
+                    return
+                except Exception as e:
+                    # Raised by the driver below, so no serializer wraps or swallows it
+                    source_error.append(e)
+                    exhausted = True
+                    return
+                for other in queues.values():
+                    other.append(element)
+
+        chunks = {id(handler): handler.serializer.encode_item(key, elements(queues[id(handler)]), index)
+                  for handler in active}
+        writing = list(active)
+        while writing:
+            for handler in list(writing):
+                try:
+                    chunk = next(chunks[id(handler)], None)
+                    if chunk is None:
+                        writing.remove(handler)
+                        queues.pop(id(handler))
+                    else:
+                        handler.write_chunk(chunk)
+                except Exception as e:
+                    self.logger.error(f"Error in handler {handler.__class__.__name__}: {str(e)}")
+                    writing.remove(handler)
+                    active.remove(handler)
+                    queues.pop(id(handler))
+                if source_error:
+                    raise source_error[0]
+
+    def _for_each(self, active: List[AbstractHandler], action: Callable[[AbstractHandler], Any]) -> None:
+        for handler in list(active):
+            try:
+                action(handler)
+            except Exception as e:
+                self.logger.error(f"Error in handler {handler.__class__.__name__}: {str(e)}")
+                active.remove(handler)
+
     def write(self, data: str) -> None:
         """
         Write the data using all contained handlers.
@@ -2,7 +2,8 @@ import sys
 from typing import Dict, Any, Union
 from enum import Enum
 import logging
-from spindle.serializers import ISerializer, SerializationException
+from spindle.interfaces import ISerializer
+from spindle.exceptions import SerializationException
 from spindle.abstracts import AbstractHandler
 
 __All__ = ["Color", "ConsoleHandler"]
@@ -79,6 +80,35 @@ class ConsoleHandler(AbstractHandler):
             self.logger.error(f"Error handling data: {e}")
             raise
 
+    def open_stream(self) -> None:
+        """
+        Start writing a stream of chunks to the console.
+        """
+        self._output_stream = sys.stderr if self.use_stderr else sys.stdout
+        self._line_start = f"{self.prefix}{' ' * self.indent}"
+        self._first_chunk = True
+        if self.color:
+            print(self.color.value, file=self._output_stream, end='')
+
+    def write_chunk(self, chunk: str) -> None:
+        """
+        Write a single chunk, applying the same indentation and prefix as _format_output.
+        """
+        formatted_chunk = chunk.replace('\n', '\n' + self._line_start)
+        if self._first_chunk:
+            formatted_chunk = self._line_start + formatted_chunk
+            self._first_chunk = False
+        print(formatted_chunk, file=self._output_stream, end='')
+
+    def close_stream(self) -> None:
+        """
+        Finish the stream, resetting the color and flushing the console.
+        """
+        if self.color:
+            print(Color.RESET.value, file=self._output_stream, end='')
+        self._output_stream.flush()
+        self.logger.debug("Stream successfully written to console")
+
     def _format_output(self, data: str) -> str:
         """
         Apply indentation and prefix to the output.
@@ -1,7 +1,8 @@
 import os
 import logging
 from typing import Dict, Any, Union
-from spindle.serializers import ISerializer, SerializationException
+from spindle.interfaces import ISerializer
+from spindle.exceptions import SerializationException
 from spindle.abstracts import AbstractHandler
 
 __All__ = ["FileHandler"]
@@ -32,7 +33,7 @@ class FileHandler(AbstractHandler):
         try:
             # Ensure the directory exists
             if self.create_dirs:
-                os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
+                os.makedirs(os.path.dirname(self.output_file) or '.', exist_ok=True)
 
             # Determine the write mode
             mode = 'a' if self.append else 'w'
@@ -71,6 +72,32 @@ class FileHandler(AbstractHandler):
             self.logger.error(f"Error handling data: {e}")
             raise
 
+    def open_stream(self) -> None:
+        """
+        Open the output file for a stream of chunks.
+        """
+        if self.create_dirs:
+            os.makedirs(os.path.dirname(self.output_file) or '.', exist_ok=True)
+        self._stream_file = open(self.output_file, 'a' if self.append else 'w', encoding='utf-8')
+        self._ends_with_newline = False
+
+    def write_chunk(self, chunk: str) -> None:
+        """
+        Write a single chunk to the output file.
+        """
+        if chunk:
+            self._stream_file.write(chunk)
+            self._ends_with_newline = chunk.endswith('\n')
+
+    def close_stream(self) -> None:
+        """
+        Close the output file, making sure the data ends with a newline.
+        """
+        if not self._ends_with_newline:
+            self._stream_file.write('\n')
+        self._stream_file.close()
+        self.logger.info(f"Data successfully written to {self.output_file}")
+
     def set_append_mode(self, append: bool) -> None:
         """
         Set whether to append to the file or overwrite it.
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 from .visitable_interface import IVisitable
 from .visitor_interface import IVisitor
 
@@ -28,6 +28,20 @@ class IFetcher(IVisitable):
         """
         pass
 
+    @abstractmethod
+    def stream(self, *args: Any, **kwargs: Any) -> Iterator[Tuple[str, Any]]:
+        """
+        Fetch content from the given source as a stream of key/value pairs.
+
+        Args:
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            Iterator[Tuple[str, Any]]: The fetched content, one output entry at a time.
+        """
+        pass
+
     @abstractmethod
     def _fetch_content(self, *args: Any, **kwargs: Any) -> Any:
         """
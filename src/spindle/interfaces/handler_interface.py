@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any
+from typing import Any, Dict, Iterable, List, Tuple
 
 __All__ = ["IHandler"]
 
@@ -28,6 +28,16 @@ class IHandler(ABC):
         """
         pass
 
+    @abstractmethod
+    def handle_stream(self, items: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Handles a stream of key/value pairs, writing output as each pair arrives.
+
+        Args:
+            items (Iterable[Tuple[str, Any]]): The key/value pairs to handle, in output order.
+        """
+        pass
+
     @abstractmethod
     def write(self, data: str) -> None:
         """Write the data to the output destination."""
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Any, Dict, Iterable, Iterator, Tuple
 
 __All__ = ["ISerializer"]
 
@@ -10,6 +10,11 @@ class ISerializer(ABC):
         """Serialize the data to a string."""
         pass
 
+    @abstractmethod
+    def encode_stream(self, items: Iterable[Tuple[str, Any]]) -> Iterator[str]:
+        """Serialize a stream of key/value pairs into a stream of string chunks."""
+        pass
+
     @abstractmethod
     def decode(self, data: str) -> Dict[str, Any]:
         """Deserialize the string to a dictionary."""
@@ -1,5 +1,8 @@
+from .web_extractors import *
+from .extractor_benchmark import *
 from .web_processor import *
 from .code_processor import *
+from .symbol_index_processor import *
 from .git_commit_processor import *
 from .youtube_processor import *
 from .save_processor import *
@@ -1,11 +1,15 @@
 from spindle.abstracts import AbstractProcessor
-from typing import List, Dict, Any
-import re
+from spindle.utils.comments import strip_comments
+from spindle.utils.mapped_file import MappedFile
+from typing import Iterable, List, Dict, Any, Union
 
 __All__ = ['CodeProcessor']
 
 
 class CodeProcessor(AbstractProcessor):
+    # Bump when the processed output changes, so cached results from older versions are not reused
+    OUTPUT_VERSION = 3
+
     def __init__(self,
                  remove_comments: bool = True,
                  remove_empty_lines: bool = True,
@@ -18,20 +22,39 @@ class CodeProcessor(AbstractProcessor):
         self.min_line_length = min_line_length
         self.max_line_length = max_line_length
 
-    def _preprocess(self, content: Dict[str, str], **kwargs: Any) -> Dict[str, str]:
+    def get_options(self) -> Dict[str, Any]:
+        """
+        Return the options that affect the processed output, e.g. for use as a cache key.
+        """
+        return {
+            'version': self.OUTPUT_VERSION,
+            'remove_comments': self.remove_comments,
+            'remove_empty_lines': self.remove_empty_lines,
+            'trim_lines': self.trim_lines,
+            'min_line_length': self.min_line_length,
+            'max_line_length': self.max_line_length,
+        }
+
+    def _preprocess(self, content: Dict[str, Union[str, MappedFile]], **kwargs: Any) -> Dict[str, Union[str, MappedFile]]:
         """
         Preprocess the code content.
-        In this case, we're not doing any preprocessing before extraction.
+        Comments are removed here, on the whole file, so block comments spanning lines are handled.
+        Memory-mapped files are decoded in full only when comments have to be removed.
         """
-        return content
+        if not self.remove_comments:
+            return content
+        return {file_path: self._remove_comments(text.read_text() if isinstance(text, MappedFile) else text, file_path)
+                for file_path, text in content.items()}
 
-    def _extract_content(self, content: Dict[str, str], **kwargs: Any) -> Dict[str, List[str]]:
+    def _extract_content(self, content: Dict[str, Union[str, MappedFile]], **kwargs: Any) -> Dict[str, Iterable[str]]:
         """
         Extract content by splitting each file's content into lines.
+        Memory-mapped files are iterated line by line instead of being split.
         """
-        return {file_path: content.split('\n') for file_path, content in content.items()}
+        return {file_path: content.iter_lines() if isinstance(content, MappedFile) else content.split('\n')
+                for file_path, content in content.items()}
 
-    def _main_process(self, content: Dict[str, List[str]], **kwargs: Any) -> Dict[str, List[str]]:
+    def _main_process(self, content: Dict[str, Iterable[str]], **kwargs: Any) -> Dict[str, List[str]]:
         """
         Main processing step for the code content.
         """
@@ -42,9 +65,6 @@ class CodeProcessor(AbstractProcessor):
                 if self.trim_lines:
                     line = line.strip()
 
-                if self.remove_comments:
-                    line = self._remove_comments(line)
-
                 if (not self.remove_empty_lines or line) and len(line) >= self.min_line_length:
                     if self.max_line_length and len(line) > self.max_line_length:
                         line = line[:self.max_line_length] + '...'
@@ -61,18 +81,14 @@ class CodeProcessor(AbstractProcessor):
         """
         return content
 
-    def _remove_comments(self, line: str) -> str:
+    @staticmethod
+    def _remove_comments(content: str, file_path: str) -> str:
         """
-        Remove comments from a line of code.
+        Remove comments from a file's content using the comment syntax of its extension.
+        Files with an unknown extension are returned unchanged.
         """
-        # Remove inline comments
-        line = re.sub(r'#.*$', '', line)
-
-        # Remove full-line comments
-        if line.lstrip().startswith('#'):
-            return ''
-
-        return line
+        stripped = strip_comments(content, file_path)
+        return content if stripped is None else stripped
 
     @staticmethod
     def remove_non_ascii(text: str) -> str:
@@ -0,0 +1,227 @@
+import json
+import logging
+import os
+import time
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from spindle.processors.web_extractors import extractor_registry
+
+__all__ = ['ExtractorBenchmark', 'AUTO_METHOD', 'DEFAULT_DOMAIN', 'score_text']
+
+# The extraction method that picks a backend per domain from the benchmark table
+AUTO_METHOD = 'auto'
+# The table row used for domains that were not benchmarked
+DEFAULT_DOMAIN = '*'
+
+# Lines with fewer words are counted as navigation, labels and other boilerplate
+_MIN_PROSE_WORDS = 6
+
+
+def score_text(text: str) -> Dict[str, float]:
+    """
+    Measure the extracted text of a page with simple quality heuristics.
+
+    Args:
+        text (str): The extracted text.
+
+    Returns:
+        Dict[str, float]: The number of characters, the number of characters in prose lines
+                          (lines of at least six words), and the noise ratio, the share of
+                          characters outside prose lines.
+    """
+    lines = [line.strip() for line in text.splitlines()]
+    chars = sum(len(line) for line in lines)
+    prose = sum(len(line) for line in lines if len(line.split()) >= _MIN_PROSE_WORDS)
+    return {'chars': chars, 'prose': prose, 'noise': 1 - prose / chars if chars else 1.0}
+
+
+class ExtractorBenchmark:
+    """
+    A table of extraction backend results per domain, used by the 'auto' extraction method.
+
+    For each domain and backend the table holds the mean extraction time, output length and
+    quality of the benchmarked pages. The quality of a page is the prose it kept relative to the
+    backend that kept the most prose on that page, lowered by the share of boilerplate lines in
+    its output. The chosen backend of a domain is the fastest one whose quality is within
+    QUALITY_TOLERANCE of the best.
+
+    Domains that were not benchmarked use their parent domain, then the '*' row, which
+    aggregates all pages of the corpus.
+
+    Attributes:
+        results (Dict[str, Dict[str, Dict[str, float]]]): The results by domain and backend.
+        choices (Dict[str, str]): The chosen backend by domain.
+    """
+    VERSION = 1
+    QUALITY_TOLERANCE = 0.05
+    # Backends left out unless asked for: they return all text of the page rather than its content
+    NOT_BENCHMARKED_BY_DEFAULT = ('raw', 'raw_bs4')
+
+    def __init__(self, results: Optional[Dict[str, Dict[str, Dict[str, float]]]] = None):
+        """
+        Initialize the table.
+
+        Args:
+            results (Optional[Dict[str, Dict[str, Dict[str, float]]]]): The results by domain and backend.
+        """
+        self.results = results or {}
+        self.choices = {domain: self._choose(rows) for domain, rows in self.results.items()}
+        self.choices = {domain: method for domain, method in self.choices.items() if method}
+
+    @classmethod
+    def load(cls, path: str) -> 'ExtractorBenchmark':
+        """
+        Load a table written by save. A missing or unreadable file gives an empty table.
+
+        Args:
+            path (str): The table file.
+
+        Returns:
+            ExtractorBenchmark: The table.
+        """
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError) as e:
+            logging.getLogger(cls.__name__).warning(f"Ignoring unreadable extractor benchmark {path}: {e}")
+            return cls()
+        if data.get('version') != cls.VERSION:
+            return cls()
+        return cls(data.get('results'))
+
+    def save(self, path: str) -> None:
+        """
+        Write the table as JSON.
+
+        Args:
+            path (str): The table file.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.VERSION, 'created_at': time.time(), 'choices': self.choices,
+                       'results': self.results}, f, indent=2, sort_keys=True)
+
+    def choose(self, url: Optional[str] = None) -> Optional[str]:
+        """
+        Return the backend chosen for the domain of a URL.
+
+        Args:
+            url (Optional[str]): The page URL, or None for the default choice.
+
+        Returns:
+            Optional[str]: The extraction method, or None if the table is empty.
+        """
+        host = (urlsplit(url).hostname or '') if url else ''
+        labels = host.split('.') if host else []
+        # www.example.com, then example.com, but never the top-level domain alone
+        for index in range(max(1, len(labels) - 1) if labels else 0):
+            domain = '.'.join(labels[index:])
+            if domain in self.choices:
+                return self.choices[domain]
+        return self.choices.get(DEFAULT_DOMAIN)
+
+    @classmethod
+    def run(cls, pages: Dict[str, Dict[str, str]], methods: Iterable[str], repeat: int = 1) -> 'ExtractorBenchmark':
+        """
+        Extract every page with every backend and build the table.
+
+        Args:
+            pages (Dict[str, Dict[str, str]]): The page contents by domain and path.
+            methods (Iterable[str]): The extraction methods to compare.
+            repeat (int): Runs per page and backend, the fastest one is kept.
+
+        Returns:
+            ExtractorBenchmark: The table, with a row per domain and a '*' row over all pages.
+        """
+        methods = list(methods)
+        totals: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+        def add(domain: str, method: str, seconds: float, score: Dict[str, float], quality: float, failed: bool) -> None:
+            row = totals.setdefault(domain, {}).setdefault(
+                method, {'pages': 0, 'failures': 0, 'seconds': 0.0, 'chars': 0.0, 'noise': 0.0, 'quality': 0.0})
+            row['pages'] += 1
+            row['failures'] += failed
+            row['seconds'] += seconds
+            row['chars'] += score['chars']
+            row['noise'] += score['noise']
+            row['quality'] += quality
+
+        for domain, domain_pages in pages.items():
+            for content in domain_pages.values():
+                measured = {method: cls._measure(method, content, repeat) for method in methods}
+                best_prose = max((score['prose'] for _, score, _ in measured.values()), default=0)
+                for method, (seconds, score, failed) in measured.items():
+                    quality = score['prose'] / best_prose * (1 - score['noise'] / 2) if best_prose else 0.0
+                    for row_domain in {domain, DEFAULT_DOMAIN}:
+                        add(row_domain, method, seconds, score, quality, failed)
+
+        # Keep means per page, so rows with different page counts compare directly
+        for rows in totals.values():
+            for row in rows.values():
+                for key in ('seconds', 'chars', 'noise', 'quality'):
+                    row[key] = round(row[key] / row['pages'], 6)
+        return cls(totals)
+
+    @staticmethod
+    def _measure(method: str, content: str, repeat: int) -> tuple:
+        extractor = extractor_registry.get(method)
+        best, text, failed = float('inf'), '', False
+        for _ in range(repeat):
+            start = time.perf_counter()
+            try:
+                text = extractor(content) or ''
+            except Exception:
+                text, failed = '', True
+            best = min(best, time.perf_counter() - start)
+        return best, score_text(text), failed
+
+    @classmethod
+    def _choose(cls, rows: Dict[str, Dict[str, float]]) -> Optional[str]:
+        usable = {method: row for method, row in rows.items() if extractor_registry.is_available(method)}
+        if not usable:
+            return None
+        best_quality = max(row['quality'] for row in usable.values())
+        candidates = [method for method, row in usable.items()
+                      if row['quality'] >= best_quality * (1 - cls.QUALITY_TOLERANCE)]
+        return min(candidates, key=lambda method: usable[method]['seconds'])
+
+    @staticmethod
+    def load_corpus(directory: str) -> Dict[str, Dict[str, str]]:
+        """
+        Read a corpus of saved pages. Pages in a subdirectory belong to the domain it is named
+        after, e.g. corpus/docs.python.org/tutorial.html, other pages only count toward the '*' row.
+
+        Args:
+            directory (str): The corpus directory.
+
+        Returns:
+            Dict[str, Dict[str, str]]: The page contents by domain and path.
+        """
+        pages: Dict[str, Dict[str, str]] = {}
+        for root, _, files in os.walk(directory):
+            relative = os.path.relpath(root, directory)
+            domain = DEFAULT_DOMAIN if relative == os.curdir else relative.split(os.sep)[0].lower()
+            for name in sorted(files):
+                if name.endswith(('.html', '.htm')):
+                    path = os.path.join(root, name)
+                    with open(path, encoding='utf-8', errors='replace') as f:
+                        pages.setdefault(domain, {})[path] = f.read()
+        return pages
+
+    def format_rows(self) -> List[str]:
+        """
+        Format the table for display, one line per domain and backend, the chosen backend marked with '*'.
+
+        Returns:
+            List[str]: The lines.
+        """
+        lines = [f"{'domain':<30} {'method':<16} {'pages':>5} {'ms/page':>9} {'chars':>9} {'noise':>6} {'quality':>7}"]
+        for domain in sorted(self.results, key=lambda name: (name == DEFAULT_DOMAIN, name)):
+            for method, row in sorted(self.results[domain].items(), key=lambda item: -item[1]['quality']):
+                marker = '*' if self.choices.get(domain) == method else ' '
+                lines.append(f"{domain:<30} {method:<15}{marker} {row['pages']:>5} {row['seconds'] * 1000:>9.2f} "
+                             f"{row['chars']:>9.0f} {row['noise']:>6.2f} {row['quality']:>7.3f}")
+        return lines
@@ -1,4 +1,4 @@
-from typing import Any, List, Dict, Optional
+from typing import Any, List, Dict, Optional, Sequence
 import re
 from spindle.abstracts import AbstractProcessor
 
@@ -6,10 +6,30 @@ __All__ = ["GitCommitProcessor"]
 
 
 class GitCommitProcessor(AbstractProcessor):
-    def __init__(self, extract_ticket_number: bool = False, max_length: Optional[int] = None, capitalize_first_word: bool = True):
+    """
+    Process git commits into dictionaries holding their message.
+
+    Optional fields add commit metadata to each dictionary:
+        hash: the full commit hash.
+        author: the author as 'Name <email>'.
+        date: the author date in ISO 8601 format.
+        files: the paths changed by the commit.
+        stats: the number of inserted and deleted lines, as 'insertions' and 'deletions'.
+
+    The fields are read from git.Commit objects or from the LogCommit tuples of git_log.iter_log,
+    which only collects the fields its caller asks for (see the fields attribute).
+    """
+    FIELDS = ('hash', 'author', 'date', 'files', 'stats')
+
+    def __init__(self, extract_ticket_number: bool = False, max_length: Optional[int] = None, capitalize_first_word: bool = True,
+                 fields: Sequence[str] = ()):
+        unknown = [field for field in fields if field not in self.FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown commit fields: {', '.join(unknown)}")
         self.extract_ticket_number = extract_ticket_number
         self.max_length = max_length
         self.capitalize_first_word = capitalize_first_word
+        self.fields = tuple(fields)
 
     def _preprocess(self, content: List[Any], **kwargs: Any) -> List[Any]:
         """
@@ -18,16 +38,39 @@ class GitCommitProcessor(AbstractProcessor):
         """
         return content
 
-    def _extract_content(self, commits: List[Any], **kwargs: Any) -> List[str]:
+    def _extract_content(self, commits: List[Any], **kwargs: Any) -> List[Dict[str, Any]]:
+        """
+        Extract the commit messages and the requested fields from the commit objects.
+        """
+        if not self.fields:
+            return [{"message": commit.message.strip()} for commit in commits]
+        return [self._extract_fields(commit) for commit in commits]
+
+    def _extract_fields(self, commit: Any) -> Dict[str, Any]:
         """
-        Extract the commit messages from the commit objects.
+        Extract the message and the requested fields of a commit.
         """
-        return [commit.message.strip() for commit in commits]
+        extracted = {"message": commit.message.strip()}
+        if 'hash' in self.fields:
+            extracted["hash"] = commit.hexsha
+        if 'author' in self.fields:
+            extracted["author"] = f"{commit.author.name} <{commit.author.email}>"
+        if 'date' in self.fields:
+            extracted["date"] = commit.authored_datetime.isoformat()
+        if 'files' in self.fields or 'stats' in self.fields:
+            # Reading git.Commit.stats runs a diff, so it is read once for both fields
+            stats = commit.stats
+            if 'files' in self.fields:
+                extracted["files"] = list(stats.files)
+            if 'stats' in self.fields:
+                extracted["insertions"] = stats.total['insertions']
+                extracted["deletions"] = stats.total['deletions']
+        return extracted
 
-    def _main_process(self, commit_messages: List[str], **kwargs: Any) -> List[Dict[str, Any]]:
+    def _main_process(self, extracted_commits: List[Dict[str, Any]], **kwargs: Any) -> List[Dict[str, Any]]:
         processed_commits = []
-        for message in commit_messages:
-            processed_commit = {"message": message}
+        for processed_commit in extracted_commits:
+            message = processed_commit["message"]
             if self.extract_ticket_number:
                 ticket_number = self._extract_ticket_number(message)
                 if ticket_number:
@@ -0,0 +1,54 @@
+from spindle.abstracts import AbstractProcessor
+from spindle.utils.mapped_file import MappedFile
+from spindle.utils.outline import outline
+from typing import List, Dict, Any, Union
+
+__All__ = ['SymbolIndexProcessor']
+
+
+class SymbolIndexProcessor(AbstractProcessor):
+    """
+    A processor that reduces source files to a compact outline of their classes, functions and signatures.
+
+    Python files are parsed with the ast module and JavaScript/TypeScript files with a lightweight
+    scanner. Files of other languages produce an empty outline, so they are still listed by path.
+    """
+    # Bump when the outline format changes, so cached outlines from older versions are not reused
+    OUTPUT_VERSION = 1
+
+    def get_options(self) -> Dict[str, Any]:
+        """
+        Return the options that affect the processed output, e.g. for use as a cache key.
+        """
+        return {
+            'mode': 'symbols',
+            'version': self.OUTPUT_VERSION,
+        }
+
+    def _preprocess(self, content: Dict[str, Union[str, MappedFile]], **kwargs: Any) -> Dict[str, str]:
+        """
+        Preprocess the code content.
+        The parsers need the whole text, so memory-mapped files are decoded here.
+        """
+        return {file_path: text.read_text() if isinstance(text, MappedFile) else text
+                for file_path, text in content.items()}
+
+    def _extract_content(self, content: Dict[str, str], **kwargs: Any) -> Dict[str, List[str]]:
+        """
+        Extract the outline of each file.
+        """
+        return {file_path: outline(text, file_path) or [] for file_path, text in content.items()}
+
+    def _main_process(self, content: Dict[str, List[str]], **kwargs: Any) -> Dict[str, List[str]]:
+        """
+        Main processing step for the outlines.
+        In this case, we're just returning the extracted outlines as is.
+        """
+        return content
+
+    def _postprocess(self, content: Dict[str, List[str]], **kwargs: Any) -> Dict[str, List[str]]:
+        """
+        Postprocess the outlines.
+        In this case, we're just returning the processed content as is.
+        """
+        return content
@@ -0,0 +1,301 @@
+import importlib.util
+import logging
+import re
+import sys
+import threading
+from typing import Callable, Dict, List, Optional
+
+__all__ = ['ExtractorRegistry', 'extractor_registry', 'EXTRACTOR_ENTRY_POINT_GROUP']
+
+# Third-party packages register extractors under this entry point group, e.g. in setup.cfg:
+#   [options.entry_points]
+#   spindle.web_extractors =
+#       mine = my_package.extractors:create_extractor
+EXTRACTOR_ENTRY_POINT_GROUP = 'spindle.web_extractors'
+
+# An extractor turns raw HTML into text
+Extractor = Callable[[str], str]
+# A factory takes no arguments and creates an extractor
+ExtractorFactory = Callable[[], Extractor]
+
+
+class ExtractorRegistry:
+    """
+    A registry of the content extraction backends of the web processor.
+
+    Each backend is registered by name with a factory that builds its extractor. The extractor
+    is built on first use and then reused for every page. Extraction libraries keep parsing state
+    on their objects, so each thread gets its own instance; worker processes build their own on
+    first use as well, since the registry is module level and never pickled.
+
+    Third-party backends are discovered through the 'spindle.web_extractors' entry point group.
+    The entry points are only read when a name is not registered or all names are listed, so
+    the built-in backends never pay for the scan.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._factories: Dict[str, ExtractorFactory] = {}
+        self._packages: Dict[str, Optional[str]] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._entry_points_loaded = False
+
+    def register(self, name: str, factory: ExtractorFactory, package: Optional[str] = None) -> None:
+        """
+        Register an extraction backend.
+
+        Args:
+            name (str): The extraction method name.
+            factory (ExtractorFactory): A callable without arguments returning the extractor.
+            package (Optional[str]): The top-level package the backend needs, used to check availability.
+        """
+        with self._lock:
+            self._factories[name] = factory
+            self._packages[name] = package
+
+    def get(self, name: str) -> Extractor:
+        """
+        Return the extractor of a backend for the current thread, building it on first use.
+
+        Args:
+            name (str): The extraction method name.
+
+        Returns:
+            Extractor: A callable turning raw HTML into text.
+
+        Raises:
+            ValueError: If no backend is registered under the name.
+        """
+        extractors = getattr(self._local, 'extractors', None)
+        if extractors is None:
+            extractors = self._local.extractors = {}
+
+        extractor = extractors.get(name)
+        if extractor is None:
+            factory = self._factories.get(name)
+            if factory is None:
+                self.load_entry_points()
+                factory = self._factories.get(name)
+            if factory is None:
+                raise ValueError(f"Unknown extraction method: {name}")
+            extractor = extractors[name] = factory()
+        return extractor
+
+    def names(self) -> List[str]:
+        """
+        Return the names of all registered backends, including plugins.
+
+        Returns:
+            List[str]: The extraction method names.
+        """
+        self.load_entry_points()
+        return list(self._factories)
+
+    def is_available(self, name: str) -> bool:
+        """
+        Check whether a backend is registered and its library is installed, without importing it.
+
+        Args:
+            name (str): The extraction method name.
+
+        Returns:
+            bool: True if the method can be used.
+        """
+        if name not in self._factories:
+            self.load_entry_points()
+            if name not in self._factories:
+                return False
+        package = self._packages.get(name)
+        return package is None or importlib.util.find_spec(package) is not None
+
+    def available(self) -> List[str]:
+        """
+        Return the names of the backends that can be used.
+
+        Returns:
+            List[str]: The available extraction method names.
+        """
+        return [name for name in self.names() if self.is_available(name)]
+
+    def package(self, name: str) -> Optional[str]:
+        """
+        Return the top-level package a backend needs.
+
+        Args:
+            name (str): The extraction method name.
+
+        Returns:
+            Optional[str]: The package name, or None if unknown.
+        """
+        return self._packages.get(name)
+
+    def load_entry_points(self) -> None:
+        """
+        Register the backends advertised by installed packages, once per process.
+
+        Plugins do not override built-in backends of the same name. A plugin that fails to load is logged and skipped.
+        """
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+
+        from importlib.metadata import entry_points
+        if sys.version_info >= (3, 10):
+            found = entry_points(group=EXTRACTOR_ENTRY_POINT_GROUP)
+        else:
+            found = entry_points().get(EXTRACTOR_ENTRY_POINT_GROUP, [])
+
+        for entry_point in found:
+            if entry_point.name in self._factories:
+                continue
+            try:
+                factory = entry_point.load()
+            except Exception as e:
+                self.logger.warning(f"Could not load web extractor plugin {entry_point.name!r}: {e}")
+                continue
+            self.register(entry_point.name, factory)
+
+
+def _create_custom_extractor() -> Extractor:
+    """
+    Build the custom extractor, which keeps the article or main content area in a single walk of the lxml tree.
+    """
+    from spindle.utils.html_text import extract_main_text
+    return extract_main_text
+
+
+def _create_raw_extractor() -> Extractor:
+    """
+    Build the raw extractor, which returns all text of the page as parsed by lxml.
+    """
+    from spindle.utils.html_text import extract_all_text
+    return extract_all_text
+
+
+def _create_custom_bs4_extractor() -> Extractor:
+    """
+    Build the BeautifulSoup version of the custom extractor, for pages lxml repairs differently.
+    """
+    from bs4 import BeautifulSoup
+    from spindle.utils.html_text import clean_text
+    content_class = re.compile('article|content|post')
+
+    def extract(raw_content: str) -> str:
+        soup = BeautifulSoup(raw_content, 'html.parser')
+
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+
+        # Try to find the main content area
+        article = soup.find('article') or soup.find('div', class_=content_class)
+
+        if article:
+            text = article.get_text()
+        else:
+            # If no main content area is found, remove common non-content elements
+            for elem in soup(['header', 'nav', 'footer', 'aside']):
+                elem.decompose()
+            text = soup.body.get_text()
+
+        return clean_text(text)
+
+    return extract
+
+
+def _create_raw_bs4_extractor() -> Extractor:
+    """
+    Build the BeautifulSoup version of the raw extractor.
+    """
+    from bs4 import BeautifulSoup
+    return lambda raw_content: BeautifulSoup(raw_content, 'html.parser').get_text()
+
+
+def _create_trafilatura_extractor() -> Extractor:
+    """
+    Build the trafilatura extractor.
+    """
+    import trafilatura
+    return lambda raw_content: trafilatura.extract(raw_content) or ''
+
+
+def _create_readability_extractor() -> Extractor:
+    """
+    Build the readability extractor.
+    """
+    from readability import Document
+    return lambda raw_content: Document(raw_content).summary()
+
+
+def _create_article_parser_extractor() -> Extractor:
+    """
+    Build the article_parser extractor around a single parser.
+    """
+    from article_parser import ArticleParser
+    parser = ArticleParser()
+    return lambda raw_content: parser.parse(raw_content).content
+
+
+def _create_boilerpy3_extractor() -> Extractor:
+    """
+    Build the boilerpy3 extractor around a single article extractor.
+    """
+    from boilerpy3 import extractors
+    return extractors.ArticleExtractor().get_content
+
+
+def _create_html2text_extractor() -> Extractor:
+    """
+    Build the html2text extractor.
+
+    HTML2Text keeps the state of the document it parses (open lists, quoted blocks, skipped
+    script content) on the object, so reusing one across pages could leak an unclosed tag into
+    the next page. It is cheap to create, so a new one is made per page.
+    """
+    import html2text
+
+    def extract(raw_content: str) -> str:
+        h = html2text.HTML2Text()
+        h.ignore_links = True
+        return h.handle(raw_content)
+
+    return extract
+
+
+def _create_newspaper_extractor() -> Extractor:
+    """
+    Build the newspaper extractor.
+    """
+    from newspaper import Article
+
+    def extract(raw_content: str) -> str:
+        article = Article('')
+        article.set_html(raw_content)
+        article.parse()
+        return article.text
+
+    return extract
+
+
+def _create_goose_extractor() -> Extractor:
+    """
+    Build the goose3 extractor around a single Goose instance.
+    """
+    from goose3 import Goose
+    g = Goose()
+    return lambda raw_content: g.extract(raw_html=raw_content).cleaned_text
+
+
+extractor_registry = ExtractorRegistry()
+extractor_registry.register('custom', _create_custom_extractor, 'lxml')
+extractor_registry.register('raw', _create_raw_extractor, 'lxml')
+extractor_registry.register('custom_bs4', _create_custom_bs4_extractor, 'bs4')
+extractor_registry.register('raw_bs4', _create_raw_bs4_extractor, 'bs4')
+extractor_registry.register('traf', _create_trafilatura_extractor, 'trafilatura')
+extractor_registry.register('readability', _create_readability_extractor, 'readability')
+extractor_registry.register('article_parser', _create_article_parser_extractor, 'article_parser')
+extractor_registry.register('boilerpy3', _create_boilerpy3_extractor, 'boilerpy3')
+extractor_registry.register('html2text', _create_html2text_extractor, 'html2text')
+extractor_registry.register('newspaper', _create_newspaper_extractor, 'newspaper')
+extractor_registry.register('goose', _create_goose_extractor, 'goose3')
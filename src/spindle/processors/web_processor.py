@@ -1,7 +1,8 @@
 from spindle.abstracts import AbstractProcessor
-from typing import List, Dict, Any
+from spindle.processors.extractor_benchmark import AUTO_METHOD, ExtractorBenchmark
+from spindle.processors.web_extractors import extractor_registry
+from typing import List, Dict, Any, Optional
 import re
-from bs4 import BeautifulSoup
 
 __all__ = ['WebProcessor']
 
@@ -22,7 +23,26 @@ class WebProcessor(AbstractProcessor):
         max_line_length (int): The maximum length of lines before truncation.
         extract_metadata (bool): Whether to extract metadata from the content.
         available_methods (List[str]): List of available content extraction methods.
+        benchmark (Optional[ExtractorBenchmark]): The table the 'auto' method picks a backend from.
+
+    Extraction backends are looked up in the extractor registry, which imports a library only when
+    its backend is first used and reuses the built extractor across pages. Availability is probed
+    with importlib.util.find_spec, which locates a package without importing it.
+
+    The 'auto' method picks the backend per page from the benchmark table, by the domain of the
+    page URL. Without a table, or for a backend that is not installed, the first available of
+    AUTO_FALLBACK is used.
     """
+    # Bump when the processed output changes, so cached results from older versions are not reused
+    OUTPUT_VERSION = 2
+
+    # The characters of the former pattern http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+
+    # folded into one class: the $-_ range already holds the digits, capitals, '%', '@', '.', '&', '+', '(', ')', '*', ','
+    # and '\', so the matches are the same
+    URL_PATTERN = re.compile(r'https?://[!$-_a-z]+')
+
+    # Backends used by the 'auto' method when the benchmark table has no usable choice
+    AUTO_FALLBACK = ('traf', 'custom', 'custom_bs4')
 
     def __init__(self,
                  extraction_method: str = 'custom',
@@ -31,7 +51,8 @@ class WebProcessor(AbstractProcessor):
                  remove_urls: bool = False,
                  min_line_length: int = 0,
                  max_line_length: int = None,
-                 extract_metadata: bool = False):
+                 extract_metadata: bool = False,
+                 benchmark: Optional[ExtractorBenchmark] = None):
         """
         Initialize the WebProcessor with the specified configuration.
 
@@ -43,6 +64,7 @@ class WebProcessor(AbstractProcessor):
             min_line_length (int): The minimum length of lines to keep.
             max_line_length (int): The maximum length of lines before truncation.
             extract_metadata (bool): Whether to extract metadata from the content.
+            benchmark (Optional[ExtractorBenchmark]): The table the 'auto' method picks a backend from.
         """
 
         self.extraction_method = extraction_method
@@ -52,7 +74,25 @@ class WebProcessor(AbstractProcessor):
         self.min_line_length = min_line_length
         self.max_line_length = max_line_length
         self.extract_metadata = extract_metadata
-        self.available_methods = self._check_dependencies()
+        self.benchmark = benchmark
+
+    def get_options(self, url: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Return the options that affect the processed output, e.g. for use as a cache key.
+
+        Args:
+            url (Optional[str]): The page URL, which decides the backend of the 'auto' method.
+        """
+        return {
+            'version': self.OUTPUT_VERSION,
+            'extraction_method': self.resolve_method(url),
+            'remove_html': self.remove_html,
+            'remove_excess_whitespace': self.remove_excess_whitespace,
+            'remove_urls': self.remove_urls,
+            'min_line_length': self.min_line_length,
+            'max_line_length': self.max_line_length,
+            'extract_metadata': self.extract_metadata,
+        }
 
     def process(self, content: Any, **kwargs: Any) -> Dict[str, Any]:
         """
@@ -62,12 +102,13 @@ class WebProcessor(AbstractProcessor):
 
         Args:
             content (str): The raw HTML content to process.
+            url (str, optional): The page URL, which decides the backend of the 'auto' method.
 
         Returns:
             Dict[str, Any]: A dictionary containing the processed content and optional metadata.
         """
 
-        return super().process(content)
+        return super().process(content, **kwargs)
 
     def _preprocess(self, content: Any, **kwargs: Any) -> str:
         """
@@ -82,7 +123,7 @@ class WebProcessor(AbstractProcessor):
 
         return content
 
-    def _main_process(self, content: str) -> List[str]:
+    def _main_process(self, content: str, **kwargs: Any) -> List[str]:
         """
         Process the extracted content according to the configured settings.
 
@@ -97,23 +138,23 @@ class WebProcessor(AbstractProcessor):
         """
 
         lines = content.split('\n')
-        processed_lines = []
-
-        for line in lines:
-            line = line.strip()
-
-            if self.remove_excess_whitespace:
-                line = re.sub(r'\s+', ' ', line)
-
-            if self.remove_urls:
-                line = self._remove_urls(line)
+        if self.remove_excess_whitespace:
+            # str.split() splits on the same whitespace as \s and drops it at both ends, so this strips
+            # the line and collapses its whitespace runs to a single space in one C-level pass
+            lines = [' '.join(line.split()) for line in lines]
+        else:
+            lines = [line.strip() for line in lines]
 
-            if len(line) >= self.min_line_length:
-                if self.max_line_length and len(line) > self.max_line_length:
-                    line = line[:self.max_line_length] + '...'
-                processed_lines.append(line)
+        if self.remove_urls:
+            # URLs cannot contain whitespace and so never span lines: one substitution over the whole document
+            lines = self.URL_PATTERN.sub('', '\n'.join(lines)).split('\n')
 
-        return processed_lines
+        if self.min_line_length > 0:
+            lines = [line for line in lines if len(line) >= self.min_line_length]
+        if self.max_line_length:
+            limit = self.max_line_length
+            lines = [line[:limit] + '...' if len(line) > limit else line for line in lines]
+        return lines
 
     def _postprocess(self, content: List[str], **kwargs: Any) -> Dict[str, Any]:
         """
@@ -149,222 +190,48 @@ class WebProcessor(AbstractProcessor):
         Raises:
             ValueError: If an unknown extraction method is specified.
         """
-        if self.extraction_method == 'custom':
-            return self._extract_custom(raw_content)
-        elif self.extraction_method == 'raw':
-            return self._extract_raw(raw_content)
-        elif self.extraction_method == 'traf':
-            return self._extract_with_trafilatura(raw_content)
-        elif self.extraction_method == 'readability':
-            return self._extract_with_readability(raw_content)
-        elif self.extraction_method == 'article_parser':
-            return self._extract_with_article_parser(raw_content)
-        elif self.extraction_method == 'boilerpy3':
-            return self._extract_with_boilerpy3(raw_content)
-        elif self.extraction_method == 'html2text':
-            return self._extract_with_html2text(raw_content)
-        elif self.extraction_method == 'newspaper':
-            return self._extract_with_newspaper(raw_content)
-        elif self.extraction_method == 'goose':
-            return self._extract_with_goose(raw_content)
-        else:
-            raise ValueError(f"Unknown extraction method: {self.extraction_method}")
-
-    def _check_dependencies(self) -> List[str]:
-        """
-        Check and return a list of available extraction methods based on installed libraries.
-
-        Returns:
-            List[str]: A list of available extraction methods.
-        """
-        available_methods = ['custom', 'raw']
-        try:
-            import trafilatura
-            available_methods.append('traf')
-        except ImportError:
-            pass
-        try:
-            from readability import Document
-            available_methods.append('readability')
-        except ImportError:
-            pass
-        try:
-            from article_parser import ArticleParser
-            available_methods.append('article_parser')
-        except ImportError:
-            pass
-        try:
-            from boilerpy3 import extractors
-            available_methods.append('boilerpy3')
-        except ImportError:
-            pass
-        try:
-            import html2text
-            available_methods.append('html2text')
-        except ImportError:
-            pass
-        try:
-            import newspaper
-            available_methods.append('newspaper')
-        except ImportError:
-            pass
-        try:
-            from goose3 import Goose
-            available_methods.append('goose')
-        except ImportError:
-            pass
-        return available_methods
-
-    def _extract_custom(self, raw_content: str) -> str:
-        """
-        Custom method to extract text from HTML content.
-
-        This method uses BeautifulSoup to parse the HTML and extract relevant content,
-        focusing on the article or main content area if available.
-
-        Args:
-            raw_content (str): The raw HTML content.
-
-        Returns:
-            str: The extracted and cleaned text.
-        """
-
-        soup = BeautifulSoup(raw_content, 'html.parser')
-
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-
-        # Try to find the main content area
-        article = soup.find('article') or soup.find('div', class_=re.compile('article|content|post'))
-
-        if article:
-            text = article.get_text()
-        else:
-            # If no main content area is found, remove common non-content elements
-            for elem in soup(['header', 'nav', 'footer', 'aside']):
-                elem.decompose()
-            text = soup.body.get_text()
-
-        # Clean up the extracted text
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        return '\n'.join(chunk for chunk in chunks if chunk)
-
-    def _extract_raw(self, raw_content: str) -> str:
-        """
-        Extract raw text from HTML content using BeautifulSoup.
-
-        Args:
-            raw_content (str): The raw HTML content.
-
-        Returns:
-            str: The extracted text.
-        """
-        soup = BeautifulSoup(raw_content, 'html.parser')
-        return soup.get_text()
+        return extractor_registry.get(self.resolve_method(kwargs.get('url')))(raw_content)
 
-    def _extract_with_trafilatura(self, raw_content: str) -> str:
+    def resolve_method(self, url: Optional[str] = None) -> str:
         """
-        Extract text using the trafilatura library.
+        Return the extraction backend used for a page.
 
         Args:
-            raw_content (str): The raw HTML content.
+            url (Optional[str]): The page URL.
 
         Returns:
-            str: The extracted text, or an empty string if extraction fails.
-        """
-        import trafilatura
-        return trafilatura.extract(raw_content) or ''
-
-    def _extract_with_readability(self, raw_content: str) -> str:
+            str: The configured method, or for 'auto' the backend chosen for the domain of the URL.
         """
-        Extract text using the readability library.
+        if self.extraction_method != AUTO_METHOD:
+            return self.extraction_method
 
-        Args:
-            raw_content (str): The raw HTML content.
-
-        Returns:
-            str: The extracted text.
-        """
-        from readability import Document
-        doc = Document(raw_content)
-        return doc.summary()
+        method = self.benchmark.choose(url) if self.benchmark is not None else None
+        if method is not None and extractor_registry.is_available(method):
+            return method
+        return next((method for method in self.AUTO_FALLBACK if extractor_registry.is_available(method)), 'custom')
 
-    def _extract_with_article_parser(self, raw_content: str) -> str:
+    @property
+    def available_methods(self) -> List[str]:
         """
-        Extract text using the article_parser library.
-
-        Args:
-            raw_content (str): The raw HTML content.
-
-        Returns:
-            str: The extracted content.
-        """
-        from article_parser import ArticleParser
-        parser = ArticleParser()
-        article = parser.parse(raw_content)
-        return article.content
-
-    def _extract_with_boilerpy3(self, raw_content: str) -> str:
-        """
-        Extract text using the boilerpy3 library.
-
-        Args:
-            raw_content (str): The raw HTML content.
+        Return the extraction methods whose library is installed, without importing any of them.
 
         Returns:
-            str: The extracted content.
-        """
-        from boilerpy3 import extractors
-        extractor = extractors.ArticleExtractor()
-        return extractor.get_content(raw_content)
-
-    def _extract_with_html2text(self, raw_content: str) -> str:
-        """
-        Extract text using the html2text library.
-
-        Args:
-            raw_content (str): The raw HTML content.
-
-        Returns:
-            str: The extracted text.
-        """
-        import html2text
-        h = html2text.HTML2Text()
-        h.ignore_links = True
-        return h.handle(raw_content)
-
-    def _extract_with_newspaper(self, raw_content: str) -> str:
-        """
-        Extract text using the newspaper library.
-
-        Args:
-            raw_content (str): The raw HTML content.
-
-        Returns:
-            str: The extracted text.
+            List[str]: A list of available extraction methods.
         """
-        from newspaper import Article
-        article = Article('')
-        article.set_html(raw_content)
-        article.parse()
-        return article.text
+        return extractor_registry.available()
 
-    def _extract_with_goose(self, raw_content: str) -> str:
+    @classmethod
+    def is_method_available(cls, method: str) -> bool:
         """
-        Extract text using the goose3 library.
+        Check whether the library of an extraction method is installed, without importing it.
 
         Args:
-            raw_content (str): The raw HTML content.
+            method (str): The extraction method.
 
         Returns:
-            str: The extracted text.
+            bool: True if the method can be used.
         """
-        from goose3 import Goose
-        g = Goose()
-        article = g.extract(raw_html=raw_content)
-        return article.cleaned_text
+        return extractor_registry.is_available(method)
 
     @staticmethod
     def _remove_urls(content: str) -> str:
@@ -378,8 +245,7 @@ class WebProcessor(AbstractProcessor):
             str: The content with URLs removed.
         """
 
-        url_pattern = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
-        return url_pattern.sub('', content)
+        return WebProcessor.URL_PATTERN.sub('', content)
 
     @staticmethod
     def _extract_metadata(content: str) -> Dict[str, Any]:
@@ -1,18 +1,40 @@
 import json
+from collections.abc import Iterator
 from typing import Dict, Any
 from spindle.exceptions import SerializationException
-from spindle.interfaces import ISerializer
+from spindle.abstracts import AbstractSerializer
 
 __All__ = ["JSONSerializer"]
 
-# TODO: Create a abstract class for all serializers
-class JSONSerializer(ISerializer):
+
+class JSONSerializer(AbstractSerializer):
     def encode(self, data: Dict[str, Any]) -> str:
         try:
             return json.dumps(data, indent=2)
         except (TypeError, ValueError) as e:
             raise SerializationException(f"JSON serialization error: {str(e)}")
 
+    def stream_start(self) -> str:
+        return '{'
+
+    def encode_item(self, key: str, value: Any, index: int) -> Iterator:
+        # Mirrors the layout of json.dumps(data, indent=2) so streamed and buffered output are identical
+        try:
+            head = (',\n  ' if index else '\n  ') + json.dumps(key) + ': '
+            if isinstance(value, Iterator):
+                yield head + '['
+                count = 0
+                for count, element in enumerate(value, 1):
+                    yield (',' if count > 1 else '') + '\n    ' + json.dumps(element, indent=2).replace('\n', '\n    ')
+                yield '\n  ]' if count else ']'
+            else:
+                yield head + json.dumps(value, indent=2).replace('\n', '\n  ')
+        except (TypeError, ValueError) as e:
+            raise SerializationException(f"JSON serialization error: {str(e)}")
+
+    def stream_end(self, count: int) -> str:
+        return '\n}' if count else '}'
+
     def decode(self, data: str) -> Dict[str, Any]:
         try:
             return json.loads(data)
@@ -1,12 +1,12 @@
+from collections.abc import Iterator
 from typing import Dict, Any
 from spindle.exceptions import SerializationException
-from spindle.interfaces import ISerializer
+from spindle.abstracts import AbstractSerializer
 
 _All_ = ["PlainTextSerializer"]
 
 
-# TODO: Create a abstract class for all serializers
-class PlainTextSerializer(ISerializer):
+class PlainTextSerializer(AbstractSerializer):
     def encode(self, data: Dict[str, Any]) -> str:
         try:
             return '\n'.join('\n'.join([k] + (v if isinstance(v, list) else [v])) for k, v in data.items())
@@ -14,6 +14,19 @@ class PlainTextSerializer(ISerializer):
         except Exception as e:
             raise SerializationException(f"PlainText serialization error: {str(e)}")
 
+    def encode_item(self, key: str, value: Any, index: int) -> Iterator:
+        try:
+            prefix = '\n' if index else ''
+            if isinstance(value, Iterator):
+                yield prefix + key
+                for element in value:
+                    yield '\n' + element
+            else:
+                yield prefix + '\n'.join([key] + (value if isinstance(value, list) else [value]))
+
+        except Exception as e:
+            raise SerializationException(f"PlainText serialization error: {str(e)}")
+
     def decode(self, data: str) -> Dict[str, Any]:
         try:
             return dict(line.split(": ", 1) for line in data.split("\n") if line)
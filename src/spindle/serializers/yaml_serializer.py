@@ -1,18 +1,25 @@
+from collections.abc import Iterator
 from typing import Any, Dict
 import yaml
 from spindle.exceptions import SerializationException
-from spindle.interfaces import ISerializer
+from spindle.abstracts import AbstractSerializer
 
 __All__ = ["YAMLSerializer"]
 
 
-class YAMLSerializer(ISerializer):
+class YAMLSerializer(AbstractSerializer):
     def encode(self, data: Dict[str, Any]) -> str:
         try:
             return yaml.dump(data, default_flow_style=False)
         except yaml.YAMLError as e:
             raise SerializationException(f"YAML serialization error: {str(e)}")
 
+    def encode_item(self, key: str, value: Any, index: int) -> Iterator:
+        try:
+            yield yaml.dump({key: list(value) if isinstance(value, Iterator) else value}, default_flow_style=False)
+        except yaml.YAMLError as e:
+            raise SerializationException(f"YAML serialization error: {str(e)}")
+
     def decode(self, data: str) -> Dict[str, Any]:
         try:
             return yaml.safe_load(data)
@@ -0,0 +1,109 @@
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+__all__ = ["COMMENT_SYNTAXES", "EXTENSION_SYNTAX", "strip_comments"]
+
+# Comment and string syntax per language family: (line comment markers, block comment pairs, string patterns).
+# Strings are matched so comment markers inside them are left alone.
+_DOUBLE = r'"(?:\\.|[^"\\\n])*"'
+_SINGLE = r"'(?:\\.|[^'\\\n])*'"
+_BACKTICK = r'`(?:\\.|[^`\\])*`'
+_TRIPLE = r'"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\''
+_RAW_BACKTICK = r'`[^`]*`'
+# Shell parameter expansions that contain '#' without starting a comment: $#, ${#var}, ${var#pattern}
+_SHELL_PARAMETER = r'\$#|\$\{[^}\n]*\}'
+# PHP 8 attributes start with '#[' and are not comments
+_PHP_ATTRIBUTE = r'#\['
+# Unquoted CSS URLs, which may contain '//' (protocol-relative) or '/*'
+_CSS_URL = r'url\([^)]*\)'
+# JavaScript regex literals: a '/' in expression position (matched with the token before it, since
+# a lookbehind cannot vary in width) up to an unescaped '/' outside a character class
+_JS_REGEX = (r'(?:^|[(,=:\[!&|?{};]|\b(?:return|typeof|case))\s*'
+             r'/(?![*/])(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\[\n])+/[a-z]*')
+
+# Syntaxes where a line comment only starts at the start of a line or after whitespace, as in 'a#b'
+_WHITESPACE_LINE_COMMENTS = frozenset({'hash', 'shell'})
+
+COMMENT_SYNTAXES: Dict[str, Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...], Tuple[str, ...]]] = {
+    'hash': (('#',), (), (_DOUBLE, _SINGLE)),
+    'shell': (('#',), (), (_SHELL_PARAMETER, _DOUBLE, _SINGLE)),
+    'python': (('#',), (), (_TRIPLE, _DOUBLE, _SINGLE)),
+    'c': (('//',), (('/*', '*/'),), (_DOUBLE, _SINGLE)),
+    'go': (('//',), (('/*', '*/'),), (_DOUBLE, _SINGLE, _RAW_BACKTICK)),
+    'php': (('//', '#'), (('/*', '*/'),), (_PHP_ATTRIBUTE, _DOUBLE, _SINGLE)),
+    'javascript': (('//',), (('/*', '*/'),), (_DOUBLE, _SINGLE, _BACKTICK, _JS_REGEX)),
+    'css': ((), (('/*', '*/'),), (_DOUBLE, _SINGLE, _CSS_URL)),
+    'scss': (('//',), (('/*', '*/'),), (_DOUBLE, _SINGLE, _CSS_URL)),
+    'html': ((), (('<!--', '-->'),), ()),
+    'sql': (('--',), (('/*', '*/'),), (_SINGLE,)),
+    'lua': (('--',), (('--[[', ']]'),), (_DOUBLE, _SINGLE)),
+}
+
+EXTENSION_SYNTAX: Dict[str, str] = {
+    '.py': 'python', '.pyi': 'python', '.pyw': 'python',
+    '.sh': 'shell', '.bash': 'shell', '.zsh': 'shell', '.rb': 'hash', '.pl': 'hash', '.r': 'hash',
+    '.yml': 'hash', '.yaml': 'hash', '.toml': 'hash', '.cfg': 'hash', '.ini': 'hash', '.conf': 'hash',
+    '.js': 'javascript', '.jsx': 'javascript', '.mjs': 'javascript', '.cjs': 'javascript',
+    '.ts': 'javascript', '.tsx': 'javascript',
+    '.c': 'c', '.h': 'c', '.cc': 'c', '.cpp': 'c', '.hpp': 'c', '.cs': 'c', '.java': 'c', '.kt': 'c',
+    '.go': 'go', '.rs': 'c', '.swift': 'c', '.scala': 'c', '.php': 'php', '.dart': 'c',
+    '.css': 'css', '.scss': 'scss', '.less': 'scss',
+    '.html': 'html', '.htm': 'html', '.xml': 'html', '.svg': 'html', '.vue': 'html',
+    '.sql': 'sql', '.lua': 'lua',
+}
+
+
+@lru_cache(maxsize=None)
+def _compile(syntax: str) -> Tuple[re.Pattern, Tuple[str, ...]]:
+    """
+    Compile the scanner for a syntax into a single regex and the markers that can start a comment.
+
+    The regex alternates between string literals (group 'string'), block comments (group 'block')
+    and line comments, so one left-to-right scan with re.sub classifies every token; block
+    comments may span lines.
+    """
+    line_markers, block_pairs, strings = COMMENT_SYNTAXES[syntax]
+    alternatives = []
+    if strings:
+        alternatives.append('(?P<string>' + '|'.join(strings) + ')')
+    # Longer openers first, so e.g. '--[[' wins over '--'
+    if block_pairs:
+        blocks = [re.escape(start) + r'[\s\S]*?' + re.escape(end) for start, end in block_pairs]
+        alternatives.append('(?P<block>' + '|'.join(blocks) + ')')
+    anchor = r'(?:^|(?<=\s))' if syntax in _WHITESPACE_LINE_COMMENTS else ''
+    alternatives.extend(anchor + re.escape(marker) + r'[^\n]*' for marker in line_markers)
+    markers = tuple(start for start, _ in block_pairs) + line_markers
+    return re.compile('|'.join(alternatives), re.MULTILINE), markers
+
+
+def _replace(match: re.Match) -> str:
+    # Keep strings, and keep the line structure of removed block comments
+    if match.lastgroup == 'string':
+        return match.group(0)
+    if match.lastgroup == 'block':
+        # A comment within a line still separates the tokens around it
+        return '\n' * match.group(0).count('\n') or ' '
+    return ''
+
+
+def strip_comments(content: str, file_path: str) -> Optional[str]:
+    """
+    Remove comments from the content of a source file in a single pass.
+
+    Args:
+        content (str): The file content.
+        file_path (str): The file path, used to select the comment syntax by extension.
+
+    Returns:
+        Optional[str]: The content without comments, or None if the extension has no known comment syntax.
+    """
+    syntax = EXTENSION_SYNTAX.get(os.path.splitext(file_path)[1].lower())
+    if syntax is None:
+        return None
+
+    pattern, markers = _compile(syntax)
+    if not any(marker in content for marker in markers):
+        return content
+    return pattern.sub(_replace, content)
@@ -0,0 +1,39 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+__all__ = ["ordered_map"]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def ordered_map(func: Callable[[T], R], items: Iterable[T], jobs: int = 1, window: Optional[int] = None) -> Iterator[R]:
+    """
+    Apply a function to every item using a thread pool, yielding results in input order.
+
+    Only a bounded number of calls are in flight at any time, so the input iterable is
+    consumed lazily and results are released to the caller as soon as they are ready.
+
+    Args:
+        func (Callable[[T], R]): The function to apply to each item.
+        items (Iterable[T]): The items to process.
+        jobs (int): The number of worker threads. A value of 1 or less runs serially on the calling thread.
+        window (Optional[int]): The maximum number of pending calls. Defaults to four per worker.
+
+    Returns:
+        Iterator[R]: The results, in the same order as the input items.
+    """
+    if jobs <= 1:
+        yield from map(func, items)
+        return
+
+    window = window or jobs * 4
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
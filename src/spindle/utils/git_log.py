@@ -0,0 +1,175 @@
+from datetime import datetime
+from typing import Collection, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+from git import Actor, Repo
+from git.util import Stats
+
+__all__ = ["LogCommit", "iter_log"]
+
+# Placeholders of the --format fields, separated by NUL bytes: a message never contains one.
+# The hash comes first and the message last, the optional fields in between.
+_FIELD_FORMATS = {
+    'author': ('%an', '%ae'),
+    'date': ('%aI',),
+}
+# Fields that need the per-file line counts of --numstat
+_NUMSTAT_FIELDS = frozenset({'files', 'stats'})
+_READ_SIZE = 64 * 1024
+
+
+class LogCommit(NamedTuple):
+    """
+    A commit read from the output of git log.
+
+    It carries the attributes of git.Commit that GitCommitProcessor reads, so both can be
+    processed alike. The optional attributes are None unless their field was requested.
+    """
+    hexsha: str
+    message: str
+    author: Optional[Actor] = None
+    authored_datetime: Optional[datetime] = None
+    stats: Optional[Stats] = None
+
+
+def _iter_tokens(stream) -> Iterator[str]:
+    """
+    Split a byte stream on NUL bytes while it is read, decoding each token as UTF-8.
+    """
+    pending = b''
+    while True:
+        chunk = stream.read(_READ_SIZE)
+        if not chunk:
+            break
+        tokens = (pending + chunk).split(b'\0')
+        pending = tokens.pop()
+        for token in tokens:
+            yield token.decode('utf-8', errors='replace')
+    if pending:
+        yield pending.decode('utf-8', errors='replace')
+
+
+def _make_stats(numstat: List[str]) -> Stats:
+    """
+    Build the Stats of a commit from its --numstat lines, counting binary files as 0 lines like GitPython.
+    """
+    total = {'insertions': 0, 'deletions': 0, 'lines': 0, 'files': 0}
+    files = {}
+    for line in numstat:
+        raw_insertions, raw_deletions, path = line.split('\t', 2)
+        insertions = int(raw_insertions) if raw_insertions != '-' else 0
+        deletions = int(raw_deletions) if raw_deletions != '-' else 0
+        files[path] = {'insertions': insertions, 'deletions': deletions, 'lines': insertions + deletions}
+        total['insertions'] += insertions
+        total['deletions'] += deletions
+        total['lines'] += insertions + deletions
+        total['files'] += 1
+    return Stats(total, files)
+
+
+def _first_parent_numstat(repo: Repo, parent: str, hexsha: str) -> List[str]:
+    """
+    Read the --numstat lines of a commit against its first parent, as git log prints them for merges.
+    """
+    output = repo.git.diff('-z', '--numstat', '--no-renames', '--no-ext-diff', parent, hexsha)
+    return [line for line in output.split('\0') if line]
+
+
+def iter_log(source: str, revisions: Sequence[str] = ('HEAD',), paths: Sequence[str] = (), skip: Optional[int] = None,
+             max_count: Optional[int] = None, fields: Collection[str] = (), since: Optional[str] = None,
+             until: Optional[str] = None, author: Sequence[str] = ()) -> Iterator[LogCommit]:
+    """
+    Iterate over the commits of a repository with a single git log process.
+
+    Git writes every commit as NUL-separated fields (-z), and the output is parsed as it is
+    read, so commits are yielded while git is still walking the history and memory use does
+    not grow with its length. Messages are re-encoded to UTF-8 by git. Closing the iterator
+    early stops the git process.
+
+    Optional fields are only requested from git when asked for: 'author' and 'date' add
+    placeholders to the format, 'files' and 'stats' add --numstat, which makes git diff every
+    commit. The diffs match git.Commit.stats: renames are not detected and merges are diffed
+    against their first parent (which needs git 2.31 or later). With paths, --diff-merges would
+    change git's history simplification and so the commits selected, so merges are instead
+    diffed by a separate git diff.
+
+    The filters are options of git's revision walk, so commits are selected by git before
+    they are written out, and skip and max_count count the selected commits only.
+
+    Args:
+        source (str): Path to the git repository.
+        revisions (Sequence[str]): The revisions or ranges to walk, e.g. 'HEAD' or 'v1.0..main'.
+        paths (Sequence[str]): Only yield commits that change one of these paths.
+        skip (Optional[int]): Number of commits to skip before the first one yielded.
+        max_count (Optional[int]): Maximum number of commits yielded.
+        fields (Collection[str]): The optional fields to read: 'author', 'date', 'files' and 'stats'.
+        since (Optional[str]): Only yield commits more recent than this date, in any format git accepts.
+        until (Optional[str]): Only yield commits older than this date.
+        author (Sequence[str]): Only yield commits whose author matches one of these patterns.
+
+    Returns:
+        Iterator[LogCommit]: The commits in git log order, newest first.
+
+    Raises:
+        git.exc.GitCommandError: If git fails, e.g. for an unknown revision.
+    """
+    placeholders = [placeholder for field, formats in _FIELD_FORMATS.items() if field in fields for placeholder in formats]
+    numstat = not _NUMSTAT_FIELDS.isdisjoint(fields)
+    # Merges selected by the paths are diffed separately, so their parents are needed
+    diff_merges_separately = numstat and bool(paths)
+    if diff_merges_separately:
+        placeholders.append('%P')
+
+    args: List[str] = ['-z', f"--format={'%x00'.join(['%H', *placeholders, '%B'])}", '--encoding=UTF-8',
+                       '--no-color', '--no-show-signature']
+    if numstat:
+        args += ['--numstat', '--no-renames', '--no-ext-diff']
+        if paths:
+            # The paths select the commits, the stats still cover all files of a commit
+            args.append('--full-diff')
+        else:
+            args.append('--diff-merges=first-parent')
+    if since:
+        args.append(f'--since={since}')
+    if until:
+        args.append(f'--until={until}')
+    args += [f'--author={pattern}' for pattern in author]
+    if skip:
+        args.append(f'--skip={skip}')
+    if max_count is not None:
+        args.append(f'--max-count={max_count}')
+
+    repo = Repo(source)
+    process = repo.git.log(*args, *revisions, '--', *paths, as_process=True)
+    try:
+        tokens = _iter_tokens(process.stdout)
+        token = next(tokens, None)
+        while token is not None:
+            hexsha = token
+            values: Dict[str, str] = {placeholder: next(tokens, '') for placeholder in placeholders}
+            message = next(tokens, '')
+
+            # The --numstat lines follow the message, the first one after a line break. Unlike
+            # a hash they contain tabs, so the first token without one starts the next commit.
+            token = next(tokens, None)
+            lines = []
+            while token is not None and '\t' in token:
+                lines.append(token.lstrip('\n'))
+                token = next(tokens, None)
+
+            parents = values.get('%P', '').split()
+            if diff_merges_separately and len(parents) > 1:
+                lines = _first_parent_numstat(repo, parents[0], hexsha)
+
+            yield LogCommit(
+                hexsha,
+                message,
+                author=Actor(values['%an'], values['%ae']) if '%an' in values else None,
+                authored_datetime=datetime.fromisoformat(values['%aI']) if '%aI' in values else None,
+                stats=_make_stats(lines) if numstat else None,
+            )
+        # Raises GitCommandError with git's error output on a non-zero exit status
+        process.wait()
+    finally:
+        if process.proc.poll() is None:
+            process.proc.kill()
+            process.proc.wait()
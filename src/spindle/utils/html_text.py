@@ -0,0 +1,160 @@
+import re
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from lxml import etree, html
+
+__all__ = ["extract_main_text", "extract_all_text", "extract_links", "clean_text"]
+
+# Elements whose content is never text
+_SKIP_TAGS = frozenset({'script', 'style'})
+# Elements dropped when the page has no article or content area
+_BOILERPLATE_TAGS = frozenset({'header', 'nav', 'footer', 'aside'})
+_CONTENT_CLASS = re.compile('article|content|post')
+
+_PARSER = html.HTMLParser(encoding='utf-8')
+
+
+def _parse(content: str) -> Optional[etree._Element]:
+    # The text is passed as UTF-8 bytes: lxml rejects str input that carries an XML encoding declaration
+    try:
+        return html.document_fromstring(content.encode('utf-8', errors='replace'), parser=_PARSER)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def clean_text(text: str) -> str:
+    """
+    Strip every line, split it on double spaces and drop the empty pieces.
+
+    Args:
+        text (str): The extracted text.
+
+    Returns:
+        str: One phrase per line.
+    """
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return '\n'.join(chunk for chunk in chunks if chunk)
+
+
+def _collect(root: etree._Element) -> Tuple[List[str], List[bool], Dict[str, Tuple[int, int]]]:
+    """
+    Collect the text of a tree in a single walk, leaving out scripts and styles.
+
+    Returns the text pieces in document order, a flag per piece telling whether it sits in a
+    header, nav, footer or aside element, and the range of pieces covered by the body, the first
+    <article> and the first <div> with an article, content or post class.
+    """
+    texts: List[str] = []
+    boilerplate: List[bool] = []
+    spans: Dict[str, Optional[Tuple[int, int]]] = {}
+    depth = 0
+
+    def walk(element: etree._Element) -> None:
+        nonlocal depth
+        tag = element.tag
+        start = len(texts)
+        # Claim the candidate on the way down, so the first one in document order wins over nested ones
+        area = None
+        if tag in ('article', 'body') or tag == 'div' and _CONTENT_CLASS.search(element.get('class', '')):
+            if tag not in spans:
+                area = tag
+                spans[tag] = None
+        is_boilerplate = tag in _BOILERPLATE_TAGS
+        depth += is_boilerplate
+
+        if element.text:
+            texts.append(element.text)
+            boilerplate.append(depth > 0)
+        for child in element:
+            # Comments and processing instructions have a non-string tag, only their tail is text
+            if isinstance(child.tag, str) and child.tag not in _SKIP_TAGS:
+                walk(child)
+            if child.tail:
+                texts.append(child.tail)
+                boilerplate.append(depth > 0)
+
+        depth -= is_boilerplate
+        if area:
+            spans[area] = (start, len(texts))
+
+    walk(root)
+    return texts, boilerplate, spans
+
+
+def extract_main_text(content: str) -> str:
+    """
+    Extract the text of the main content area of an HTML page.
+
+    The text of the first <article>, or else of the first <div> whose class names an article,
+    content or post area, is returned. Without either, the text of the body is returned without
+    its header, nav, footer and aside elements. Scripts and styles are always left out.
+
+    The tree is walked once: the text is collected in document order together with the range
+    of each candidate area, so the area is chosen afterwards without another traversal.
+
+    Args:
+        content (str): The raw HTML.
+
+    Returns:
+        str: The extracted text, one phrase per line.
+    """
+    root = _parse(content)
+    if root is None:
+        return ''
+
+    texts, boilerplate, spans = _collect(root)
+    area = spans.get('article') or spans.get('div')
+    if area:
+        return clean_text(''.join(texts[area[0]:area[1]]))
+
+    start, end = spans.get('body') or (0, len(texts))
+    return clean_text(''.join(text for text, skip in zip(texts[start:end], boilerplate[start:end]) if not skip))
+
+
+def extract_all_text(content: str) -> str:
+    """
+    Extract all text of an HTML page, leaving out scripts and styles.
+
+    Args:
+        content (str): The raw HTML.
+
+    Returns:
+        str: The concatenated text of the document.
+    """
+    root = _parse(content)
+    return ''.join(_collect(root)[0]) if root is not None else ''
+
+
+def extract_links(content: str, base_url: str) -> List[str]:
+    """
+    Extract the targets of the <a href> links of an HTML page as absolute URLs.
+
+    Relative links are resolved against the page's <base href> if it has one, else against
+    base_url. Fragments are removed, and javascript:, mailto: and other non-HTTP links are left out.
+
+    Args:
+        content (str): The raw HTML.
+        base_url (str): The URL of the page.
+
+    Returns:
+        List[str]: The link targets in document order, without duplicates.
+    """
+    root = _parse(content)
+    if root is None:
+        return []
+
+    base = root.find('.//base[@href]')
+    if base is not None:
+        base_url = urljoin(base_url, base.get('href').strip())
+
+    links = {}
+    for anchor in root.iter('a'):
+        href = anchor.get('href')
+        if not href:
+            continue
+        url = urljoin(base_url, href.strip()).split('#', 1)[0]
+        if url.startswith(('http://', 'https://')):
+            links[url] = None
+    return list(links)
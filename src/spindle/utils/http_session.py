@@ -0,0 +1,93 @@
+import importlib.util
+import threading
+from typing import Any, Dict, Optional, Tuple, Union
+
+import cloudscraper
+from requests import Response
+from urllib3.util.retry import Retry
+
+__all__ = ["HttpSession", "BROTLI_AVAILABLE"]
+
+# urllib3 and cloudscraper only decode brotli responses when one of these packages is installed
+BROTLI_AVAILABLE = any(importlib.util.find_spec(name) is not None for name in ('brotli', 'brotlicffi'))
+
+
+class HttpSession:
+    """
+    A pooled, keep-alive HTTP session shared by the web fetchers of a process.
+
+    Wraps a cloudscraper session, which keeps its TLS setup for sites behind anti-bot checks,
+    and tunes its connection pools so connections to the same host are reused across requests
+    instead of paying the TCP and TLS handshake per page. Every request gets a default timeout
+    and compressed responses are negotiated.
+    """
+
+    _shared: Dict[Tuple[Any, ...], 'HttpSession'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, pool_size: int = 10, timeout: Union[float, Tuple[float, float]] = (10, 30), max_retries: int = 2):
+        """
+        Create the session.
+
+        Args:
+            pool_size (int): The number of connections kept alive per host, and the number of hosts pooled.
+            timeout (Union[float, Tuple[float, float]]): The default timeout in seconds, or a (connect, read) pair.
+            max_retries (int): The number of retries for failed connections and 429/5xx responses of idempotent requests.
+        """
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_retries = max_retries
+
+        self.session = cloudscraper.create_scraper(allow_brotli=BROTLI_AVAILABLE)
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate'
+        self.session.headers['Connection'] = 'keep-alive'
+
+        retries = Retry(total=max_retries, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                        allowed_methods=frozenset({'GET', 'HEAD', 'OPTIONS'}), raise_on_status=False)
+        for adapter in self.session.adapters.values():
+            # Re-initialize the existing adapters, cloudscraper's https adapter carries its own SSL context
+            adapter.max_retries = retries
+            adapter._pool_connections = pool_size
+            adapter._pool_maxsize = pool_size
+            adapter._pool_block = False
+            adapter.init_poolmanager(pool_size, pool_size, block=False)
+
+    @classmethod
+    def get_shared(cls, pool_size: int = 10, timeout: Union[float, Tuple[float, float]] = (10, 30),
+                   max_retries: int = 2) -> 'HttpSession':
+        """
+        Return the process-wide session for the given settings, creating it on first use.
+
+        Args:
+            pool_size (int): The number of connections kept alive per host.
+            timeout (Union[float, Tuple[float, float]]): The default timeout in seconds, or a (connect, read) pair.
+            max_retries (int): The number of retries for failed requests.
+
+        Returns:
+            HttpSession: The shared session.
+        """
+        key = (pool_size, timeout, max_retries)
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(pool_size, timeout, max_retries)
+            return cls._shared[key]
+
+    def get(self, url: str, timeout: Optional[Union[float, Tuple[float, float]]] = None, **kwargs: Any) -> Response:
+        """
+        Send a GET request over the pooled connections.
+
+        Args:
+            url (str): The URL to request.
+            timeout (Optional[Union[float, Tuple[float, float]]]): Overrides the default timeout.
+            **kwargs: Further arguments passed to requests.
+
+        Returns:
+            Response: The response.
+        """
+        return self.session.get(url, timeout=timeout if timeout is not None else self.timeout, **kwargs)
+
+    def close(self) -> None:
+        """
+        Close all pooled connections.
+        """
+        self.session.close()
@@ -0,0 +1,159 @@
+import re
+from typing import Iterable, List, Optional, Tuple
+
+__all__ = ["IgnoreRules"]
+
+
+class IgnoreRules:
+    """
+    Compiled gitignore-style rules read from a single ignore file.
+
+    Paths are matched relative to the directory that contains the ignore file, using '/'
+    as separator. Supported syntax: comments, negation with '!', directory-only patterns
+    with a trailing '/', anchoring with a leading or inner '/', '*', '?', character classes
+    and '**' in leading, inner and trailing position.
+
+    When a file has no negated patterns, all patterns are folded into a single regex so a
+    lookup is one regex match.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Compile the given patterns.
+
+        Args:
+            patterns (Iterable[str]): The lines of an ignore file.
+        """
+        self.rules: List[Tuple[re.Pattern, bool, bool]] = []
+        for line in patterns:
+            rule = self._compile(line)
+            if rule:
+                self.rules.append(rule)
+
+        self.has_negation = any(negated for _, negated, _ in self.rules)
+        self._combined_dir = self._combine(pattern for pattern, _, _ in self.rules)
+        self._combined_file = self._combine(pattern for pattern, _, dir_only in self.rules if not dir_only)
+
+    @classmethod
+    def from_file(cls, path: str) -> Optional['IgnoreRules']:
+        """
+        Load rules from an ignore file.
+
+        Args:
+            path (str): The path of the ignore file.
+
+        Returns:
+            Optional[IgnoreRules]: The compiled rules, or None if the file does not exist or has no rules.
+        """
+        try:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                rules = cls(f.read().splitlines())
+        except OSError:
+            return None
+        return rules if rules.rules else None
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """
+        Match a path against the rules.
+
+        Args:
+            rel_path (str): The path relative to the ignore file's directory.
+            is_dir (bool): Whether the path is a directory.
+
+        Returns:
+            Optional[bool]: True if the path is ignored, False if it is explicitly re-included,
+                            None if no rule matches.
+        """
+        if not self.has_negation:
+            combined = self._combined_dir if is_dir else self._combined_file
+            return True if combined is not None and combined.match(rel_path) else None
+
+        for pattern, negated, dir_only in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if pattern.match(rel_path):
+                return not negated
+        return None
+
+    @staticmethod
+    def _combine(patterns: Iterable[re.Pattern]) -> Optional[re.Pattern]:
+        sources = [pattern.pattern for pattern in patterns]
+        return re.compile('|'.join(f'(?:{source})' for source in sources)) if sources else None
+
+    @classmethod
+    def _compile(cls, line: str) -> Optional[Tuple[re.Pattern, bool, bool]]:
+        """
+        Compile a single ignore file line into a (regex, negated, dir_only) rule.
+        """
+        line = line.rstrip('\n')
+        if not line.endswith('\\ '):
+            line = line.rstrip()
+        if not line or line.startswith('#'):
+            return None
+
+        negated = line.startswith('!')
+        if negated:
+            line = line[1:]
+        elif line.startswith('\\'):
+            line = line[1:]
+
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            return None
+
+        anchored = '/' in line
+        line = line.lstrip('/')
+
+        parts = line.split('/')
+        regex = ''
+        for index, part in enumerate(parts):
+            last = index == len(parts) - 1
+            if part == '**':
+                regex += '.*' if last else '(?:.*/)?'
+                continue
+            regex += cls._translate_segment(part)
+            if not last:
+                regex += '/'
+
+        prefix = '' if anchored else '(?:.*/)?'
+        return re.compile(f'{prefix}{regex}$'), negated, dir_only
+
+    @staticmethod
+    def _translate_segment(segment: str) -> str:
+        """
+        Translate a single path segment glob into a regex fragment that never matches '/'.
+        """
+        result = []
+        index, length = 0, len(segment)
+        while index < length:
+            char = segment[index]
+            index += 1
+            if char == '*':
+                while index < length and segment[index] == '*':
+                    index += 1
+                result.append('[^/]*')
+            elif char == '?':
+                result.append('[^/]')
+            elif char == '\\' and index < length:
+                result.append(re.escape(segment[index]))
+                index += 1
+            elif char == '[':
+                end = index
+                if end < length and segment[end] in '!^':
+                    end += 1
+                if end < length and segment[end] == ']':
+                    end += 1
+                while end < length and segment[end] != ']':
+                    end += 1
+                if end >= length:
+                    result.append('\\[')
+                    continue
+                body = segment[index:end].replace('\\', '\\\\')
+                if body[:1] in ('!', '^'):
+                    body = '^' + body[1:]
+                result.append(f'(?!/)[{body}]')
+                index = end + 1
+            else:
+                result.append(re.escape(char))
+        return ''.join(result)
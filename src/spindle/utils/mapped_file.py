@@ -0,0 +1,91 @@
+import mmap
+from typing import Iterator
+
+__all__ = ["MappedFile"]
+
+
+class MappedFile:
+    """
+    A read-only memory map of a UTF-8 text file.
+
+    Lines are decoded straight from the mapped buffer block by block, so a large file is
+    never held in memory as a whole string or list of lines. Line breaks follow the universal
+    newline handling of open() in text mode, so iter_lines() yields the same lines as
+    reading the file and splitting the content on '\\n'.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, file_path: str):
+        """
+        Map the file into memory.
+
+        Args:
+            file_path (str): The path of the file to map. The file must not be empty.
+        """
+        self.file_path = file_path
+        with open(file_path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Iterate over the lines of the file.
+
+        The buffer is decoded in blocks of about CHUNK_SIZE bytes that end on a line break, so
+        memory use stays bounded by the block size rather than the file size.
+
+        Returns:
+            Iterator[str]: The decoded lines, without line breaks. Undecodable bytes are ignored.
+        """
+        buffer = self._mmap
+        view = memoryview(buffer)
+        size = len(buffer)
+        start = 0
+        try:
+            while True:
+                stop = min(start + self.CHUNK_SIZE, size)
+                if stop < size:
+                    newline = buffer.rfind(b'\n', start, stop)
+                    if newline == -1:
+                        newline = buffer.find(b'\n', stop)
+                    stop = size if newline == -1 else newline + 1
+
+                text = str(view[start:stop], 'utf-8', 'ignore')
+                if '\r' in text:
+                    text = text.replace('\r\n', '\n').replace('\r', '\n')
+                lines = text.split('\n')
+
+                if stop == size:
+                    yield from lines
+                    return
+                # The block ends on a line break, the empty string after it is not a line
+                lines.pop()
+                yield from lines
+                start = stop
+        finally:
+            view.release()
+
+    def read_text(self) -> str:
+        """
+        Decode the whole file, with the same newline handling as iter_lines().
+
+        Returns:
+            str: The file content.
+        """
+        return '\n'.join(self.iter_lines())
+
+    def close(self) -> None:
+        """
+        Unmap the file.
+        """
+        try:
+            self._mmap.close()
+        except BufferError:
+            # A line iterator that was not exhausted still holds a view, the map is released with it
+            pass
+
+    def __enter__(self) -> 'MappedFile':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,163 @@
+import ast
+import os
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+__all__ = ["OUTLINE_EXTENSIONS", "outline", "outline_python", "outline_javascript"]
+
+INDENT = '    '
+
+
+def _python_signature(node: ast.AST) -> str:
+    if isinstance(node, ast.ClassDef):
+        bases = [ast.unparse(base) for base in node.bases] + [ast.unparse(keyword) for keyword in node.keywords]
+        return f"class {node.name}({', '.join(bases)})" if bases else f"class {node.name}"
+
+    prefix = 'async def' if isinstance(node, ast.AsyncFunctionDef) else 'def'
+    returns = f" -> {ast.unparse(node.returns)}" if node.returns is not None else ''
+    return f"{prefix} {node.name}({ast.unparse(node.args)}){returns}"
+
+
+def _python_members(body: List[ast.stmt], depth: int, lines: List[str]) -> None:
+    for node in body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            lines.append(INDENT * depth + _python_signature(node))
+        elif isinstance(node, ast.ClassDef):
+            lines.append(INDENT * depth + _python_signature(node))
+            _python_members(node.body, depth + 1, lines)
+
+
+def outline_python(content: str) -> List[str]:
+    """
+    Build the outline of a Python module: its docstring summary, classes and function signatures.
+
+    Nested classes and methods are indented below their class, function bodies are not descended into.
+
+    Args:
+        content (str): The module source.
+
+    Returns:
+        List[str]: The outline lines. Empty if the source does not parse.
+    """
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return []
+
+    lines = []
+    docstring = ast.get_docstring(tree)
+    if docstring:
+        lines.append(f'"""{docstring.strip().splitlines()[0]}"""')
+    _python_members(tree.body, 0, lines)
+    return lines
+
+
+# Literals are blanked before scanning, so braces and keywords inside them do not count
+_JS_LITERALS = re.compile(r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|`(?:\\.|[^`\\])*`'
+                          r'|/\*[\s\S]*?\*/|//[^\n]*')
+_JS_CLASS = re.compile(r'^(?:export\s+(?:default\s+)?)?(?:abstract\s+)?class\s+([\w$]+)([^{]*)')
+_JS_FUNCTION = re.compile(r'^(?:export\s+(?:default\s+)?)?(?:async\s+)?function\s*\*?\s*([\w$]+)\s*(\([^)]*\)?)')
+_JS_ARROW = re.compile(r'^(?:export\s+)?(?:const|let|var)\s+([\w$]+)\s*(?::[^=]+)?=\s*(async\s+)?'
+                       r'(?:function\b\s*\*?\s*[\w$]*\s*(\([^)]*\)?)|(\([^)]*\)?|[\w$]+)\s*(?::[^=]+)?=>)')
+_JS_METHOD = re.compile(r'^((?:(?:public|private|protected|static|readonly|async|get|set|override)\s+)*)\*?\s*'
+                        r'(#?[\w$]+)\s*(\([^)]*\)?)\s*(?::[^{]*)?(?:\{.*)?$')
+_JS_KEYWORDS = {'if', 'for', 'while', 'switch', 'catch', 'return', 'function', 'else', 'do', 'try', 'with', 'new'}
+
+
+def _blank_literal(match: re.Match) -> str:
+    text = match.group(0)
+    if text.startswith(('/*', '//')):
+        return '\n' * text.count('\n')
+    return text[0] + '\n' * text.count('\n') + text[-1]
+
+
+def _close_params(params: str) -> str:
+    return params if params.endswith(')') else params + '...)'
+
+
+def outline_javascript(content: str) -> List[str]:
+    """
+    Build the outline of a JavaScript or TypeScript module with a lightweight line scanner.
+
+    Recognizes classes and their methods, function declarations and functions assigned to
+    const/let/var. Function and method bodies are skipped. Braces are counted after
+    strings and comments are blanked, which is enough to track class bodies in typical code.
+
+    Args:
+        content (str): The module source.
+
+    Returns:
+        List[str]: The outline lines.
+    """
+    lines = []
+    classes: List[Tuple[str, int]] = []
+    body_depth: Optional[int] = None
+    parens = 0
+    depth = 0
+
+    for line in _JS_LITERALS.sub(_blank_literal, content).split('\n'):
+        stripped = line.strip()
+        # Skip the rest of a multi-line parameter list, then the body of the last declaration
+        if parens > 0 or (body_depth is not None and depth > body_depth):
+            parens = max(0, parens + line.count('(') - line.count(')'))
+            depth += line.count('{') - line.count('}')
+            continue
+        body_depth = None
+
+        while classes and depth <= classes[-1][1]:
+            classes.pop()
+        indent = INDENT * len(classes)
+        in_class_body = bool(classes) and depth == classes[-1][1] + 1
+
+        match = _JS_CLASS.match(stripped)
+        if match:
+            heritage = ' '.join(match.group(2).split())
+            lines.append(f"{indent}class {match.group(1)}{' ' + heritage if heritage else ''}")
+            classes.append((match.group(1), depth))
+        elif in_class_body:
+            match = _JS_METHOD.match(stripped)
+            if match and match.group(2) not in _JS_KEYWORDS:
+                lines.append(f"{indent}{match.group(1)}{match.group(2)}{_close_params(match.group(3))}")
+                body_depth = depth
+        else:
+            match = _JS_FUNCTION.match(stripped)
+            if match:
+                params = _close_params(match.group(2) or '()')
+                is_async = 'async' in stripped.split('function')[0]
+                lines.append(f"{indent}{'async ' if is_async else ''}function {match.group(1)}{params}")
+                body_depth = depth
+            else:
+                match = _JS_ARROW.match(stripped)
+                if match:
+                    params = match.group(3) or match.group(4)
+                    params = _close_params(params) if params.startswith('(') else f"({params})"
+                    lines.append(f"{indent}{'async ' if match.group(2) else ''}{match.group(1)}{params}")
+                    body_depth = depth
+
+        if body_depth is not None:
+            parens = max(0, line.count('(') - line.count(')'))
+        depth += line.count('{') - line.count('}')
+
+    return lines
+
+
+OUTLINE_EXTENSIONS: Dict[str, Callable[[str], List[str]]] = {
+    '.py': outline_python, '.pyi': outline_python, '.pyw': outline_python,
+    '.js': outline_javascript, '.jsx': outline_javascript, '.mjs': outline_javascript, '.cjs': outline_javascript,
+    '.ts': outline_javascript, '.tsx': outline_javascript,
+}
+
+
+def outline(content: str, file_path: str) -> Optional[List[str]]:
+    """
+    Build the symbol outline of a source file.
+
+    Args:
+        content (str): The file content.
+        file_path (str): The file path, used to select the parser by extension.
+
+    Returns:
+        Optional[List[str]]: The outline lines, or None if there is no parser for the extension.
+    """
+    parser = OUTLINE_EXTENSIONS.get(os.path.splitext(file_path)[1].lower())
+    return parser(content) if parser else None
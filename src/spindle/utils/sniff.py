@@ -0,0 +1,60 @@
+import math
+from collections import Counter
+from typing import Optional
+
+__all__ = ["SNIFF_BLOCK_SIZE", "sniff_file", "sniff_block"]
+
+SNIFF_BLOCK_SIZE = 8192
+
+# Bytes that do not occur in text files, besides the usual whitespace control characters.
+_TEXT_CONTROL = {0x08, 0x09, 0x0A, 0x0C, 0x0D, 0x1B}
+_CONTROL_RATIO = 0.3
+# Compressed or encrypted data is close to 8 bits per byte, UTF-8 text stays well below.
+_MAX_ENTROPY = 7.2
+# A full block without a line break is a minified or generated file.
+_MIN_BLOCK_FOR_LINES = 4096
+
+
+def sniff_block(block: bytes) -> Optional[str]:
+    """
+    Classify the first block of a file.
+
+    Args:
+        block (bytes): The first bytes of the file.
+
+    Returns:
+        Optional[str]: 'binary' or 'minified' if the file should be skipped, None if it looks like source text.
+    """
+    if not block:
+        return None
+    if b'\x00' in block:
+        return 'binary'
+
+    counts = Counter(block)
+    control = sum(count for byte, count in counts.items() if byte < 0x20 and byte not in _TEXT_CONTROL)
+    if control / len(block) > _CONTROL_RATIO:
+        return 'binary'
+
+    length = len(block)
+    entropy = -sum(count / length * math.log2(count / length) for count in counts.values())
+    if entropy > _MAX_ENTROPY:
+        return 'binary'
+
+    if length >= _MIN_BLOCK_FOR_LINES and b'\n' not in block:
+        return 'minified'
+    return None
+
+
+def sniff_file(file_path: str, block_size: int = SNIFF_BLOCK_SIZE) -> Optional[str]:
+    """
+    Read the first block of a file and classify it, without loading the rest of the file.
+
+    Args:
+        file_path (str): The path of the file.
+        block_size (int): The number of bytes to inspect.
+
+    Returns:
+        Optional[str]: 'binary' or 'minified' if the file should be skipped, None if it looks like source text.
+    """
+    with open(file_path, 'rb') as f:
+        return sniff_block(f.read(block_size))
@@ -0,0 +1,39 @@
+import math
+from functools import lru_cache
+from typing import Any, Optional
+
+__all__ = ["CHARS_PER_TOKEN", "estimate_tokens"]
+
+# Conservative fallback ratio: source code tokenizes denser than prose, so
+# overestimating keeps a packed output within the target window.
+CHARS_PER_TOKEN = 3
+
+
+@lru_cache(maxsize=None)
+def _get_encoding() -> Optional[Any]:
+    """
+    Load the tiktoken encoding if tiktoken is installed and its encoding data is available.
+    """
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of model tokens in a text.
+
+    Uses tiktoken when it is installed, otherwise a character based estimate.
+
+    Args:
+        text (str): The text to measure.
+
+    Returns:
+        int: The estimated number of tokens.
+    """
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return math.ceil(len(text) / CHARS_PER_TOKEN)